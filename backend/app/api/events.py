@@ -1,6 +1,6 @@
 """Event ingestion endpoints"""
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import BaseModel, Field, ValidationError
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 from sqlalchemy.orm import Session
@@ -163,6 +163,69 @@ async def ingest_events_batch(
         )
 
 
+@router.post("/ingest/stream", response_model=BatchIngestResponse)
+async def ingest_events_stream(
+    request: Request,
+    tenant: Tenant = Depends(get_current_tenant),
+    project: Project = Depends(get_current_project)
+):
+    """
+    Ingest an unbounded stream of LLM events as NDJSON (one event per line)
+
+    The body is parsed as it arrives, so large backfills are not limited to
+    100 events and never need to be held in memory at once. Events are
+    queued line by line; if a line is invalid, the events before it stay
+    queued and the response reports the failing line.
+    """
+    event_ids = []
+    buffer = b""
+    line_no = 0
+
+    async def queue_line(line: bytes):
+        nonlocal line_no
+        line_no += 1
+        if not line.strip():
+            return
+        try:
+            event = EventRequest.model_validate_json(line)
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Invalid event on line {line_no} "
+                       f"({len(event_ids)} events queued): {e.errors()}"
+            )
+
+        event_data = event.model_dump(exclude_unset=True)
+        event_data["tenant_id"] = str(tenant.id)
+        event_data["project_id"] = str(project.id)
+        if event_data.get("tokens_total") is None:
+            event_data["tokens_total"] = event.tokens_prompt + event.tokens_completion
+
+        event_ids.append(await EventService.queue_event(event_data))
+
+    try:
+        async for chunk in request.stream():
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                await queue_line(line)
+        await queue_line(buffer)
+
+        return BatchIngestResponse(
+            status="accepted",
+            count=len(event_ids),
+            event_ids=event_ids
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to queue events: {str(e)}"
+        )
+
+
 @router.get("/recent")
 async def get_recent_events(
     limit: int = 100,
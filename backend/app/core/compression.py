@@ -0,0 +1,121 @@
+"""Request body decompression"""
+import json
+import zlib
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Refuse to inflate request bodies beyond this size (decompression bombs).
+# Also caps the compressed body, which is buffered before decoding.
+MAX_DECOMPRESSED_BYTES = 10 * 1024 * 1024
+
+
+class RequestDecompressionMiddleware:
+    """
+    ASGI middleware that decodes `Content-Encoding: gzip|zstd` request bodies
+
+    The SDK compresses large `ingest_batch` payloads; route handlers keep
+    seeing plain JSON. Unsupported encodings are rejected with 415 and
+    oversized bodies with 413.
+    """
+
+    def __init__(self, app, max_size: int = MAX_DECOMPRESSED_BYTES):
+        self.app = app
+        self.max_size = max_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        encoding = headers.get(b"content-encoding", b"").decode("latin-1").strip().lower()
+        if not encoding or encoding == "identity":
+            await self.app(scope, receive, send)
+            return
+
+        if encoding not in ("gzip", "zstd") or (encoding == "zstd" and zstandard is None):
+            await self._reject(send, 415, f"Unsupported Content-Encoding: {encoding}")
+            return
+
+        chunks = []
+        received = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunk = message.get("body", b"")
+            received += len(chunk)
+            if received > self.max_size:
+                await self._reject(send, 413, "Request body too large")
+                return
+            chunks.append(chunk)
+            more_body = message.get("more_body", False)
+        body = b"".join(chunks)
+
+        try:
+            body = self._decompress(body, encoding)
+        except ValueError as e:
+            await self._reject(send, 413, str(e))
+            return
+        except Exception:
+            await self._reject(send, 400, f"Malformed {encoding} request body")
+            return
+
+        scope = dict(scope)
+        scope["headers"] = [
+            (k, v) for k, v in scope["headers"]
+            if k not in (b"content-encoding", b"content-length")
+        ] + [(b"content-length", str(len(body)).encode("latin-1"))]
+
+        sent = False
+
+        async def receive_decompressed():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await self.app(scope, receive_decompressed, send)
+
+    def _decompress(self, body: bytes, encoding: str) -> bytes:
+        """
+        Decode a complete request body
+
+        Raises:
+            ValueError: If the decoded body would exceed `max_size`
+            Exception: If the body is malformed or truncated
+        """
+        too_large = ValueError("Decompressed request body too large")
+
+        if encoding == "gzip":
+            decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+            data = decompressor.decompress(body, self.max_size + 1)
+            if len(data) > self.max_size:
+                raise too_large
+            if not decompressor.eof:
+                raise zlib.error("truncated gzip stream")
+            return data
+
+        # The SDK declares the content size in the frame header, so oversized
+        # bodies are refused before anything is allocated. Frames without a
+        # declared size are decoded into at most `max_size` bytes; overrunning
+        # that is indistinguishable from truncation and rejected as malformed.
+        if zstandard.frame_content_size(body) > self.max_size:
+            raise too_large
+        # Raises ZstdError unless the whole frame was decoded
+        return zstandard.ZstdDecompressor().decompress(body, max_output_size=self.max_size)
+
+    async def _reject(self, send, status: int, detail: str):
+        payload = json.dumps({"detail": detail}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(payload)).encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": payload})
@@ -0,0 +1,92 @@
+"""Protocol Buffers request decoding"""
+import json
+
+try:
+    from google.protobuf.json_format import MessageToDict
+    from ..proto import events_pb2
+except ImportError:
+    events_pb2 = None
+
+PROTOBUF_CONTENT_TYPE = "application/x-protobuf"
+
+# Routes that accept a protobuf BatchIngestRequest body
+PROTOBUF_PATHS = ("/api/v1/events/ingest/batch",)
+
+
+class ProtobufRequestMiddleware:
+    """
+    ASGI middleware that accepts `Content-Type: application/x-protobuf`
+    batch ingest bodies
+
+    The body is decoded into the same JSON shape the route already
+    validates, so handlers and validation stay unchanged. Answers 415 when
+    protobuf support is unavailable, which tells the SDK to fall back to
+    JSON.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] not in PROTOBUF_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        content_type = headers.get(b"content-type", b"").decode("latin-1").split(";")[0].strip()
+        if content_type != PROTOBUF_CONTENT_TYPE:
+            await self.app(scope, receive, send)
+            return
+
+        if events_pb2 is None:
+            await self._reject(send, 415, "Protobuf request bodies are not supported")
+            return
+
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        try:
+            batch = events_pb2.BatchIngestRequest.FromString(body)
+        except Exception:
+            await self._reject(send, 400, "Malformed protobuf request body")
+            return
+
+        body = json.dumps(
+            MessageToDict(batch, preserving_proto_field_name=True)
+        ).encode("utf-8")
+
+        scope = dict(scope)
+        scope["headers"] = [
+            (k, v) for k, v in scope["headers"]
+            if k not in (b"content-type", b"content-length")
+        ] + [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ]
+
+        sent = False
+
+        async def receive_json():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await self.app(scope, receive_json, send)
+
+    async def _reject(self, send, status: int, detail: str):
+        payload = json.dumps({"detail": detail}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(payload)).encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": payload})
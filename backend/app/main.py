@@ -11,6 +11,8 @@ import os
 from anthropic import Anthropic
 
 from .config import settings
+from .core.compression import RequestDecompressionMiddleware
+from .core.protobuf import ProtobufRequestMiddleware
 from .db.base import engine, SessionLocal
 from .db.models import Tenant, Project, LLMEvent
 from .api import events, analytics, alerts, auth, websocket
@@ -65,6 +67,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Accept protobuf batch bodies (runs after decompression below)
+app.add_middleware(ProtobufRequestMiddleware)
+
+# Decode gzip/zstd request bodies sent by the SDK for large batches
+app.add_middleware(RequestDecompressionMiddleware)
+
 # Register routers with /api/v1 prefix
 app.include_router(events.router, prefix="/api/v1")
 app.include_router(analytics.router, prefix="/api/v1")
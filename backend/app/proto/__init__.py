@@ -0,0 +1 @@
+"""Generated Protocol Buffers bindings (source: events.proto, a copy of the SDK schema)"""
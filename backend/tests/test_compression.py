@@ -0,0 +1,82 @@
+"""Test request body decompression"""
+import gzip
+import json
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.core.compression import RequestDecompressionMiddleware
+
+zstandard = pytest.importorskip("zstandard")
+
+MAX_SIZE = 1024
+PAYLOAD = {"events": [{"model": "gpt-4", "provider": "openai"}] * 5}
+ENCODINGS = [
+    (gzip.compress, "gzip"),
+    (lambda data: zstandard.ZstdCompressor().compress(data), "zstd"),
+]
+
+
+@pytest.fixture
+def client():
+    """Echo app behind the middleware, with a small size limit"""
+    app = FastAPI()
+    app.add_middleware(RequestDecompressionMiddleware, max_size=MAX_SIZE)
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        return await request.json()
+
+    return TestClient(app)
+
+
+def post(client, body: bytes, encoding: str):
+    return client.post(
+        "/echo",
+        content=body,
+        headers={"Content-Type": "application/json", "Content-Encoding": encoding},
+    )
+
+
+@pytest.mark.parametrize("compress, encoding", ENCODINGS)
+def test_compressed_body_is_decoded(client, compress, encoding):
+    """Test gzip and zstd bodies reach the route as plain JSON"""
+    response = post(client, compress(json.dumps(PAYLOAD).encode()), encoding)
+
+    assert response.status_code == 200
+    assert response.json() == PAYLOAD
+
+
+@pytest.mark.parametrize("compress, encoding", ENCODINGS)
+def test_oversized_body_is_rejected(client, compress, encoding):
+    """Test bodies inflating past the limit get 413"""
+    response = post(client, compress(b"x" * (MAX_SIZE + 1)), encoding)
+
+    assert response.status_code == 413
+    assert response.json() == {"detail": "Decompressed request body too large"}
+
+
+def test_oversized_compressed_body_is_rejected(client):
+    """Test the compressed body itself is capped before decoding"""
+    response = post(client, b"\0" * (MAX_SIZE + 1), "gzip")
+
+    assert response.status_code == 413
+
+
+@pytest.mark.parametrize("compress, encoding", ENCODINGS)
+def test_truncated_body_is_rejected(client, compress, encoding):
+    """Test a cut-off stream is not passed on as a partial body"""
+    body = compress(json.dumps(PAYLOAD).encode())
+
+    response = post(client, body[:-4], encoding)
+
+    assert response.status_code == 400
+
+
+def test_unsupported_encoding(client):
+    """Test unknown encodings get 415 with a valid JSON error body"""
+    response = post(client, b"{}", 'br"')
+
+    assert response.status_code == 415
+    assert response.json() == {"detail": 'Unsupported Content-Encoding: br"'}
@@ -1,48 +1,113 @@
 #!/usr/bin/env python3
 """Load testing script for LLMScope"""
 
+import array
 import asyncio
 import aiohttp
+import msgspec
+import numpy as np
 import time
-import random
 from datetime import datetime
 from typing import List
+from yarl import URL
 
 API_URL = "http://localhost:8000"
 API_KEY = "test-api-key"
 NUM_REQUESTS = 10000
 CONCURRENT_REQUESTS = 100
 
+# Built once so aiohttp skips URL parsing and header dict allocation per request
+INGEST_URL = URL(f"{API_URL}/events/ingest")
+HEADERS = {"X-API-Key": API_KEY, "Content-Type": "application/json"}
+
 MODELS = ["gpt-4", "gpt-3.5-turbo", "claude-3-opus", "claude-3-sonnet"]
 PROVIDERS = ["openai", "anthropic"]
 
 
-async def send_event(session: aiohttp.ClientSession, event_id: int):
-    """Send a single event"""
-    event = {
-        "timestamp": datetime.utcnow().isoformat(),
-        "model": random.choice(MODELS),
-        "provider": random.choice(PROVIDERS),
-        "prompt_tokens": random.randint(50, 500),
-        "completion_tokens": random.randint(50, 500),
-        "total_tokens": 0,  # Will be calculated
-        "latency_ms": random.uniform(500, 3000),
-        "metadata": {"test_id": event_id}
-    }
-    event["total_tokens"] = event["prompt_tokens"] + event["completion_tokens"]
-
-    headers = {"X-API-Key": API_KEY}
+class Event(msgspec.Struct):
+    """Synthetic load-test event (encoded straight to JSON bytes in C)"""
+    timestamp: str
+    model: str
+    provider: str
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+    latency_ms: float
+    metadata: dict
+
+
+_encode = msgspec.json.Encoder().encode
+
+
+def make_timestamps(count: int) -> List[str]:
+    """
+    Pre-format event timestamps once instead of calling isoformat() per event
+
+    Load-test timestamps are synthetic, so a fixed base second plus a
+    millisecond suffix is enough.
+    """
+    base_iso = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S")
+    return [f"{base_iso}.{i % 1000:03d}000" for i in range(count)]
+
+
+class EventFields:
+    """
+    Synthetic per-event values, generated up front in a few vectorized calls
 
+    Converted to Python lists once so send_event only does list indexing.
+    Covers event ids `first_id` to `first_id + count - 1`, so each load test
+    worker only generates its own share.
+    """
+
+    def __init__(self, count: int, first_id: int = 0):
+        self.first_id = first_id
+        rng = np.random.default_rng()
+        prompt = rng.integers(50, 501, count, dtype=np.int32)
+        completion = rng.integers(50, 501, count, dtype=np.int32)
+
+        self.timestamps = make_timestamps(count)
+        self.models = [MODELS[i] for i in rng.integers(0, len(MODELS), count)]
+        self.providers = [PROVIDERS[i] for i in rng.integers(0, len(PROVIDERS), count)]
+        self.prompt_tokens = prompt.tolist()
+        self.completion_tokens = completion.tolist()
+        self.total_tokens = (prompt + completion).tolist()
+        self.latency_ms = rng.uniform(500, 3000, count).astype(np.float32).tolist()
+
+        # Measured request latencies, filled in by send_event
+        self.request_ns = array.array("q", bytes(8 * count))
+
+
+async def send_event(session: aiohttp.ClientSession, event_id: int, fields: EventFields):
+    """Send a single event"""
+    i = event_id - fields.first_id
+    payload = _encode(Event(
+        timestamp=fields.timestamps[i],
+        model=fields.models[i],
+        provider=fields.providers[i],
+        prompt_tokens=fields.prompt_tokens[i],
+        completion_tokens=fields.completion_tokens[i],
+        total_tokens=fields.total_tokens[i],
+        latency_ms=fields.latency_ms[i],
+        metadata={"test_id": event_id}
+    ))
+
+    t0 = time.perf_counter_ns()
     try:
-        async with session.post(
-            f"{API_URL}/events/ingest",
-            json=event,
-            headers=headers
-        ) as response:
+        async with session.post(INGEST_URL, data=payload, headers=HEADERS) as response:
             return response.status == 200
     except Exception as e:
         print(f"Error sending event {event_id}: {e}")
         return False
+    finally:
+        fields.request_ns[i] = time.perf_counter_ns() - t0
+
+
+def report_latencies(request_ns: np.ndarray, path: str = "latencies.npy"):
+    """Save per-request latencies and print the tail percentiles"""
+    np.save(path, request_ns)
+    p50, p95, p99 = np.percentile(request_ns, [50, 95, 99]) / 1e6
+    print(f"Latency p50/p95/p99: {p50:.1f} / {p95:.1f} / {p99:.1f} ms "
+          f"(max {request_ns.max() / 1e6:.1f} ms, saved to {path})")
 
 
 async def run_load_test():
@@ -50,6 +115,8 @@ async def run_load_test():
     print(f"Starting load test: {NUM_REQUESTS} requests with {CONCURRENT_REQUESTS} concurrent")
     print("-" * 60)
 
+    fields = EventFields(NUM_REQUESTS)
+
     start_time = time.time()
     successes = 0
     failures = 0
@@ -62,7 +129,7 @@ async def run_load_test():
 
             # Send batch concurrently
             tasks = [
-                send_event(session, event_id)
+                send_event(session, event_id, fields)
                 for event_id in range(batch_start, batch_end)
             ]
             results = await asyncio.gather(*tasks)
@@ -88,6 +155,7 @@ async def run_load_test():
     print(f"Successes: {successes}")
     print(f"Failures: {failures}")
     print(f"Success rate: {(successes/NUM_REQUESTS)*100:.1f}%")
+    report_latencies(np.frombuffer(fields.request_ns, dtype=np.int64))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Multi-process load testing script for LLMScope
+
+A single interpreter saturates its own CPU (GIL + one event loop) well before
+the API does at high concurrency. This driver runs one worker process per
+CPU core, each with its own event loop, aiohttp session and connection pool,
+and splits NUM_REQUESTS evenly between them.
+"""
+
+import asyncio
+import aiohttp
+import os
+import time
+from multiprocessing import Pool
+from typing import Tuple
+
+import numpy as np
+
+from load_test import (
+    NUM_REQUESTS,
+    CONCURRENT_REQUESTS,
+    EventFields,
+    report_latencies,
+    send_event,
+)
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+async def _run_worker(first_id: int, num_requests: int, concurrency: int) -> Tuple[int, int, bytes]:
+    """Send this worker's share of events in concurrent waves"""
+    fields = EventFields(num_requests, first_id)
+    last_id = first_id + num_requests
+    successes = 0
+
+    async with aiohttp.ClientSession() as session:
+        for batch_start in range(first_id, last_id, concurrency):
+            batch_end = min(batch_start + concurrency, last_id)
+            results = await asyncio.gather(*(
+                send_event(session, event_id, fields)
+                for event_id in range(batch_start, batch_end)
+            ))
+            successes += sum(1 for r in results if r)
+
+    latencies = fields.request_ns.tobytes()
+    return successes, num_requests - successes, latencies
+
+
+def run_load_test_worker(worker_id: int, num_requests: int, concurrency: int) -> Tuple[int, int, bytes]:
+    """Process entry point: run one event loop, return (successes, failures, latencies)"""
+    if uvloop is not None:
+        uvloop.install()
+    return asyncio.run(_run_worker(worker_id * num_requests, num_requests, concurrency))
+
+
+def run_load_test(num_workers: int):
+    """Run load test across worker processes"""
+    per_worker = NUM_REQUESTS // num_workers
+    total = per_worker * num_workers
+
+    print(f"Starting load test: {total} requests across {num_workers} processes "
+          f"({CONCURRENT_REQUESTS} concurrent each)")
+    print("-" * 60)
+
+    start_time = time.time()
+    with Pool(num_workers) as pool:
+        results = pool.starmap(
+            run_load_test_worker,
+            [(i, per_worker, CONCURRENT_REQUESTS) for i in range(num_workers)]
+        )
+    elapsed = time.time() - start_time
+
+    successes = sum(s for s, _, _ in results)
+    failures = sum(f for _, f, _ in results)
+    request_ns = np.frombuffer(b"".join(l for _, _, l in results), dtype=np.int64)
+
+    print("-" * 60)
+    print(f"Load test complete!")
+    print(f"Total time: {elapsed:.2f}s")
+    print(f"Requests per second: {total / elapsed:.1f}")
+    print(f"Successes: {successes}")
+    print(f"Failures: {failures}")
+    print(f"Success rate: {(successes/total)*100:.1f}%")
+    report_latencies(request_ns)
+
+
+if __name__ == "__main__":
+    run_load_test(os.cpu_count() or 1)
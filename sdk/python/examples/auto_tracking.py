@@ -9,11 +9,19 @@ import openai
 import os
 
 # Initialize LLMScope tracker
+#
+# Tracked events are queued and sent from a background thread in batches
+# (up to batch_size events, or every flush_interval_s), so your LLM calls
+# never wait on an LLMScope HTTP round-trip. Pass buffered=False to send
+# one request per call instead.
 tracker = LLMScope(
     api_key=os.getenv("LLMSCOPE_API_KEY", "your-api-key"),
     base_url=os.getenv("LLMSCOPE_URL", "http://localhost:8000"),
     project="production",
-    debug=True
+    debug=True,
+    buffered=True,
+    batch_size=100,
+    flush_interval_s=0.1
 )
 
 # Configure OpenAI
@@ -95,5 +103,8 @@ if __name__ == "__main__":
         print(f"Error caught: {e}")
         # Error metrics sent to LLMScope!
 
+    # Send anything still queued before the process exits
+    tracker.flush()
+
     print("\nAll calls have been automatically tracked!")
     print("Check your LLMScope dashboard for metrics.")
@@ -1,9 +1,11 @@
 """Basic usage example for LLMScope SDK"""
+import asyncio
+import functools
 from llmscope import LLMScopeClient, EventRequest
 from datetime import datetime, timedelta
 
 
-def main():
+async def main():
     """Demonstrate basic SDK usage"""
 
     # Initialize client
@@ -68,44 +70,44 @@ def main():
     print(f"   ✅ Ingested {batch_response.count} events")
     print(f"   Event IDs: {', '.join(batch_response.event_ids[:3])}...")
 
-    # 3. Get recent events
-    print("\n3. Retrieving recent events...")
-    recent_events = client.events.get_recent(limit=5)
+    # 3-7. Independent reads - run them concurrently instead of one by one.
+    # Each blocking call runs in the loop's default thread pool so the
+    # requests overlap: total wall-clock is the slowest call, not the sum.
+    # (run_in_executor rather than asyncio.to_thread, which needs Python 3.9)
+    print("\n3-7. Fetching events, analytics, alerts and keys concurrently...")
+    end = datetime.utcnow()
+    start = end - timedelta(days=1)
+    loop = asyncio.get_running_loop()
+
+    def in_thread(func, *args, **kwargs):
+        return loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+    recent_events, stats, metrics, costs, rules, keys = await asyncio.gather(
+        in_thread(client.events.get_recent, limit=5),
+        in_thread(client.events.get_stats),
+        in_thread(
+            client.analytics.get_metrics,
+            start_time=start,
+            end_time=end,
+            model="gpt-4"
+        ),
+        in_thread(client.analytics.get_costs, start_time=start, end_time=end),
+        in_thread(client.alerts.list_rules),
+        in_thread(client.auth.list_api_keys),
+    )
+
     print(f"   ✅ Retrieved {len(recent_events)} recent events")
     if recent_events:
         print(f"   Latest: {recent_events[0].get('model', 'N/A')}")
-
-    # 4. Get processing stats
-    print("\n4. Getting processing statistics...")
-    stats = client.events.get_stats()
     print(f"   ✅ Stats: {stats}")
-
-    # 5. Get analytics metrics
-    print("\n5. Getting analytics metrics...")
-    end = datetime.utcnow()
-    start = end - timedelta(days=1)
-
-    metrics = client.analytics.get_metrics(
-        start_time=start,
-        end_time=end,
-        model="gpt-4"
-    )
     print(f"   ✅ Metrics for last 24h: {metrics}")
-
-    # 6. Get cost breakdown
-    print("\n6. Getting cost breakdown...")
-    costs = client.analytics.get_costs(
-        start_time=start,
-        end_time=end
-    )
     print(f"   ✅ Cost data: {costs}")
-
-    # 7. List alert rules
-    print("\n7. Listing alert rules...")
-    rules = client.alerts.list_rules()
     print(f"   ✅ Found {len(rules)} alert rules")
     for rule in rules[:3]:
         print(f"      - {rule.get('name', 'N/A')}: {rule.get('condition', 'N/A')} > {rule.get('threshold', 'N/A')}")
+    print(f"   ✅ Found {len(keys)} API keys")
+    for key in keys[:3]:
+        print(f"      - {key.get('name', 'N/A')}: {key.get('key_masked', 'N/A')}")
 
     # 8. Create an alert rule
     print("\n8. Creating alert rule...")
@@ -124,17 +126,10 @@ def main():
     except Exception as e:
         print(f"   ⚠️  Error creating rule: {e}")
 
-    # 9. List API keys
-    print("\n9. Listing API keys...")
-    keys = client.auth.list_api_keys()
-    print(f"   ✅ Found {len(keys)} API keys")
-    for key in keys[:3]:
-        print(f"      - {key.get('name', 'N/A')}: {key.get('key_masked', 'N/A')}")
-
     print("\n" + "=" * 60)
     print("✅ Example completed successfully!")
     print("=" * 60)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
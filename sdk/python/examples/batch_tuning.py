@@ -0,0 +1,71 @@
+"""
+Example: Find the best ingest_batch size for your environment
+
+Batches that are too small waste round-trips; batches that are too large
+spend longer serializing and waiting on a single slow response. The knee
+of the events/s curve depends on your network and server, so measure it.
+
+This sweeps the batch size, sends the same number of synthetic events at
+each size, and prints throughput. Use the winning size as
+`LLMScope(..., buffered=True, batch_size=N)`.
+
+The API accepts at most 100 events per batch request, so that is the
+upper end of the sweep.
+
+Usage: python examples/batch_tuning.py
+"""
+import os
+import random
+import time
+
+from llmscope import LLMScopeClient
+
+BATCH_SIZES = (1, 10, 25, 50, 100)
+EVENTS_PER_RUN = 1000
+
+
+def make_events(count: int) -> list:
+    """Generate synthetic events"""
+    return [
+        {
+            "model": "gpt-4",
+            "provider": "openai",
+            "tokens_prompt": random.randint(50, 500),
+            "tokens_completion": random.randint(50, 500),
+            "latency_ms": random.randint(500, 3000),
+            "metadata": {"example": "batch_tuning"}
+        }
+        for _ in range(count)
+    ]
+
+
+def measure(client: LLMScopeClient, events: list, batch_size: int) -> float:
+    """Send all events in batches of batch_size, return events/s"""
+    start = time.perf_counter()
+    for i in range(0, len(events), batch_size):
+        client.events.ingest_batch(events[i:i + batch_size])
+    return len(events) / (time.perf_counter() - start)
+
+
+def main():
+    api_key = os.getenv("LLMSCOPE_API_KEY", "llmscope-local-key")
+    base_url = os.getenv("LLMSCOPE_BASE_URL", "http://localhost:8000")
+
+    client = LLMScopeClient(api_key=api_key, base_url=base_url)
+    events = make_events(EVENTS_PER_RUN)
+
+    print("=" * 60)
+    print(f"Batch size sweep ({EVENTS_PER_RUN} events per run)")
+    print("=" * 60)
+
+    results = {}
+    for batch_size in BATCH_SIZES:
+        results[batch_size] = measure(client, events, batch_size)
+        print(f"   batch_size={batch_size:>4}: {results[batch_size]:>8.0f} events/s")
+
+    best = max(results, key=results.get)
+    print(f"\n✅ Recommended: LLMScope(..., buffered=True, batch_size={best})")
+
+
+if __name__ == "__main__":
+    main()
@@ -100,6 +100,8 @@ def main():
     batch_response = client.events.ingest_batch(events)
     print(f"   ✅ Ingested {batch_response.count} events")
     print(f"   Event IDs: {', '.join(batch_response.event_ids)}")
+    # For high-volume producers, see examples/http2_ingest.py: many batches
+    # in flight over a single reused (HTTP/2-capable) connection.
 
     # 4. Get recent events
     print("\n4. Retrieve recent events...")
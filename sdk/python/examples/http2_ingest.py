@@ -0,0 +1,101 @@
+"""
+Example: Multiplexed batch ingestion over a single HTTP/2 connection
+
+The other examples POST one request at a time over HTTP/1.1. When a lot of
+events are produced concurrently (e.g. auto-tracking with monkey-patching),
+sending several batches in flight over ONE reused connection removes the
+per-request connection setup and head-of-line blocking of HTTP/1.1.
+
+This example keeps a single `httpx.AsyncClient(http2=True)` for the whole
+process and fans batches out to `/api/v1/events/ingest/batch` concurrently.
+
+Notes:
+  - HTTP/2 is negotiated via TLS ALPN, so you need an HTTPS endpoint that
+    speaks h2 (e.g. nginx in front of the API). Against plain
+    http://localhost:8000 httpx transparently falls back to a keep-alive
+    HTTP/1.1 pool, which still reuses connections.
+  - The LLMScope backend exposes a REST API only; there is no gRPC service,
+    so the reusable client here plays the role of a cached gRPC channel.
+
+Install: pip install "httpx[http2]"
+Usage:   python examples/http2_ingest.py
+"""
+import asyncio
+import os
+import random
+import time
+
+import httpx
+
+API_KEY = os.getenv("LLMSCOPE_API_KEY", "llmscope-local-key")
+BASE_URL = os.getenv("LLMSCOPE_BASE_URL", "http://localhost:8000")
+
+BATCH_SIZE = 100  # Server-side maximum for /events/ingest/batch
+NUM_EVENTS = 1000
+MAX_IN_FLIGHT = 10
+
+_client = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the process-wide client (created once, reused by every batch)"""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=BASE_URL,
+            http2=True,
+            headers={"X-API-Key": API_KEY},
+            limits=httpx.Limits(max_connections=MAX_IN_FLIGHT),
+            timeout=30.0,
+        )
+    return _client
+
+
+async def ingest_batch(events: list) -> dict:
+    """Send one batch; many of these share the same connection"""
+    response = await get_client().post(
+        "/api/v1/events/ingest/batch",
+        json={"events": events}
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def make_events(count: int) -> list:
+    """Generate synthetic events"""
+    models = [("gpt-4", "openai"), ("claude-3-opus", "anthropic")]
+    events = []
+    for i in range(count):
+        model, provider = random.choice(models)
+        events.append({
+            "model": model,
+            "provider": provider,
+            "tokens_prompt": random.randint(50, 500),
+            "tokens_completion": random.randint(50, 500),
+            "latency_ms": random.randint(500, 3000),
+            "metadata": {"example": "http2_ingest", "seq": i}
+        })
+    return events
+
+
+async def main():
+    events = make_events(NUM_EVENTS)
+    batches = [events[i:i + BATCH_SIZE] for i in range(0, len(events), BATCH_SIZE)]
+
+    print("=" * 60)
+    print(f"Ingesting {len(events)} events in {len(batches)} concurrent batches")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    try:
+        results = await asyncio.gather(*(ingest_batch(b) for b in batches))
+    finally:
+        await get_client().aclose()
+    elapsed = time.perf_counter() - start
+
+    total = sum(r["count"] for r in results)
+    print(f"✅ Ingested {total} events in {elapsed:.2f}s ({total / elapsed:.0f} events/s)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
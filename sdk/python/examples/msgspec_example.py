@@ -0,0 +1,80 @@
+"""
+Example: Typed, fast event serialization with msgspec
+
+`EventRequest` is a Pydantic model, which is great for validation but
+builds an intermediate dict that is then re-serialized to JSON. For
+high-volume producers, a `msgspec.Struct` mirroring the event schema
+encodes straight to JSON bytes in C, which frees client CPU for
+generating more traffic.
+
+The encoded bytes are posted through the SDK client's existing session,
+so authentication headers and connection pooling are unchanged.
+
+Install: pip install msgspec
+Usage:   python examples/msgspec_example.py
+"""
+import os
+from typing import Any, Dict, List, Optional
+
+import msgspec
+
+from llmscope import LLMScopeClient
+
+
+class Event(msgspec.Struct, omit_defaults=True):
+    """Wire type for POST /api/v1/events/ingest (mirrors EventRequest)"""
+    model: str
+    provider: str
+    tokens_prompt: int
+    tokens_completion: int
+    latency_ms: int
+    tokens_total: Optional[int] = None
+    user_id: Optional[str] = None
+    session_id: Optional[str] = None
+    cost_usd: Optional[float] = None
+    response: Optional[str] = None
+    status: str = "success"
+    has_error: bool = False
+    metadata: Optional[Dict[str, Any]] = None
+
+
+class BatchIngest(msgspec.Struct):
+    """Wire type for POST /api/v1/events/ingest/batch"""
+    events: List[Event]
+
+
+encode = msgspec.json.Encoder().encode
+
+
+def main():
+    api_key = os.getenv("LLMSCOPE_API_KEY", "llmscope-local-key")
+    base_url = os.getenv("LLMSCOPE_BASE_URL", "http://localhost:8000")
+
+    client = LLMScopeClient(api_key=api_key, base_url=base_url)
+
+    events = [
+        Event(
+            model="gpt-4",
+            provider="openai",
+            tokens_prompt=100 + i,
+            tokens_completion=50,
+            latency_ms=1200,
+            metadata={"example": "msgspec", "seq": i}
+        )
+        for i in range(50)
+    ]
+
+    payload = encode(BatchIngest(events=events))
+    print(f"Encoded {len(events)} events into {len(payload)} bytes")
+
+    response = client.events.session.post(
+        f"{client.events.base_url}/api/v1/events/ingest/batch",
+        data=payload,
+        timeout=30
+    )
+    response.raise_for_status()
+    print(f"✅ Ingested {response.json()['count']} events")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,11 @@
 """LLMScope Python SDK"""
 from .llmscope_client import LLMScopeClient
+from .async_client import AsyncEventsClient
 from .tracker import LLMScope
 from .models import (
     EventRequest,
+    EventMetrics,
+    EventPayload,
     EventResponse,
     BatchIngestRequest,
     BatchIngestResponse,
@@ -13,8 +16,11 @@ from .models import (
 __version__ = "0.1.0"
 __all__ = [
     "LLMScopeClient",
+    "AsyncEventsClient",
     "LLMScope",
     "EventRequest",
+    "EventMetrics",
+    "EventPayload",
     "EventResponse",
     "BatchIngestRequest",
     "BatchIngestResponse",
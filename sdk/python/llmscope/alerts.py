@@ -62,8 +62,8 @@ class AlertsClient(BaseClient):
             ```
         """
         if isinstance(rule, AlertRule):
-            rule_data = rule.model_dump(exclude_none=True)
-        else:
-            rule_data = rule
+            # Serialize straight to JSON bytes instead of dict -> json.dumps
+            body = rule.model_dump_json(exclude_none=True).encode("utf-8")
+            return self._post_raw("/api/v1/alerts/rules", body)
 
-        return self._post("/api/v1/alerts/rules", json=rule_data)
\ No newline at end of file
+        return self._post("/api/v1/alerts/rules", json=rule)
\ No newline at end of file
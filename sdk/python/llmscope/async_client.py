@@ -0,0 +1,168 @@
+"""Async client for LLMScope SDK"""
+from typing import List, Optional, Union
+from .models import EventRequest, EventResponse, BatchIngestResponse
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+
+class AsyncBaseClient:
+    """
+    Base async HTTP client for LLMScope API
+
+    Built on `httpx.AsyncClient`, so many requests can be in flight at once
+    over a small pool of connections (multiplexed over HTTP/2 when the `h2`
+    package is installed and the server supports it).
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "http://localhost:8000",
+        client: Optional["httpx.AsyncClient"] = None
+    ):
+        """
+        Initialize async LLMScope client
+
+        Args:
+            api_key: LLMScope API key
+            base_url: LLMScope API base URL
+            client: Shared httpx.AsyncClient (created if not provided)
+        """
+        if httpx is None:
+            raise ImportError(
+                "httpx package not found. Install with: pip install llmscope[async]"
+            )
+
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.client = client if client is not None else httpx.AsyncClient(
+            http2=_HTTP2,
+            headers={
+                "X-API-Key": api_key,
+                "Content-Type": "application/json"
+            },
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=30
+        )
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        json: Optional[dict] = None,
+        params: Optional[dict] = None
+    ) -> dict:
+        """
+        Make HTTP request to LLMScope API
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            json: JSON request body
+            params: Query parameters
+
+        Returns:
+            Response JSON data
+
+        Raises:
+            httpx.HTTPStatusError: If request fails
+        """
+        url = f"{self.base_url}{endpoint}"
+        response = await self.client.request(method, url, json=json, params=params)
+        response.raise_for_status()
+        return response.json()
+
+    async def _get(self, endpoint: str, params: Optional[dict] = None) -> dict:
+        """Make GET request"""
+        return await self._request("GET", endpoint, params=params)
+
+    async def _post(self, endpoint: str, json: Optional[dict] = None) -> dict:
+        """Make POST request"""
+        return await self._request("POST", endpoint, json=json)
+
+    async def aclose(self):
+        """Close the underlying connection pool"""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+
+class AsyncEventsClient(AsyncBaseClient):
+    """
+    Async client for LLMScope Events API
+
+    Example:
+        ```python
+        import asyncio
+        from llmscope import AsyncEventsClient
+
+        async def main():
+            async with AsyncEventsClient(api_key="your-api-key") as events:
+                await asyncio.gather(*(events.ingest(e) for e in batch))
+
+        asyncio.run(main())
+        ```
+    """
+
+    async def ingest(self, event: Union[EventRequest, dict]) -> EventResponse:
+        """
+        Ingest single LLM event
+
+        Args:
+            event: Event data as EventRequest object or dict
+
+        Returns:
+            EventResponse with status and event_id
+        """
+        if isinstance(event, EventRequest):
+            event_data = event.model_dump(exclude_none=True)
+        else:
+            event_data = event
+
+        response = await self._post("/api/v1/events/ingest", json=event_data)
+        return EventResponse.model_construct(**response)
+
+    async def ingest_batch(self, events: List[Union[EventRequest, dict]]) -> BatchIngestResponse:
+        """
+        Ingest multiple LLM events in a batch (max 100 events)
+
+        Args:
+            events: List of event data
+
+        Returns:
+            BatchIngestResponse with status, count, and event_ids
+        """
+        events_data = []
+        for event in events:
+            if isinstance(event, EventRequest):
+                events_data.append(event.model_dump(exclude_none=True))
+            else:
+                events_data.append(event)
+
+        response = await self._post("/api/v1/events/ingest/batch", json={"events": events_data})
+        return BatchIngestResponse.model_construct(**response)
+
+    async def get_recent(self, limit: int = 100) -> List[dict]:
+        """
+        Get recent events for the current tenant/project
+
+        Args:
+            limit: Maximum number of events to return (default: 100)
+
+        Returns:
+            List of recent events
+        """
+        return await self._get("/api/v1/events/recent", params={"limit": limit})
@@ -59,8 +59,8 @@ class AuthClient(BaseClient):
             ```
         """
         if isinstance(key, APIKeyCreate):
-            key_data = key.model_dump(exclude_none=True)
-        else:
-            key_data = key
+            # Serialize straight to JSON bytes instead of dict -> json.dumps
+            body = key.model_dump_json(exclude_none=True).encode("utf-8")
+            return self._post_raw("/api/v1/auth/api-keys", body)
 
-        return self._post("/api/v1/auth/api-keys", json=key_data)
\ No newline at end of file
+        return self._post("/api/v1/auth/api-keys", json=key)
\ No newline at end of file
@@ -1,26 +1,203 @@
 """Base client for LLMScope SDK"""
+import gzip
+import json as _json
+import socket
+import threading
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, List, Optional
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Request bodies smaller than this are sent uncompressed
+COMPRESSION_THRESHOLD = 4096
+
+# Endpoints used by the sub-clients; full URLs are built once per client
+_KNOWN_ENDPOINTS = (
+    "/api/v1/events/ingest",
+    "/api/v1/events/ingest/batch",
+    "/api/v1/events/ingest/stream",
+    "/api/v1/events/recent",
+    "/api/v1/events/stats",
+    "/api/v1/events/queue/stats",
+    "/api/v1/analytics/metrics",
+    "/api/v1/analytics/costs",
+    "/api/v1/alerts/rules",
+    "/api/v1/auth/api-keys",
+)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize request body (orjson when installed, stdlib json otherwise)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return _json.dumps(obj).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize response body (orjson when installed, stdlib json otherwise)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return _json.loads(data)
+
+
+def _keepalive_socket_options() -> list:
+    """TCP keepalive options supported by this platform"""
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10))
+    return options
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections enable TCP keepalive"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault(
+            "socket_options",
+            HTTPConnection.default_socket_options + _keepalive_socket_options()
+        )
+        super().init_poolmanager(*args, **kwargs)
+
+
+def create_session(api_key: str) -> requests.Session:
+    """
+    Create a pooled HTTP session for the LLMScope API
+
+    One session should be shared by every sub-client so keep-alive
+    connections (and their TCP/TLS handshakes) are reused across the
+    events, analytics, alerts and auth endpoints. Up to 100 connections
+    per host are pooled, and TCP keepalive stops idle pooled connections
+    from being silently dropped by NATs and load balancers.
+
+    Args:
+        api_key: LLMScope API key
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    session.headers.update({
+        "X-API-Key": api_key,
+        "Content-Type": "application/json"
+    })
+
+    adapter = KeepAliveAdapter(
+        pool_connections=20,
+        pool_maxsize=100,
+        pool_block=False,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.1,
+            status_forcelist=[502, 503, 504],
+            # Hand the last 5xx back so raise_for_status() raises an HTTPError
+            # carrying the status, rather than urllib3 raising a RetryError
+            raise_on_status=False
+        )
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# api_key -> [session, number of clients using it]
+_shared_sessions: Dict[str, List[Any]] = {}
+_shared_sessions_lock = threading.Lock()
+
+
+def shared_session(api_key: str) -> requests.Session:
+    """
+    Return the process-wide session for `api_key`, creating it on first use
+
+    Every `LLMScopeClient` (and so every `LLMScope` tracker) with the same API
+    key reuses one connection pool instead of opening its own. Because the
+    session is shared, callers must not mutate it (headers, auth, mounted
+    adapters, ...): the change would leak into every other client for the
+    key. Pair each call with `release_shared_session()`.
+
+    Args:
+        api_key: LLMScope API key
+
+    Returns:
+        Shared requests.Session (see `create_session`)
+    """
+    with _shared_sessions_lock:
+        entry = _shared_sessions.get(api_key)
+        if entry is None:
+            entry = _shared_sessions[api_key] = [create_session(api_key), 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def release_shared_session(api_key: str):
+    """
+    Drop one user of the shared session for `api_key`
+
+    The last user closes the session and removes it from the cache, so the
+    next `shared_session()` call starts a fresh connection pool.
+
+    Args:
+        api_key: LLMScope API key
+    """
+    with _shared_sessions_lock:
+        entry = _shared_sessions.get(api_key)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del _shared_sessions[api_key]
+    entry[0].close()
 
 
 class BaseClient:
     """Base HTTP client for LLMScope API"""
 
-    def __init__(self, api_key: str, base_url: str = "http://localhost:8000"):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "http://localhost:8000",
+        session: Optional[requests.Session] = None,
+        compression: Optional[str] = None
+    ):
         """
         Initialize LLMScope client
 
         Args:
             api_key: LLMScope API key
             base_url: LLMScope API base URL
+            session: Shared HTTP session (created if not provided)
+            compression: Compress request bodies larger than
+                COMPRESSION_THRESHOLD bytes ('gzip', 'zstd' or None)
         """
+        if compression not in (None, "gzip", "zstd"):
+            raise ValueError(f"Unsupported compression: {compression!r}")
+        if compression == "zstd" and zstandard is None:
+            raise ImportError(
+                "zstandard package not found. Install with: pip install llmscope[zstd]"
+            )
+
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
-        self.session = requests.Session()
-        self.session.headers.update({
-            "X-API-Key": api_key,
-            "Content-Type": "application/json"
-        })
+        self.session = session if session is not None else create_session(api_key)
+        self.compression = compression
+        self._urls = {endpoint: self.base_url + endpoint for endpoint in _KNOWN_ENDPOINTS}
+
+        # Pre-bound session methods for the GET/POST hot paths
+        self._session_get = self.session.get
+        self._session_post = self.session.post
 
     def _request(
         self,
@@ -46,24 +223,58 @@ class BaseClient:
         Raises:
             requests.HTTPError: If request fails
         """
-        url = f"{self.base_url}{endpoint}"
+        url = self._urls.get(endpoint) or self.base_url + endpoint
+        data, headers = self._encode_body(_dumps(json) if json is not None else None)
         response = self.session.request(
             method=method,
             url=url,
-            json=json,
+            data=data,
+            headers=headers,
             params=params,
             timeout=timeout
         )
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
+
+    def _encode_body(self, data: Optional[bytes]):
+        """Compress a serialized JSON body if enabled; returns (data, headers)"""
+        if data is None:
+            return None, None
+        if self.compression and len(data) > COMPRESSION_THRESHOLD:
+            return self._compress(data), {"Content-Encoding": self.compression}
+        return data, None
+
+    def _compress(self, data: bytes) -> bytes:
+        """Compress a request body with the configured encoding"""
+        if self.compression == "zstd":
+            return zstandard.ZstdCompressor(level=3).compress(data)
+        return gzip.compress(data, compresslevel=6)
 
-    def _get(self, endpoint: str, params: Optional[dict] = None, **kwargs) -> dict:
+    def _get(self, endpoint: str, params: Optional[dict] = None, timeout: int = 30) -> dict:
         """Make GET request"""
-        return self._request("GET", endpoint, params=params, **kwargs)
+        response = self._session_get(
+            self._urls.get(endpoint) or self.base_url + endpoint,
+            params=params,
+            timeout=timeout
+        )
+        response.raise_for_status()
+        return _loads(response.content)
 
-    def _post(self, endpoint: str, json: Optional[dict] = None, **kwargs) -> dict:
+    def _post(self, endpoint: str, json: Optional[dict] = None, timeout: int = 30) -> dict:
         """Make POST request"""
-        return self._request("POST", endpoint, json=json, **kwargs)
+        return self._post_raw(endpoint, _dumps(json) if json is not None else None, timeout=timeout)
+
+    def _post_raw(self, endpoint: str, data: Optional[bytes], timeout: int = 30) -> dict:
+        """Make POST request with an already-serialized JSON body"""
+        data, headers = self._encode_body(data)
+        response = self._session_post(
+            self._urls.get(endpoint) or self.base_url + endpoint,
+            data=data,
+            headers=headers,
+            timeout=timeout
+        )
+        response.raise_for_status()
+        return _loads(response.content)
 
     def _put(self, endpoint: str, json: Optional[dict] = None, **kwargs) -> dict:
         """Make PUT request"""
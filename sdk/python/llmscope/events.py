@@ -1,12 +1,71 @@
 """Events API module"""
-from typing import List, Optional, Union
-from .client import BaseClient
+import atexit
+import logging
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Union
+import requests
+from pydantic import TypeAdapter
+from .client import BaseClient, COMPRESSION_THRESHOLD, _dumps, _loads
 from .models import EventRequest, EventResponse, BatchIngestRequest, BatchIngestResponse
+from .proto import CONTENT_TYPE as PROTOBUF_CONTENT_TYPE, encode_batch, events_pb2
+from .spool import EventSpool
+
+logger = logging.getLogger("llmscope")
+
+# Serializes a whole list of EventRequest models in a single pydantic-core pass
+_EVENT_LIST_ADAPTER = TypeAdapter(List[EventRequest])
+
+# Target size of each chunk written by ingest_stream()
+_STREAM_CHUNK_BYTES = 64 * 1024
+
+# Server-side limit on events per /ingest/batch request (BatchIngestRequest.events)
+MAX_BATCH_SIZE = 100
+
+# Seconds between spool scans when this client hasn't spooled anything
+# itself (picks up segments left by other processes sharing the directory)
+SPOOL_RESCAN_INTERVAL = 60.0
 
 
 class EventsClient(BaseClient):
     """Client for LLMScope Events API"""
 
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "http://localhost:8000",
+        session: Optional[requests.Session] = None,
+        compression: Optional[str] = None,
+        protobuf: bool = False
+    ):
+        """
+        Initialize events client
+
+        Args:
+            api_key: LLMScope API key
+            base_url: LLMScope API base URL
+            session: Shared HTTP session (created if not provided)
+            compression: Compress large request bodies ('gzip', 'zstd' or None)
+            protobuf: Send `ingest_batch` payloads as Protocol Buffers instead
+                of JSON; falls back to JSON if the server answers 415
+        """
+        if protobuf and events_pb2 is None:
+            raise ImportError(
+                "protobuf package not found. Install with: pip install llmscope[protobuf]"
+            )
+
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            session=session,
+            compression=compression
+        )
+        self._protobuf = protobuf
+
     def ingest(self, event: Union[EventRequest, dict]) -> EventResponse:
         """
         Ingest single LLM event (non-blocking, queued for async processing)
@@ -40,12 +99,12 @@ class EventsClient(BaseClient):
             ```
         """
         if isinstance(event, EventRequest):
-            event_data = event.model_dump(exclude_none=True)
+            # Serialize straight to JSON bytes instead of dict -> json.dumps
+            body = event.model_dump_json(exclude_none=True).encode("utf-8")
+            response = self._post_raw("/api/v1/events/ingest", body)
         else:
-            event_data = event
-
-        response = self._post("/api/v1/events/ingest", json=event_data)
-        return EventResponse(**response)
+            response = self._post("/api/v1/events/ingest", json=event)
+        return EventResponse.model_construct(**response)
 
     def ingest_batch(self, events: List[Union[EventRequest, dict]]) -> BatchIngestResponse:
         """
@@ -73,16 +132,107 @@ class EventsClient(BaseClient):
             print(f"Ingested {response.count} events")
             ```
         """
-        events_data = []
-        for event in events:
-            if isinstance(event, EventRequest):
-                events_data.append(event.model_dump(exclude_none=True))
-            else:
-                events_data.append(event)
+        if all(isinstance(event, EventRequest) for event in events):
+            if not self._protobuf:
+                # Models go straight to JSON bytes in pydantic-core, no dict round-trip
+                body = b'{"events":' + _EVENT_LIST_ADAPTER.dump_json(events, exclude_none=True) + b'}'
+                response = self._post_raw("/api/v1/events/ingest/batch", body)
+                return BatchIngestResponse.model_construct(**response)
+            events_data = _EVENT_LIST_ADAPTER.dump_python(events, exclude_none=True)
+        else:
+            events_data = []
+            for event in events:
+                if isinstance(event, EventRequest):
+                    events_data.append(event.model_dump(exclude_none=True))
+                else:
+                    events_data.append(event)
+
+        if self._protobuf:
+            response = self._post_protobuf(events_data)
+            if response is not None:
+                return BatchIngestResponse.model_construct(**response)
 
         batch_data = {"events": events_data}
         response = self._post("/api/v1/events/ingest/batch", json=batch_data)
-        return BatchIngestResponse(**response)
+        return BatchIngestResponse.model_construct(**response)
+
+    def _post_protobuf(self, events_data: List[dict]) -> Optional[dict]:
+        """POST a batch as protobuf; returns None when JSON should be used instead"""
+        try:
+            data = encode_batch(events_data)
+        except ValueError:
+            # Not representable (e.g. non-JSON metadata); send this batch as JSON
+            return None
+
+        headers = {"Content-Type": PROTOBUF_CONTENT_TYPE}
+        if self.compression and len(data) > COMPRESSION_THRESHOLD:
+            data = self._compress(data)
+            headers["Content-Encoding"] = self.compression
+
+        response = self.session.post(
+            self._urls["/api/v1/events/ingest/batch"],
+            data=data,
+            headers=headers,
+            timeout=30
+        )
+        if response.status_code == 415:
+            # Server doesn't accept protobuf; stick to JSON from now on
+            self._protobuf = False
+            return None
+        response.raise_for_status()
+        return _loads(response.content)
+
+    def ingest_stream(
+        self,
+        events: Iterable[Union[EventRequest, dict]],
+        timeout: int = 300
+    ) -> BatchIngestResponse:
+        """
+        Ingest any number of events as a streamed NDJSON upload
+
+        Unlike `ingest_batch`, there is no 100-event limit. Events are
+        serialized lazily, one JSON object per line, and sent with chunked
+        transfer encoding, so `events` can be a generator and the full
+        payload is never held in memory.
+
+        Args:
+            events: Iterable of event data (consumed once)
+            timeout: Request timeout in seconds
+
+        Returns:
+            BatchIngestResponse with status, count, and event_ids
+
+        Example:
+            ```python
+            def backfill():
+                for row in read_log_rows():
+                    yield {"model": row.model, "provider": row.provider, ...}
+
+            response = client.events.ingest_stream(backfill())
+            print(f"Ingested {response.count} events")
+            ```
+        """
+        def chunks() -> Iterator[bytes]:
+            buffer = bytearray()
+            for event in events:
+                if isinstance(event, EventRequest):
+                    event = event.model_dump(exclude_none=True)
+                buffer += _dumps(event)
+                buffer += b"\n"
+                if len(buffer) >= _STREAM_CHUNK_BYTES:
+                    yield bytes(buffer)
+                    buffer.clear()
+            if buffer:
+                yield bytes(buffer)
+
+        response = self.session.post(
+            self._urls["/api/v1/events/ingest/stream"],
+            data=chunks(),
+            headers={"Content-Type": "application/x-ndjson"},
+            timeout=timeout
+        )
+        response.raise_for_status()
+        return BatchIngestResponse.model_construct(**_loads(response.content))
 
     def get_recent(self, limit: int = 100) -> List[dict]:
         """
@@ -138,4 +288,275 @@ class EventsClient(BaseClient):
             print(f"Pending: {queue_stats['pending']}")
             ```
         """
-        return self._get("/api/v1/events/queue/stats")
\ No newline at end of file
+        return self._get("/api/v1/events/queue/stats")
+
+    @contextmanager
+    def buffered_ingestion(
+        self,
+        max_batch: int = 50,
+        flush_interval: float = 5.0
+    ) -> Iterator["BufferedEventsClient"]:
+        """
+        Coalesce single-event ingestion into background batch requests
+
+        Events passed to `buf.ingest()` are queued and sent with
+        `ingest_batch` from a background thread. Remaining events are
+        flushed when the block exits.
+
+        Args:
+            max_batch: Maximum events per batch request
+            flush_interval: Maximum seconds an event waits before being sent
+
+        Example:
+            ```python
+            with client.events.buffered_ingestion() as buf:
+                for event in events:
+                    buf.ingest(event)  # Returns immediately
+            ```
+        """
+        buffered = BufferedEventsClient(
+            api_key=self.api_key,
+            base_url=self.base_url,
+            session=self.session,
+            max_batch=max_batch,
+            flush_interval=flush_interval,
+            compression=self.compression,
+            protobuf=self._protobuf
+        )
+        try:
+            yield buffered
+        finally:
+            buffered.close()
+
+
+# Buffered clients still running; flushed when the interpreter exits
+_open_buffers: "weakref.WeakSet[BufferedEventsClient]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_buffers():
+    for client in list(_open_buffers):
+        client.close(timeout=5.0)
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a failed send is worth retrying later (network or 5xx)"""
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code >= 500
+    return False
+
+
+class BufferedEventsClient(EventsClient):
+    """
+    Events client that sends ingested events in background batches
+
+    `ingest()` only appends the event to a bounded in-memory ring; a daemon
+    thread drains it and calls `ingest_batch()` once `max_batch` events are
+    waiting or every `flush_interval` seconds. Appending takes no lock
+    (`deque.append` is atomic), so tracked calls never contend with each
+    other or with the sender. When the ring is full the oldest events are
+    dropped rather than blocking the caller.
+
+    Example:
+        ```python
+        from llmscope import LLMScopeClient
+
+        client = LLMScopeClient(api_key="your-api-key", buffered=True)
+
+        client.events.ingest(event)  # Queued, returns immediately
+        client.events.flush()        # Wait until everything is sent
+        ```
+
+    With `spool_dir` set, batches that fail with a network error or 5xx are
+    written to disk (see `EventSpool`) and replayed after the next successful
+    send, so events survive backend outages and process restarts. The spool
+    directory is only scanned while it's known to hold segments, plus once
+    every SPOOL_RESCAN_INTERVAL seconds.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "http://localhost:8000",
+        session: Optional[requests.Session] = None,
+        max_batch: int = 50,
+        flush_interval: float = 5.0,
+        spool_dir: Optional[Union[str, Path]] = None,
+        compression: Optional[str] = None,
+        max_queue: int = 50_000,
+        protobuf: bool = False
+    ):
+        """
+        Initialize buffered events client
+
+        Args:
+            api_key: LLMScope API key
+            base_url: LLMScope API base URL
+            session: Shared HTTP session (created if not provided)
+            max_batch: Maximum events per batch request (capped at MAX_BATCH_SIZE)
+            flush_interval: Maximum seconds an event waits before being sent
+            spool_dir: Directory for spooling batches that could not be sent
+                (e.g. `llmscope.spool.DEFAULT_SPOOL_DIR`); disabled if None
+            compression: Compress large batch bodies ('gzip', 'zstd' or None)
+            max_queue: Maximum buffered events; the oldest are dropped beyond it
+            protobuf: Send batches as Protocol Buffers (see EventsClient)
+        """
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            session=session,
+            compression=compression,
+            protobuf=protobuf
+        )
+        # Larger batches would be rejected by the server with 422
+        self.max_batch = max(1, min(max_batch, MAX_BATCH_SIZE))
+        self.flush_interval = flush_interval
+        self.last_error: Optional[Exception] = None
+        self.spool = EventSpool(spool_dir) if spool_dir is not None else None
+        # Drain on the first send: a previous run may have left segments
+        self._spool_dirty = True
+        self._next_spool_scan = 0.0
+        self._buffer: deque = deque(maxlen=max_queue)
+        self._wakeup = threading.Event()
+        self._idle = threading.Condition()
+        self._sending = False
+        self._closed = False
+        self._dropped = 0
+        self._dropped_reported = 0
+        self._inflight = 0
+        self._last_flush_ms: Optional[float] = None
+        self._thread = threading.Thread(
+            target=self._flush_loop,
+            name="llmscope-flusher",
+            daemon=True
+        )
+        self._thread.start()
+        _open_buffers.add(self)
+
+    def ingest(self, event: Union[EventRequest, dict]) -> None:
+        """
+        Queue event for the next batch (never blocks on the network)
+
+        Args:
+            event: Event data as EventRequest object or dict
+        """
+        buffer = self._buffer
+        if len(buffer) == buffer.maxlen:
+            # append() below evicts the oldest event
+            self._dropped += 1
+        buffer.append(event)
+        if len(buffer) >= self.max_batch:
+            self._wakeup.set()
+
+    def stats(self) -> dict:
+        """
+        Snapshot of buffer health for monitoring
+
+        Returns:
+            Dictionary with `buffered` (events waiting), `dropped` (events
+            evicted because the buffer was full), `inflight` (events in the
+            batch being sent) and `last_flush_ms` (duration of the last
+            batch request, None before the first one)
+        """
+        return {
+            "buffered": len(self._buffer),
+            "dropped": self._dropped,
+            "inflight": self._inflight,
+            "last_flush_ms": self._last_flush_ms
+        }
+
+    def flush(self):
+        """Block until every buffered event has been sent"""
+        with self._idle:
+            while (self._buffer or self._sending) and self._thread.is_alive():
+                self._wakeup.set()
+                self._idle.wait(timeout=0.1)
+
+    def close(self, timeout: Optional[float] = None):
+        """
+        Flush remaining events and stop the background thread
+
+        Args:
+            timeout: Maximum seconds to wait for the final flush (None waits
+                until it completes)
+        """
+        if self._thread.is_alive():
+            self._closed = True
+            self._wakeup.set()
+            self._thread.join(timeout)
+        _open_buffers.discard(self)
+
+    def _flush_loop(self):
+        # Replay anything left over from a previous run
+        self._drain_spool()
+
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self._drain()
+
+        # Send whatever was appended before close()
+        self._drain()
+
+    def _drain(self):
+        self._sending = True
+        try:
+            while self._buffer:
+                batch = []
+                while self._buffer and len(batch) < self.max_batch:
+                    batch.append(self._buffer.popleft())
+                self._send(batch)
+        finally:
+            with self._idle:
+                self._sending = False
+                self._idle.notify_all()
+
+    def _send(self, batch: list):
+        self._inflight = len(batch)
+        start_ns = time.perf_counter_ns()
+        try:
+            self.ingest_batch(batch)
+        except Exception as e:
+            # Never surface tracking failures on the caller's thread
+            self.last_error = e
+            if self.spool is not None and _is_transient(e):
+                self._spool_write(batch)
+        else:
+            self._report_dropped()
+            self._drain_spool()
+        finally:
+            self._last_flush_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+            self._inflight = 0
+
+    def _report_dropped(self):
+        # Once the backend accepts events again, say how many were evicted meanwhile
+        dropped = self._dropped
+        if dropped != self._dropped_reported:
+            logger.warning(
+                "dropped %d events because the buffer was full (max_queue=%d)",
+                dropped - self._dropped_reported, self._buffer.maxlen
+            )
+            self._dropped_reported = dropped
+
+    def _spool_write(self, batch: list):
+        try:
+            self.spool.write(batch)
+        except Exception as e:
+            self.last_error = e
+        self._spool_dirty = True
+
+    def _drain_spool(self):
+        if self.spool is None:
+            return
+        now = time.monotonic()
+        if not self._spool_dirty and now < self._next_spool_scan:
+            return
+        self._next_spool_scan = now + SPOOL_RESCAN_INTERVAL
+        try:
+            self.spool.drain(self.ingest_batch, max_batch=self.max_batch, should_retry=_is_transient)
+        except Exception as e:
+            self.last_error = e
+        # A transient failure leaves segments behind for the next attempt
+        self._spool_dirty = bool(self.spool.pending())
\ No newline at end of file
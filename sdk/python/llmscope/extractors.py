@@ -1,8 +1,16 @@
 """Metric extractors for different LLM providers"""
-from typing import Dict, Any, Optional
+import sys
+from typing import Dict, Any, List, Optional, Sequence
 
+# Sentinel for single-lookup getattr() checks (None is a valid attribute value)
+_MISSING = object()
 
-def extract_openai_metrics(response: Any, duration_ms: int) -> Optional[Dict[str, Any]]:
+
+def extract_openai_metrics(
+    response: Any,
+    duration_ms: int,
+    include_payload: bool = True
+) -> Optional[Dict[str, Any]]:
     """
     Extract metrics from OpenAI API response
 
@@ -11,41 +19,52 @@ def extract_openai_metrics(response: Any, duration_ms: int) -> Optional[Dict[str
     Args:
         response: OpenAI API response object
         duration_ms: Request duration in milliseconds
+        include_payload: Include the response text (see EventPayload);
+            metrics only when False
 
     Returns:
         Event dictionary or None if extraction fails
     """
     try:
         # Handle ChatCompletion response
-        if hasattr(response, 'model') and hasattr(response, 'usage'):
+        model = getattr(response, 'model', _MISSING)
+        usage = getattr(response, 'usage', _MISSING)
+        if model is not _MISSING and usage is not _MISSING:
             event = {
-                "model": response.model,
+                "model": model,
                 "provider": "openai",
-                "tokens_prompt": response.usage.prompt_tokens,
-                "tokens_completion": response.usage.completion_tokens,
-                "tokens_total": response.usage.total_tokens,
+                "tokens_prompt": usage.prompt_tokens,
+                "tokens_completion": usage.completion_tokens,
+                "tokens_total": usage.total_tokens,
                 "latency_ms": duration_ms,
                 "status": "success",
                 "has_error": False
             }
+            metadata = {}
 
             # Extract response content if available
-            if hasattr(response, 'choices') and len(response.choices) > 0:
-                choice = response.choices[0]
-                if hasattr(choice, 'message') and hasattr(choice.message, 'content'):
-                    event['response'] = choice.message.content
+            choices = getattr(response, 'choices', _MISSING)
+            if choices is not _MISSING and len(choices) > 0:
+                choice = choices[0]
+                if include_payload:
+                    message = getattr(choice, 'message', _MISSING)
+                    if message is not _MISSING:
+                        content = getattr(message, 'content', _MISSING)
+                        if content is not _MISSING:
+                            event['response'] = content
 
                 # Extract finish reason
-                if hasattr(choice, 'finish_reason'):
-                    if 'metadata' not in event:
-                        event['metadata'] = {}
-                    event['metadata']['finish_reason'] = choice.finish_reason
+                finish_reason = getattr(choice, 'finish_reason', _MISSING)
+                if finish_reason is not _MISSING:
+                    metadata['finish_reason'] = finish_reason
 
             # Extract system fingerprint if available
-            if hasattr(response, 'system_fingerprint'):
-                if 'metadata' not in event:
-                    event['metadata'] = {}
-                event['metadata']['system_fingerprint'] = response.system_fingerprint
+            system_fingerprint = getattr(response, 'system_fingerprint', _MISSING)
+            if system_fingerprint is not _MISSING:
+                metadata['system_fingerprint'] = system_fingerprint
+
+            # Always present so callers can tag it without a membership check
+            event['metadata'] = metadata
 
             return event
 
@@ -58,7 +77,11 @@ def extract_openai_metrics(response: Any, duration_ms: int) -> Optional[Dict[str
         return None
 
 
-def extract_anthropic_metrics(response: Any, duration_ms: int) -> Optional[Dict[str, Any]]:
+def extract_anthropic_metrics(
+    response: Any,
+    duration_ms: int,
+    include_payload: bool = True
+) -> Optional[Dict[str, Any]]:
     """
     Extract metrics from Anthropic API response
 
@@ -67,46 +90,56 @@ def extract_anthropic_metrics(response: Any, duration_ms: int) -> Optional[Dict[
     Args:
         response: Anthropic API response object
         duration_ms: Request duration in milliseconds
+        include_payload: Include the response text (see EventPayload);
+            metrics only when False
 
     Returns:
         Event dictionary or None if extraction fails
     """
     try:
         # Handle Anthropic Message response
-        if hasattr(response, 'model') and hasattr(response, 'usage'):
+        model = getattr(response, 'model', _MISSING)
+        usage = getattr(response, 'usage', _MISSING)
+        if model is not _MISSING and usage is not _MISSING:
+            input_tokens = usage.input_tokens
+            output_tokens = usage.output_tokens
             event = {
-                "model": response.model,
+                "model": model,
                 "provider": "anthropic",
-                "tokens_prompt": response.usage.input_tokens,
-                "tokens_completion": response.usage.output_tokens,
-                "tokens_total": response.usage.input_tokens + response.usage.output_tokens,
+                "tokens_prompt": input_tokens,
+                "tokens_completion": output_tokens,
+                "tokens_total": input_tokens + output_tokens,
                 "latency_ms": duration_ms,
                 "status": "success",
                 "has_error": False
             }
+            metadata = {}
 
             # Extract response content if available
-            if hasattr(response, 'content') and len(response.content) > 0:
+            content = getattr(response, 'content', _MISSING) if include_payload else _MISSING
+            if content is not _MISSING and len(content) > 0:
                 # Anthropic returns content as list of content blocks
                 text_parts = []
-                for content_block in response.content:
-                    if hasattr(content_block, 'text'):
-                        text_parts.append(content_block.text)
+                for content_block in content:
+                    text = getattr(content_block, 'text', _MISSING)
+                    if text is not _MISSING:
+                        text_parts.append(text)
 
                 if text_parts:
                     event['response'] = '\n'.join(text_parts)
 
             # Extract stop reason
-            if hasattr(response, 'stop_reason'):
-                if 'metadata' not in event:
-                    event['metadata'] = {}
-                event['metadata']['stop_reason'] = response.stop_reason
+            stop_reason = getattr(response, 'stop_reason', _MISSING)
+            if stop_reason is not _MISSING:
+                metadata['stop_reason'] = stop_reason
 
             # Extract role
-            if hasattr(response, 'role'):
-                if 'metadata' not in event:
-                    event['metadata'] = {}
-                event['metadata']['role'] = response.role
+            role = getattr(response, 'role', _MISSING)
+            if role is not _MISSING:
+                metadata['role'] = role
+
+            # Always present so callers can tag it without a membership check
+            event['metadata'] = metadata
 
             return event
 
@@ -116,18 +149,62 @@ def extract_anthropic_metrics(response: Any, duration_ms: int) -> Optional[Dict[
         return None
 
 
-def extract_generic_metrics(
+# Response classes are dispatched on their top-level package
+_EXTRACTORS_BY_PACKAGE = {
+    "openai": extract_openai_metrics,
+    "anthropic": extract_anthropic_metrics,
+}
+
+# Packages whose objects are never LLM responses
+_NON_RESPONSE_PACKAGES = frozenset(("builtins", "collections", "datetime", "decimal"))
+
+
+def extract_metrics(
+    response: Any,
+    duration_ms: int,
+    include_payload: bool = True
+) -> Optional[Dict[str, Any]]:
+    """
+    Extract metrics from a response of any supported provider
+
+    Picks the extractor from the module of the response's class, so SDK
+    response objects take a single extractor call. Objects from other
+    modules (wrappers, test doubles) are probed with each format in turn.
+
+    Args:
+        response: Provider API response object
+        duration_ms: Request duration in milliseconds
+        include_payload: Include the response text
+
+    Returns:
+        Event dictionary or None if the response isn't recognized
+    """
+    package = type(response).__module__.partition(".")[0]
+    extractor = _EXTRACTORS_BY_PACKAGE.get(package)
+    if extractor is not None:
+        return extractor(response, duration_ms, include_payload)
+    if package in _NON_RESPONSE_PACKAGES:
+        return None
+
+    event = extract_openai_metrics(response, duration_ms, include_payload)
+    if event is None:
+        event = extract_anthropic_metrics(response, duration_ms, include_payload)
+    return event
+
+
+def build_event_fast(
     model: str,
     provider: str,
     prompt_tokens: int,
     completion_tokens: int,
-    duration_ms: int,
-    **kwargs
+    duration_ms: int
 ) -> Dict[str, Any]:
     """
-    Create event from generic metrics
+    Build a fixed-shape success event with no optional fields
 
-    Use this for custom tracking or when provider-specific extraction fails.
+    Branch-free fast path for producers that always emit the same core
+    fields (no metadata, response, user, ...). Equivalent to
+    `extract_generic_metrics` called without keyword arguments.
 
     Args:
         model: Model name
@@ -135,12 +212,11 @@ def extract_generic_metrics(
         prompt_tokens: Number of prompt tokens
         completion_tokens: Number of completion tokens
         duration_ms: Request duration in milliseconds
-        **kwargs: Additional optional fields (response, metadata, etc.)
 
     Returns:
         Event dictionary
     """
-    event = {
+    return {
         "model": model,
         "provider": provider,
         "tokens_prompt": prompt_tokens,
@@ -151,9 +227,134 @@ def extract_generic_metrics(
         "has_error": False
     }
 
+
+def extract_generic_metrics(
+    model: str,
+    provider: str,
+    prompt_tokens: int,
+    completion_tokens: int,
+    duration_ms: int,
+    **kwargs
+) -> Dict[str, Any]:
+    """
+    Create event from generic metrics
+
+    Use this for custom tracking or when provider-specific extraction fails.
+
+    Args:
+        model: Model name
+        provider: Provider name
+        prompt_tokens: Number of prompt tokens
+        completion_tokens: Number of completion tokens
+        duration_ms: Request duration in milliseconds
+        **kwargs: Additional optional fields (response, metadata, etc.)
+
+    Returns:
+        Event dictionary
+    """
+    event = build_event_fast(model, provider, prompt_tokens, completion_tokens, duration_ms)
+
     # Add any additional fields
-    for key, value in kwargs.items():
-        if value is not None:
-            event[key] = value
+    if kwargs:
+        for key, value in kwargs.items():
+            if value is not None:
+                event[key] = value
 
     return event
+
+
+def extract_generic_metrics_batch(
+    models: Sequence[str],
+    providers: Sequence[str],
+    prompt_tokens: Sequence[int],
+    completion_tokens: Sequence[int],
+    durations_ms: Sequence[int],
+    **kwargs
+) -> List[Dict[str, Any]]:
+    """
+    Create events from parallel sequences of generic metrics
+
+    Batch counterpart of `extract_generic_metrics` for high-volume producers
+    (e.g. evaluation harnesses). When any of the numeric sequences is a NumPy
+    array the totals are computed in one vectorized pass; plain lists (and
+    mixes of lists and arrays) work too. Counts are always plain ints.
+
+    Args:
+        models: Model name per event
+        providers: Provider name per event
+        prompt_tokens: Prompt tokens per event
+        completion_tokens: Completion tokens per event
+        durations_ms: Request duration in milliseconds per event
+        **kwargs: Additional optional fields applied to every event; dict
+            and list values (e.g. `metadata`) are copied per event
+
+    Returns:
+        List of event dictionaries, ready for `ingest_batch`
+
+    Raises:
+        ValueError: If the sequences differ in length
+
+    Example:
+        ```python
+        events = extract_generic_metrics_batch(
+            models=["gpt-4"] * 3,
+            providers=["openai"] * 3,
+            prompt_tokens=np.array([100, 200, 300]),
+            completion_tokens=np.array([50, 60, 70]),
+            durations_ms=np.array([900, 1100, 1300])
+        )
+        client.events.ingest_batch(events)
+        ```
+    """
+    lengths = {
+        "models": len(models),
+        "providers": len(providers),
+        "prompt_tokens": len(prompt_tokens),
+        "completion_tokens": len(completion_tokens),
+        "durations_ms": len(durations_ms),
+    }
+    if len(set(lengths.values())) > 1:
+        raise ValueError(f"Metric sequences differ in length: {lengths}")
+
+    # Callers passing arrays have already imported NumPy; don't import it
+    # (and pay its startup cost) for everyone else
+    np = sys.modules.get("numpy")
+    if np is not None and any(
+        isinstance(values, np.ndarray)
+        for values in (prompt_tokens, completion_tokens, durations_ms)
+    ):
+        prompt = np.asarray(prompt_tokens, dtype=np.int64)
+        completion = np.asarray(completion_tokens, dtype=np.int64)
+        totals = (prompt + completion).tolist()
+        # Convert to Python ints so events stay JSON-serializable
+        prompt_tokens = prompt.tolist()
+        completion_tokens = completion.tolist()
+        durations_ms = np.asarray(durations_ms, dtype=np.int64).tolist()
+    else:
+        totals = [p + c for p, c in zip(prompt_tokens, completion_tokens)]
+
+    extra = {key: value for key, value in kwargs.items() if value is not None}
+    # Give each event its own copy so mutating one event's metadata doesn't
+    # change every other event's
+    mutable = [key for key, value in extra.items() if isinstance(value, (dict, list))]
+
+    events = [
+        {
+            "model": model,
+            "provider": provider,
+            "tokens_prompt": prompt,
+            "tokens_completion": completion,
+            "tokens_total": total,
+            "latency_ms": duration,
+            "status": "success",
+            "has_error": False,
+            **extra
+        }
+        for model, provider, prompt, completion, total, duration in zip(
+            models, providers, prompt_tokens, completion_tokens, totals, durations_ms
+        )
+    ]
+    for event in events:
+        for key in mutable:
+            event[key] = event[key].copy()
+    return events
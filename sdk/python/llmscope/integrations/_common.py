@@ -0,0 +1,150 @@
+"""Tracking wrappers shared by the provider integrations"""
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+if TYPE_CHECKING:
+    from ..tracker import LLMScope
+
+logger = logging.getLogger("llmscope")
+
+
+class TrackingState:
+    """
+    Tracker and cached fast paths for one patched provider
+
+    Attributes:
+        extractor: Metric extractor for the provider's responses
+        tracker: Tracker installed by `patch_*`, or None when unpatched
+        track: Sync success path, built on the first tracked call
+        atrack: Async success path, built on the first tracked call
+    """
+
+    def __init__(self, extractor: Callable[..., Optional[dict]]):
+        self.extractor = extractor
+        self.tracker: Optional['LLMScope'] = None
+        self.track: Optional[Callable[[Any, int], None]] = None
+        self.atrack: Optional[Callable[[Any, int], None]] = None
+
+    def reset(self, tracker: Optional['LLMScope'] = None):
+        """Install `tracker` (None to disable tracking) and drop the cached paths"""
+        self.tracker = tracker
+        self.track = self.atrack = None
+
+    def specialize(self):
+        """Build and cache the fast paths for the current tracker"""
+        self.track, self.atrack = build_fast_tracker(self.tracker, self.extractor)
+        return self.track, self.atrack
+
+
+def build_fast_tracker(tracker: 'LLMScope', extractor: Callable[..., Optional[dict]]):
+    """
+    Build the sync and async success paths for `tracker`
+
+    The extractor, payload flag and constant event fields are bound as
+    closure locals, so each tracked call skips global lookups and attribute
+    chains off the tracker. The sync ingest path is looked up per call, like
+    in `LLMScope.trace()`, so replacing or patching `client.events` later
+    still takes effect.
+
+    Args:
+        tracker: Tracker that receives the events
+        extractor: Metric extractor for the provider's responses
+
+    Returns:
+        `(track, atrack)`; `atrack` hands the send off instead of awaiting it
+    """
+    extract = extractor
+    ingest_nowait = tracker.ingest_nowait
+    is_duplicate = tracker._is_duplicate
+    include_payload = tracker.track_payloads
+    # Top-level fields stamped on every event, folded once per tracker
+    fields = {'project_id': tracker.project} if tracker.project else {}
+
+    def build_event(response, duration_ms: int):
+        if is_duplicate(response):
+            return None
+        event = extract(response, duration_ms, include_payload)
+        if event:
+            event.update(fields)
+            event['metadata']['auto_tracked'] = True
+        return event
+
+    def track(response, duration_ms: int):
+        event = build_event(response, duration_ms)
+        if event:
+            try:
+                tracker.client.events.ingest(event)
+            except Exception as e:
+                logger.debug("tracking error: %s", e)
+
+    def atrack(response, duration_ms: int):
+        # Runs inside the event loop: hand the send off instead of awaiting it
+        event = build_event(response, duration_ms)
+        if event:
+            try:
+                ingest_nowait(event)
+            except Exception as e:
+                logger.debug("tracking error: %s", e)
+
+    return track, atrack
+
+
+def make_tracked(state: TrackingState, endpoint_name: str, is_async: bool = False) -> Callable:
+    """
+    Create a `wrap()` wrapper that tracks calls to a provider method
+
+    Args:
+        state: Provider tracking state (tracker and cached fast paths)
+        endpoint_name: Name recorded on error events, e.g.
+            "openai.chat.completions.create"
+        is_async: Wrap a coroutine method
+
+    Returns:
+        Wrapper taking (wrapped, instance, args, kwargs)
+
+    Example:
+        ```python
+        _state = TrackingState(extract_openai_metrics)
+        tracked_create = make_tracked(_state, "openai.chat.completions.create")
+        wrap(completions.Completions, "create", tracked_create)
+        ```
+    """
+    if is_async:
+        async def tracked(wrapped, instance, args, kwargs):
+            tracker = state.tracker
+            if tracker is None:
+                return await wrapped(instance, *args, **kwargs)
+
+            start_ns = time.perf_counter_ns()
+            try:
+                response = await wrapped(instance, *args, **kwargs)
+            except Exception as e:
+                duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+                tracker._track_error_nowait(e, duration_ms, endpoint_name)
+                raise
+
+            atrack = state.atrack or state.specialize()[1]
+            atrack(response, (time.perf_counter_ns() - start_ns) // 1_000_000)
+            return response
+
+        return tracked
+
+    def tracked(wrapped, instance, args, kwargs):
+        tracker = state.tracker
+        if tracker is None:
+            return wrapped(instance, *args, **kwargs)
+
+        start_ns = time.perf_counter_ns()
+        try:
+            response = wrapped(instance, *args, **kwargs)
+        except Exception as e:
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            tracker._track_error(e, duration_ms, endpoint_name)
+            raise
+
+        track = state.track or state.specialize()[0]
+        track(response, (time.perf_counter_ns() - start_ns) // 1_000_000)
+        return response
+
+    return tracked
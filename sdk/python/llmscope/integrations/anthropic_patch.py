@@ -1,14 +1,23 @@
 """Anthropic integration for automatic tracking"""
-import time
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING
+from ..extractors import extract_anthropic_metrics
+from ._common import TrackingState, make_tracked
+from .wrapping import wrap, unwrap
 
 if TYPE_CHECKING:
     from ..tracker import LLMScope
 
-# Store original methods for unpatching
-_original_create = None
-_original_acreate = None
-_tracker_instance: Optional['LLMScope'] = None
+# Tracker installed by patch_anthropic() and its cached fast paths
+_state = TrackingState(extract_anthropic_metrics)
+
+tracked_create = make_tracked(_state, "anthropic.messages.create")
+tracked_acreate = make_tracked(_state, "anthropic.messages.create", is_async=True)
+
+
+def _import_messages():
+    """Import anthropic's messages module (deferred until patch time)"""
+    from anthropic.resources import messages
+    return messages
 
 
 def patch_anthropic(tracker: 'LLMScope'):
@@ -35,89 +44,18 @@ def patch_anthropic(tracker: 'LLMScope'):
     Args:
         tracker: LLMScope tracker instance
     """
-    global _original_create, _original_acreate, _tracker_instance
-
     try:
-        import anthropic
-        from anthropic.resources import messages
+        messages = _import_messages()
     except ImportError:
         raise ImportError(
             "Anthropic package not found. Install with: pip install anthropic"
         )
 
-    _tracker_instance = tracker
-
-    # Store original methods
-    if _original_create is None:
-        _original_create = messages.Messages.create
-    if _original_acreate is None:
-        _original_acreate = messages.AsyncMessages.create
-
-    # Patch sync create
-    def tracked_create(self, *args, **kwargs):
-        start_time = time.time()
-        try:
-            response = _original_create(self, *args, **kwargs)
-            duration_ms = int((time.time() - start_time) * 1000)
-
-            # Extract and track metrics
-            from ..extractors import extract_anthropic_metrics
-            event = extract_anthropic_metrics(response, duration_ms)
-
-            if event and _tracker_instance:
-                if _tracker_instance.project:
-                    event['project_id'] = _tracker_instance.project
-                if 'metadata' not in event:
-                    event['metadata'] = {}
-                event['metadata']['auto_tracked'] = True
-
-                try:
-                    _tracker_instance.client.events.ingest(event)
-                except Exception as e:
-                    if _tracker_instance.debug:
-                        print(f"LLMScope tracking error: {e}")
-
-            return response
-        except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
-            if _tracker_instance:
-                _tracker_instance._track_error(e, duration_ms, "anthropic.messages.create")
-            raise
-
-    # Patch async create
-    async def tracked_acreate(self, *args, **kwargs):
-        start_time = time.time()
-        try:
-            response = await _original_acreate(self, *args, **kwargs)
-            duration_ms = int((time.time() - start_time) * 1000)
-
-            # Extract and track metrics
-            from ..extractors import extract_anthropic_metrics
-            event = extract_anthropic_metrics(response, duration_ms)
-
-            if event and _tracker_instance:
-                if _tracker_instance.project:
-                    event['project_id'] = _tracker_instance.project
-                if 'metadata' not in event:
-                    event['metadata'] = {}
-                event['metadata']['auto_tracked'] = True
-
-                try:
-                    _tracker_instance.client.events.ingest(event)
-                except Exception as e:
-                    if _tracker_instance.debug:
-                        print(f"LLMScope tracking error: {e}")
-
-            return response
-        except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
-            if _tracker_instance:
-                _tracker_instance._track_error(e, duration_ms, "anthropic.messages.create")
-            raise
-
-    # Apply patches
-    messages.Messages.create = tracked_create
-    messages.AsyncMessages.create = tracked_acreate
+    _state.reset(tracker)
+
+    # Re-patching replaces the existing wrappers rather than stacking them
+    wrap(messages.Messages, 'create', tracked_create)
+    wrap(messages.AsyncMessages, 'create', tracked_acreate)
 
 
 def unpatch_anthropic():
@@ -132,25 +70,11 @@ def unpatch_anthropic():
         unpatch_anthropic()
         ```
     """
-    global _original_create, _original_acreate, _tracker_instance
-
-    if _original_create is None:
-        return  # Not patched
-
     try:
-        import anthropic
-        from anthropic.resources import messages
-
-        # Restore original methods
-        if _original_create:
-            messages.Messages.create = _original_create
-        if _original_acreate:
-            messages.AsyncMessages.create = _original_acreate
-
-        # Reset globals
-        _original_create = None
-        _original_acreate = None
-        _tracker_instance = None
-
+        messages = _import_messages()
     except ImportError:
-        pass
+        return  # Never patched
+
+    unwrap(messages.Messages, 'create')
+    unwrap(messages.AsyncMessages, 'create')
+    _state.reset()
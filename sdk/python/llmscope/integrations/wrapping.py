@@ -0,0 +1,62 @@
+"""Method wrapping helpers for provider integrations"""
+import functools
+import inspect
+from typing import Any, Callable
+
+# Attribute on an installed proxy pointing at the method it replaced
+ORIGINAL_ATTR = '_llmscope_original'
+
+
+def wrap(owner: Any, name: str, wrapper: Callable) -> Callable:
+    """
+    Replace `owner.name` with a proxy that calls `wrapper(wrapped, instance, args, kwargs)`
+
+    Follows the `wrapt.wrap_function_wrapper` calling convention without the
+    dependency. The proxy is a coroutine function when `wrapper` is one, keeps
+    the wrapped method's metadata, and wrapping an already wrapped attribute
+    replaces the previous proxy instead of stacking a second one.
+
+    Args:
+        owner: Class (or module) holding the attribute
+        name: Attribute name, e.g. "create"
+        wrapper: Callable taking (wrapped, instance, args, kwargs)
+
+    Returns:
+        The installed proxy
+
+    Example:
+        ```python
+        def wrapper(wrapped, instance, args, kwargs):
+            return wrapped(instance, *args, **kwargs)
+
+        wrap(completions.Completions, "create", wrapper)
+        ```
+    """
+    current = getattr(owner, name)
+    wrapped = getattr(current, ORIGINAL_ATTR, current)
+
+    if inspect.iscoroutinefunction(wrapper):
+        @functools.wraps(wrapped)
+        async def proxy(self, *args, **kwargs):
+            return await wrapper(wrapped, self, args, kwargs)
+    else:
+        @functools.wraps(wrapped)
+        def proxy(self, *args, **kwargs):
+            return wrapper(wrapped, self, args, kwargs)
+
+    setattr(proxy, ORIGINAL_ATTR, wrapped)
+    setattr(owner, name, proxy)
+    return proxy
+
+
+def unwrap(owner: Any, name: str):
+    """
+    Restore the method replaced by `wrap()`; no-op if `owner.name` isn't wrapped
+
+    Args:
+        owner: Class (or module) holding the attribute
+        name: Attribute name
+    """
+    original = getattr(getattr(owner, name, None), ORIGINAL_ATTR, None)
+    if original is not None:
+        setattr(owner, name, original)
@@ -1,5 +1,9 @@
 """Main LLMScope SDK client"""
-from .events import EventsClient
+from functools import cached_property
+from pathlib import Path
+from typing import Optional, Union
+from .client import shared_session, release_shared_session
+from .events import EventsClient, BufferedEventsClient
 from .analytics import AnalyticsClient
 from .alerts import AlertsClient
 from .auth import AuthClient
@@ -46,22 +50,108 @@ class LLMScopeClient:
 
         # List API keys
         keys = client.auth.list_api_keys()
+
+        # Queue events and send them in background batches
+        client = LLMScopeClient(api_key="your-api-key", buffered=True)
+        client.events.ingest(event)  # Returns immediately
+        client.events.flush()
+
+        # Flush and release the connection pool when done
+        client.close()
         ```
     """
 
-    def __init__(self, api_key: str, base_url: str = "http://localhost:8000"):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "http://localhost:8000",
+        buffered: bool = False,
+        max_batch: int = 50,
+        flush_interval: float = 5.0,
+        spool_dir: Optional[Union[str, Path]] = None,
+        compression: Optional[str] = None,
+        protobuf: bool = False
+    ):
         """
         Initialize LLMScope client
 
         Args:
             api_key: LLMScope API key
             base_url: LLMScope API base URL (default: http://localhost:8000)
+            buffered: Make `events.ingest()` queue events and send them in
+                background batches (see BufferedEventsClient)
+            max_batch: Maximum events per batch request (buffered mode)
+            flush_interval: Maximum seconds an event waits before being
+                sent (buffered mode)
+            spool_dir: Directory where batches that fail with a network
+                error are spooled and later replayed (buffered mode)
+            compression: Compress request bodies over 4KB ('gzip', 'zstd'
+                or None); mostly benefits large `ingest_batch` payloads
+            protobuf: Send `ingest_batch` payloads as Protocol Buffers
+                (requires `pip install llmscope[protobuf]`)
         """
         self.api_key = api_key
         self.base_url = base_url
 
+        # One connection pool shared by all sub-clients (and clients) for this
+        # key; don't mutate it, other clients see the change
+        self.session = shared_session(api_key)
+        self._closed = False
+
         # Initialize sub-clients
-        self.events = EventsClient(api_key=api_key, base_url=base_url)
-        self.analytics = AnalyticsClient(api_key=api_key, base_url=base_url)
-        self.alerts = AlertsClient(api_key=api_key, base_url=base_url)
-        self.auth = AuthClient(api_key=api_key, base_url=base_url)
\ No newline at end of file
+        if buffered:
+            self.events = BufferedEventsClient(
+                api_key=api_key,
+                base_url=base_url,
+                session=self.session,
+                max_batch=max_batch,
+                flush_interval=flush_interval,
+                spool_dir=spool_dir,
+                compression=compression,
+                protobuf=protobuf
+            )
+        else:
+            self.events = EventsClient(
+                api_key=api_key,
+                base_url=base_url,
+                session=self.session,
+                compression=compression,
+                protobuf=protobuf
+            )
+
+    # Rarely used sub-clients are built on first access; tracking only needs events
+    @cached_property
+    def analytics(self) -> AnalyticsClient:
+        """Metrics and cost analytics"""
+        return AnalyticsClient(api_key=self.api_key, base_url=self.base_url, session=self.session)
+
+    @cached_property
+    def alerts(self) -> AlertsClient:
+        """Alert rule management"""
+        return AlertsClient(api_key=self.api_key, base_url=self.base_url, session=self.session)
+
+    @cached_property
+    def auth(self) -> AuthClient:
+        """API key management"""
+        return AuthClient(api_key=self.api_key, base_url=self.base_url, session=self.session)
+
+    def close(self):
+        """
+        Flush buffered events and release the shared session
+
+        The session is closed once no other client for the same API key
+        uses it. The client must not be used afterwards; calling `close()`
+        again is a no-op.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if isinstance(self.events, BufferedEventsClient):
+            self.events.close()
+        release_shared_session(self.api_key)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
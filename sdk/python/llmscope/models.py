@@ -4,8 +4,8 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 
 
-class EventRequest(BaseModel):
-    """LLM event request model"""
+class EventMetrics(BaseModel):
+    """Compact per-call fields: ids, model, token counts, latency and status"""
     tenant_id: Optional[str] = None
     project_id: Optional[str] = None
     time: Optional[datetime] = None
@@ -20,8 +20,6 @@ class EventRequest(BaseModel):
     latency_ms: int
     time_to_first_token_ms: Optional[int] = None
     cost_usd: Optional[float] = None
-    messages: Optional[List[Dict[str, Any]]] = None
-    response: Optional[str] = None
     temperature: Optional[float] = None
     max_tokens: Optional[int] = None
     top_p: Optional[float] = None
@@ -32,6 +30,16 @@ class EventRequest(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
 
 
+class EventPayload(BaseModel):
+    """Prompt and completion text of an event (potentially large, opt-in when tracking)"""
+    messages: Optional[List[Dict[str, Any]]] = None
+    response: Optional[str] = None
+
+
+class EventRequest(EventPayload, EventMetrics):
+    """LLM event request model (EventMetrics plus optional EventPayload)"""
+
+
 class EventResponse(BaseModel):
     """Event ingestion response"""
     status: str
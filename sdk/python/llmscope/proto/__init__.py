@@ -0,0 +1,51 @@
+"""Protocol Buffers encoding for batch event ingestion"""
+from datetime import datetime
+from typing import Iterable
+
+try:
+    from . import events_pb2
+except ImportError:
+    events_pb2 = None
+
+CONTENT_TYPE = "application/x-protobuf"
+
+
+def encode_batch(events: Iterable[dict]) -> bytes:
+    """
+    Serialize event dicts as a `BatchIngestRequest` message
+
+    Args:
+        events: Event dicts (as produced by `EventRequest.model_dump`)
+
+    Returns:
+        Serialized protobuf bytes
+
+    Raises:
+        ImportError: If the protobuf package is not installed
+        ValueError: If an event cannot be represented (e.g. unknown field or
+            non-JSON metadata)
+    """
+    if events_pb2 is None:
+        raise ImportError(
+            "protobuf package not found. Install with: pip install llmscope[protobuf]"
+        )
+
+    batch = events_pb2.BatchIngestRequest()
+    for event in events:
+        message = batch.events.add()
+        for key, value in event.items():
+            if value is None:
+                continue
+            if key == "metadata":
+                message.metadata.update(value)
+            elif key == "messages":
+                for item in value:
+                    message.messages.add().update(item)
+            elif key == "time" and isinstance(value, datetime):
+                message.time = value.isoformat()
+            else:
+                try:
+                    setattr(message, key, value)
+                except (AttributeError, TypeError) as e:
+                    raise ValueError(f"Cannot encode field {key!r}: {e}") from e
+    return batch.SerializeToString()
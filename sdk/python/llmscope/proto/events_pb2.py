@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: llmscope/proto/events.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1bllmscope/proto/events.proto\x12\x0fllmscope.events\x1a\x1cgoogle/protobuf/struct.proto\"\xd9\x07\n\x05\x45vent\x12\x16\n\ttenant_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x17\n\nproject_id\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x11\n\x04time\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x12\n\x05model\x18\x04 \x01(\tH\x03\x88\x01\x01\x12\x15\n\x08provider\x18\x05 \x01(\tH\x04\x88\x01\x01\x12\x15\n\x08\x65ndpoint\x18\x06 \x01(\tH\x05\x88\x01\x01\x12\x14\n\x07user_id\x18\x07 \x01(\tH\x06\x88\x01\x01\x12\x17\n\nsession_id\x18\x08 \x01(\tH\x07\x88\x01\x01\x12\x1a\n\rtokens_prompt\x18\t \x01(\x05H\x08\x88\x01\x01\x12\x1e\n\x11tokens_completion\x18\n \x01(\x05H\t\x88\x01\x01\x12\x19\n\x0ctokens_total\x18\x0b \x01(\x05H\n\x88\x01\x01\x12\x17\n\nlatency_ms\x18\x0c \x01(\x05H\x0b\x88\x01\x01\x12#\n\x16time_to_first_token_ms\x18\r \x01(\x05H\x0c\x88\x01\x01\x12\x15\n\x08\x63ost_usd\x18\x0e \x01(\x01H\r\x88\x01\x01\x12)\n\x08messages\x18\x0f \x03(\x0b\x32\x17.google.protobuf.Struct\x12\x15\n\x08response\x18\x10 \x01(\tH\x0e\x88\x01\x01\x12\x18\n\x0btemperature\x18\x11 \x01(\x01H\x0f\x88\x01\x01\x12\x17\n\nmax_tokens\x18\x12 \x01(\x05H\x10\x88\x01\x01\x12\x12\n\x05top_p\x18\x13 \x01(\x01H\x11\x88\x01\x01\x12\x13\n\x06status\x18\x14 \x01(\tH\x12\x88\x01\x01\x12\x1a\n\rerror_message\x18\x15 \x01(\tH\x13\x88\x01\x01\x12\x16\n\thas_error\x18\x16 \x01(\x08H\x14\x88\x01\x01\x12\x19\n\x0cpii_detected\x18\x17 \x01(\x08H\x15\x88\x01\x01\x12.\n\x08metadata\x18\x18 \x01(\x0b\x32\x17.google.protobuf.StructH\x16\x88\x01\x01\x42\x0c\n\n_tenant_idB\r\n\x0b_project_idB\x07\n\x05_timeB\x08\n\x06_modelB\x0b\n\t_providerB\x0b\n\t_endpointB\n\n\x08_user_idB\r\n\x0b_session_idB\x10\n\x0e_tokens_promptB\x14\n\x12_tokens_completionB\x0f\n\r_tokens_totalB\r\n\x0b_latency_msB\x19\n\x17_time_to_first_token_msB\x0b\n\t_cost_usdB\x0b\n\t_responseB\x0e\n\x0c_temperatureB\r\n\x0b_max_tokensB\x08\n\x06_top_pB\t\n\x07_statusB\x10\n\x0e_error_messageB\x0c\n\n_has_errorB\x0f\n\r_pii_detectedB\x0b\n\t_metadata\"<\n\x12\x42\x61tchIngestRequest\x12&\n\x06\x65vents\x18\x01 \x03(\x0b\x32\x16.llmscope.events.Eventb\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'llmscope.proto.events_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _EVENT._serialized_start=79
+  _EVENT._serialized_end=1064
+  _BATCHINGESTREQUEST._serialized_start=1066
+  _BATCHINGESTREQUEST._serialized_end=1126
+# @@protoc_insertion_point(module_scope)
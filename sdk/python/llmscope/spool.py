@@ -0,0 +1,186 @@
+"""On-disk spool for events that could not be sent"""
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Callable, List, Union
+from .models import EventRequest
+
+logger = logging.getLogger("llmscope")
+
+DEFAULT_SPOOL_DIR = Path.home() / ".llmscope" / "spool"
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process with this pid exists"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        # Exists but isn't ours, or the platform can't tell: assume alive
+        return True
+    return True
+
+
+def _owner_alive(path: Path) -> bool:
+    """Whether the process named in a `<stem>.<pid>.<suffix>` file still runs"""
+    parts = path.name.split(".")
+    return len(parts) == 3 and parts[1].isdigit() and _pid_alive(int(parts[1]))
+
+
+class EventSpool:
+    """
+    Append-only directory of JSON-lines segment files
+
+    Each `write()` call produces one segment holding one failed batch. Segments
+    are written to a temporary file, fsynced and atomically renamed, so a
+    crash never leaves a half-written segment behind. `drain()` replays the
+    segments oldest-first and deletes each one once the server accepted it.
+    Segments claimed by a drainer that died mid-replay are put back in line,
+    and temporary files left by a writer that died mid-write are removed,
+    when the spool is opened. Segments that can't be decoded are renamed to
+    `*.corrupt` and skipped.
+
+    Example:
+        ```python
+        from llmscope.spool import EventSpool
+
+        spool = EventSpool("~/.llmscope/spool")
+        spool.write(events)                        # Network is down
+        spool.drain(client.events.ingest_batch)    # Later, replay them
+        ```
+    """
+
+    def __init__(self, directory: Union[str, Path] = DEFAULT_SPOOL_DIR, fsync: bool = True):
+        """
+        Initialize spool
+
+        Args:
+            directory: Spool directory (created if missing)
+            fsync: fsync each segment before it becomes visible
+        """
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.fsync = fsync
+        self._seq = 0
+        self._recover()
+
+    def _recover(self):
+        """Clean up after processes that died mid-write or mid-drain"""
+        # Live writers and drainers (this process included) keep their files
+        for tmp in self.directory.glob("*.tmp"):
+            if not _owner_alive(tmp):
+                tmp.unlink(missing_ok=True)
+        for claimed in self.directory.glob("*.claim"):
+            if _owner_alive(claimed):
+                continue
+            stem = claimed.name.split(".", 1)[0]
+            try:
+                os.replace(claimed, claimed.with_name(f"{stem}.jsonl"))
+            except FileNotFoundError:
+                pass
+
+    def write(self, events: List[Union[EventRequest, dict]]) -> Path:
+        """
+        Persist a batch of events as a new segment
+
+        Args:
+            events: Events to spool
+
+        Returns:
+            Path of the written segment
+        """
+        self._seq += 1
+        path = self.directory / f"{time.time_ns():020d}-{os.getpid()}-{self._seq}.jsonl"
+        self._write_segment(path, events)
+        return path
+
+    def _write_segment(self, path: Path, events: List[Union[EventRequest, dict]]):
+        lines = []
+        for event in events:
+            if isinstance(event, EventRequest):
+                event = event.model_dump(mode="json", exclude_none=True)
+            lines.append(json.dumps(event, default=str))
+
+        # Tagged with our pid so a reopened spool can tell abandoned files apart
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+
+        data = memoryview(("\n".join(lines) + "\n").encode("utf-8"))
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            # os.write may write only part of the buffer
+            while data:
+                data = data[os.write(fd, data):]
+            if self.fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+
+    def pending(self) -> List[Path]:
+        """Return spooled segments, oldest first"""
+        return sorted(self.directory.glob("*.jsonl"))
+
+    def drain(
+        self,
+        send: Callable[[List[dict]], object],
+        max_batch: int = 100,
+        should_retry: Callable[[Exception], bool] = lambda e: True
+    ) -> int:
+        """
+        Replay spooled segments through `send`
+
+        Stops at the first failure that `should_retry` accepts, leaving that
+        segment (and everything after it) in place for the next attempt.
+        Segments rejected with a non-retryable error are discarded.
+
+        Args:
+            send: Callable that sends one batch (e.g. `EventsClient.ingest_batch`)
+            max_batch: Maximum events per `send` call
+            should_retry: Decides whether a failure is transient
+
+        Returns:
+            Number of events successfully replayed
+        """
+        replayed = 0
+        for path in self.pending():
+            # Claim the segment so concurrent drainers don't replay it twice
+            claimed = path.with_suffix(f".{os.getpid()}.claim")
+            try:
+                os.replace(path, claimed)
+            except FileNotFoundError:
+                continue
+
+            try:
+                with open(claimed, encoding="utf-8") as f:
+                    events = [json.loads(line) for line in f if line.strip()]
+            except ValueError as e:
+                # Undecodable: set it aside for inspection instead of retrying
+                # it (and failing) on every drain
+                logger.warning("quarantining corrupt spool segment %s: %s", path.name, e)
+                os.replace(claimed, path.with_suffix(".corrupt"))
+                continue
+
+            sent = 0
+            try:
+                while sent < len(events):
+                    send(events[sent:sent + max_batch])
+                    sent += len(events[sent:sent + max_batch])
+            except Exception as e:
+                replayed += sent
+                if not should_retry(e):
+                    claimed.unlink()
+                    continue
+                if sent:
+                    # Keep the segment's place in line with only the unsent tail
+                    self._write_segment(path, events[sent:])
+                    claimed.unlink()
+                else:
+                    os.replace(claimed, path)
+                return replayed
+
+            replayed += sent
+            claimed.unlink()
+        return replayed
@@ -1,28 +1,81 @@
 """Auto-tracking wrapper for LLMScope SDK"""
+import asyncio
 import time
 import functools
 import inspect
-from typing import Optional, Dict, Any, Callable
+import logging
+import threading
+from collections import OrderedDict
+from functools import cached_property
+from typing import Optional, Dict, Any, Callable, Set
 from contextlib import contextmanager
 from .llmscope_client import LLMScopeClient
-from .extractors import extract_openai_metrics, extract_anthropic_metrics
+from .async_client import AsyncEventsClient, httpx
+from .events import BufferedEventsClient
+from .extractors import extract_metrics
+
+logger = logging.getLogger("llmscope")
+
+def _enable_debug_logging():
+    """Send "llmscope" debug records to stderr unless a handler is already set"""
+    logger.setLevel(logging.DEBUG)
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("LLMScope %(message)s"))
+        logger.addHandler(handler)
+
+
+# Response ids remembered per tracker for duplicate suppression
+SEEN_RESPONSE_IDS = 4096
+
+# Fields shared by every error event; copied (never mutated) per failure
+_ERROR_TEMPLATE = {
+    "model": "unknown",
+    "provider": "unknown",
+    "tokens_prompt": 0,
+    "tokens_completion": 0,
+    "status": "error",
+    "has_error": True,
+}
+
+
+class _SeenIds:
+    """Thread-safe bounded LRU set of response ids"""
+
+    def __init__(self, maxsize: int = SEEN_RESPONSE_IDS):
+        self.maxsize = maxsize
+        self._ids: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, response_id: str) -> bool:
+        """Remember `response_id`; returns False if it was already seen"""
+        with self._lock:
+            if response_id in self._ids:
+                self._ids.move_to_end(response_id)
+                return False
+            self._ids[response_id] = None
+            if len(self._ids) > self.maxsize:
+                self._ids.popitem(last=False)
+            return True
 
 
 class TrackingSpan:
     """Context manager for tracking LLM calls"""
 
+    __slots__ = ('tracker', 'name', 'start_ns', 'metadata')
+
     def __init__(self, tracker: 'LLMScope', name: Optional[str] = None):
         self.tracker = tracker
         self.name = name
-        self.start_time = None
+        self.start_ns = None
         self.metadata = {}
 
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_ns = time.perf_counter_ns()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration_ms = int((time.time() - self.start_time) * 1000)
+        duration_ms = (time.perf_counter_ns() - self.start_ns) // 1_000_000
 
         if exc_type is not None:
             # Track error
@@ -36,31 +89,18 @@ class TrackingSpan:
 
     def track_response(self, response: Any):
         """Track LLM response"""
-        duration_ms = int((time.time() - self.start_time) * 1000)
-
-        # Try to extract metrics from response
-        event = None
+        duration_ms = (time.perf_counter_ns() - self.start_ns) // 1_000_000
 
-        # Try OpenAI format
-        try:
-            event = extract_openai_metrics(response, duration_ms)
-        except:
-            pass
+        if self.tracker._is_duplicate(response):
+            return
 
-        # Try Anthropic format
-        if event is None:
-            try:
-                event = extract_anthropic_metrics(response, duration_ms)
-            except:
-                pass
+        # Try to extract metrics from response
+        event = extract_metrics(response, duration_ms, self.tracker.track_payloads)
 
         # If extraction worked, add metadata and ingest
         if event:
             if self.metadata:
-                if event.get('metadata'):
-                    event['metadata'].update(self.metadata)
-                else:
-                    event['metadata'] = self.metadata
+                event['metadata'].update(self.metadata)
 
             if self.tracker.project:
                 event['project_id'] = self.tracker.project
@@ -69,20 +109,14 @@ class TrackingSpan:
                 self.tracker.client.events.ingest(event)
             except Exception as e:
                 # Don't fail user's code if tracking fails
-                if self.tracker.debug:
-                    print(f"LLMScope tracking error: {e}")
+                logger.debug("tracking error: %s", e)
 
     def _track_error(self, error: Exception, duration_ms: int):
         """Track error event"""
         event = {
-            "model": "unknown",
-            "provider": "unknown",
-            "tokens_prompt": 0,
-            "tokens_completion": 0,
+            **_ERROR_TEMPLATE,
             "latency_ms": duration_ms,
-            "status": "error",
             "error_message": str(error),
-            "has_error": True,
             "metadata": self.metadata
         }
 
@@ -92,8 +126,7 @@ class TrackingSpan:
         try:
             self.tracker.client.events.ingest(event)
         except Exception as e:
-            if self.tracker.debug:
-                print(f"LLMScope error tracking failed: {e}")
+            logger.debug("error tracking failed: %s", e)
 
 
 class LLMScope:
@@ -125,6 +158,13 @@ class LLMScope:
         with tracker.track() as span:
             response = openai.chat.completions.create(...)
             span.track_response(response)
+
+        # Events are batched and sent from a background thread;
+        # flush() waits for delivery (also done automatically at exit)
+        tracker.flush()
+
+        # Send one request per tracked call instead
+        tracker = LLMScope(api_key="your-api-key", buffered=False)
         ```
     """
 
@@ -133,7 +173,12 @@ class LLMScope:
         api_key: str,
         base_url: str = "http://localhost:8000",
         project: Optional[str] = None,
-        debug: bool = False
+        debug: bool = False,
+        buffered: bool = True,
+        batch_size: int = 100,
+        flush_interval_s: float = 0.1,
+        spool_dir: Optional[str] = None,
+        track_payloads: bool = False
     ):
         """
         Initialize LLMScope auto-tracking wrapper
@@ -142,11 +187,118 @@ class LLMScope:
             api_key: LLMScope API key
             base_url: LLMScope API base URL
             project: Project ID for all tracked events
-            debug: Enable debug logging
+            debug: Log tracking failures from the "llmscope" logger to stderr
+            buffered: Queue events and send them in batches from a background
+                thread instead of one HTTP request per tracked call
+                (default). Queued events are flushed at interpreter exit.
+            batch_size: Maximum events per batch request, at most 100
+                (buffered mode)
+            flush_interval_s: Maximum time an event waits before its batch
+                is sent (buffered mode)
+            spool_dir: Spool batches that fail with a network error to this
+                directory and replay them later (buffered mode)
+            track_payloads: Also send the completion text with each event
+                (see EventPayload); by default only metrics are tracked
         """
-        self.client = LLMScopeClient(api_key, base_url)
+        self.client = LLMScopeClient(
+            api_key,
+            base_url,
+            buffered=buffered,
+            max_batch=batch_size,
+            flush_interval=flush_interval_s,
+            spool_dir=spool_dir
+        )
         self.project = project
         self.debug = debug
+        self.track_payloads = track_payloads
+        if debug:
+            _enable_debug_logging()
+        self._async_events: Optional[AsyncEventsClient] = None
+        self._async_loop = None
+        # Strong references keep fire-and-forget ingest tasks from being collected
+        self._pending: Set[asyncio.Task] = set()
+        self._seen_ids = _SeenIds()
+
+    async def aingest(self, event: Dict[str, Any]):
+        """
+        Ingest an event from async code without blocking the event loop
+
+        Buffered trackers only append to the in-memory queue. Unbuffered
+        trackers send the event with an `httpx` async client (pooled, HTTP/2
+        when available) bound to the running loop, or in a worker thread if
+        `httpx` is not installed.
+
+        Args:
+            event: Event data
+        """
+        events = self.client.events
+        if isinstance(events, BufferedEventsClient):
+            events.ingest(event)
+            return
+
+        loop = asyncio.get_running_loop()
+        if httpx is None:
+            await loop.run_in_executor(None, events.ingest, event)
+            return
+
+        # httpx connection pools are tied to the loop they were created on
+        if self._async_events is None or self._async_loop is not loop:
+            await self._close_async_events()
+            self._async_events = AsyncEventsClient(self.client.api_key, self.client.base_url)
+            self._async_loop = loop
+        await self._async_events.ingest(event)
+
+    async def _close_async_events(self):
+        """Close the async events client, if any, and forget it"""
+        events, self._async_events = self._async_events, None
+        self._async_loop = None
+        if events is None:
+            return
+        try:
+            await events.aclose()
+        except Exception as e:
+            # Connections bound to a loop that has since closed can't be
+            # shut down cleanly; they're gone either way
+            logger.debug("closing async events client failed: %s", e)
+
+    def ingest_nowait(self, event: Dict[str, Any]):
+        """
+        Ingest an event from async code without awaiting the send
+
+        Buffered trackers append to the queue right away. Otherwise the send
+        runs as a background task on the running loop, so the caller's
+        coroutine returns as soon as the provider response is available.
+        Use `aflush()` to wait for those tasks.
+
+        Args:
+            event: Event data
+        """
+        if isinstance(self.client.events, BufferedEventsClient):
+            self.client.events.ingest(event)
+            return
+
+        task = asyncio.get_running_loop().create_task(self.aingest(event))
+        self._pending.add(task)
+        task.add_done_callback(self._ingest_done)
+
+    def _ingest_done(self, task: asyncio.Task):
+        """Release a finished background ingest and report its failure"""
+        self._pending.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug("tracking error: %s", task.exception())
+
+    async def aflush(self):
+        """
+        Wait for background ingest tasks, then send all queued events
+
+        Call before the event loop shuts down so no tracked events are lost.
+        The async HTTP client is closed as well; a later `aingest()` opens a
+        new one.
+        """
+        while self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        await asyncio.get_running_loop().run_in_executor(None, self.flush)
+        await self._close_async_events()
 
     def trace(self, name: Optional[str] = None):
         """
@@ -171,65 +323,111 @@ class LLMScope:
             ```
         """
         def decorator(func: Callable):
+            # Resolved once per decorated function instead of on every call.
+            # The ingest path is looked up per call so patching or replacing
+            # `client.events` after decoration still takes effect.
+            span_name = name or func.__name__
+            extract_event = self._extract_event
+
+            # Only build the wrapper that matches the function type
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    start_ns = time.perf_counter_ns()
+
+                    try:
+                        result = await func(*args, **kwargs)
+                        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+
+                        # Try to extract and track metrics from result
+                        event = extract_event(result, duration_ms, span_name)
+                        if event:
+                            try:
+                                self.ingest_nowait(event)
+                            except Exception as e:
+                                # Don't fail user's code if tracking fails
+                                logger.debug("tracking error: %s", e)
+
+                        return result
+
+                    except Exception as e:
+                        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+                        self._track_error_nowait(e, duration_ms, span_name)
+                        raise
+
+                return async_wrapper
+
             @functools.wraps(func)
             def sync_wrapper(*args, **kwargs):
-                start_time = time.time()
-                span_name = name or func.__name__
+                start_ns = time.perf_counter_ns()
 
                 try:
                     result = func(*args, **kwargs)
-                    duration_ms = int((time.time() - start_time) * 1000)
+                    duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
                     # Try to extract and track metrics from result
-                    event = self._extract_event(result, duration_ms, span_name)
+                    event = extract_event(result, duration_ms, span_name)
                     if event:
                         try:
                             self.client.events.ingest(event)
                         except Exception as e:
                             # Don't fail user's code if tracking fails
-                            if self.debug:
-                                print(f"LLMScope tracking error: {e}")
+                            logger.debug("tracking error: %s", e)
 
                     return result
 
                 except Exception as e:
-                    duration_ms = int((time.time() - start_time) * 1000)
+                    duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
                     self._track_error(e, duration_ms, span_name)
                     raise
 
-            @functools.wraps(func)
-            async def async_wrapper(*args, **kwargs):
-                start_time = time.time()
-                span_name = name or func.__name__
+            return sync_wrapper
 
-                try:
-                    result = await func(*args, **kwargs)
-                    duration_ms = int((time.time() - start_time) * 1000)
+        return decorator
 
-                    # Try to extract and track metrics from result
-                    event = self._extract_event(result, duration_ms, span_name)
-                    if event:
-                        try:
-                            self.client.events.ingest(event)
-                        except Exception as e:
-                            # Don't fail user's code if tracking fails
-                            if self.debug:
-                                print(f"LLMScope tracking error: {e}")
+    @cached_property
+    def default_trace(self) -> Callable:
+        """
+        `trace()` decorator without a custom name, built once per tracker
 
-                    return result
+        Example:
+            ```python
+            @tracker.default_trace
+            def get_completion(prompt):
+                ...
+            ```
+        """
+        return self.trace()
 
-                except Exception as e:
-                    duration_ms = int((time.time() - start_time) * 1000)
-                    self._track_error(e, duration_ms, span_name)
-                    raise
+    def flush(self):
+        """
+        Send all queued events (buffered mode)
 
-            # Return appropriate wrapper based on function type
-            if inspect.iscoroutinefunction(func):
-                return async_wrapper
-            else:
-                return sync_wrapper
+        Call before the process exits so no tracked events are lost.
+        No-op when the tracker is not buffered.
+        """
+        if isinstance(self.client.events, BufferedEventsClient):
+            self.client.events.flush()
 
-        return decorator
+    def get_tracker_stats(self) -> dict:
+        """
+        Get buffering statistics for monitoring
+
+        Returns:
+            Dictionary with `buffered`, `dropped`, `inflight` and
+            `last_flush_ms` (see BufferedEventsClient.stats); all zero/None
+            when the tracker is not buffered
+
+        Example:
+            ```python
+            stats = tracker.get_tracker_stats()
+            if stats["dropped"]:
+                print(f"LLMScope dropped {stats['dropped']} events")
+            ```
+        """
+        if isinstance(self.client.events, BufferedEventsClient):
+            return self.client.events.stats()
+        return {"buffered": 0, "dropped": 0, "inflight": 0, "last_flush_ms": None}
 
     def track(self, name: Optional[str] = None) -> TrackingSpan:
         """
@@ -250,6 +448,19 @@ class LLMScope:
         """
         return TrackingSpan(self, name)
 
+    def _is_duplicate(self, result: Any) -> bool:
+        """
+        Check whether a response with the same id was already tracked
+
+        Retries and replaying middlewares can hand the same completion to
+        the tracker more than once; only the first sighting is ingested.
+        Results without a string `id` are never considered duplicates.
+        """
+        response_id = getattr(result, 'id', None)
+        if type(response_id) is not str:
+            return False
+        return not self._seen_ids.add(response_id)
+
     def _extract_event(
         self,
         result: Any,
@@ -257,20 +468,10 @@ class LLMScope:
         name: str
     ) -> Optional[Dict[str, Any]]:
         """Extract event data from LLM response"""
-        event = None
-
-        # Try OpenAI format
-        try:
-            event = extract_openai_metrics(result, duration_ms)
-        except:
-            pass
+        if self._is_duplicate(result):
+            return None
 
-        # Try Anthropic format
-        if event is None:
-            try:
-                event = extract_anthropic_metrics(result, duration_ms)
-            except:
-                pass
+        event = extract_metrics(result, duration_ms, self.track_payloads)
 
         # Add project if configured
         if event and self.project:
@@ -278,31 +479,33 @@ class LLMScope:
 
         # Add function name to metadata
         if event:
-            if 'metadata' not in event:
-                event['metadata'] = {}
             event['metadata']['function'] = name
 
         return event
 
-    def _track_error(self, error: Exception, duration_ms: int, name: str):
-        """Track error event"""
+    def _error_event(self, error: Exception, duration_ms: int, name: str) -> Dict[str, Any]:
+        """Build the event recorded for a failed call"""
         event = {
-            "model": "unknown",
-            "provider": "unknown",
-            "tokens_prompt": 0,
-            "tokens_completion": 0,
+            **_ERROR_TEMPLATE,
             "latency_ms": duration_ms,
-            "status": "error",
             "error_message": str(error),
-            "has_error": True,
             "metadata": {"function": name}
         }
 
         if self.project:
             event['project_id'] = self.project
+        return event
+
+    def _track_error(self, error: Exception, duration_ms: int, name: str):
+        """Track error event"""
+        try:
+            self.client.events.ingest(self._error_event(error, duration_ms, name))
+        except Exception as e:
+            logger.debug("error tracking failed: %s", e)
 
+    def _track_error_nowait(self, error: Exception, duration_ms: int, name: str):
+        """Track error event from async code without blocking the loop"""
         try:
-            self.client.events.ingest(event)
+            self.ingest_nowait(self._error_event(error, duration_ms, name))
         except Exception as e:
-            if self.debug:
-                print(f"LLMScope error tracking failed: {e}")
+            logger.debug("error tracking failed: %s", e)
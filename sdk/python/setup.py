@@ -32,9 +32,20 @@ setup(
     extras_require={
         "openai": ["openai>=1.0.0"],
         "anthropic": ["anthropic>=0.5.0"],
+        "async": ["httpx[http2]>=0.24.0"],
+        "fast": ["orjson>=3.6.0"],
+        "zstd": ["zstandard>=0.21.0"],
+        "protobuf": ["protobuf>=4.21.0"],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
+            # 1.x needs Python 3.9+; 0.24 is the last release supporting 3.8
+            # (it lacks asyncio_default_test_loop_scope, so async tests there
+            # get a loop per test)
+            "pytest-asyncio>=1.0.0; python_version>='3.9'",
+            "pytest-asyncio>=0.24.0,<0.25; python_version<'3.9'",
+            "pytest-benchmark>=4.0.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
             "mypy>=1.0.0",
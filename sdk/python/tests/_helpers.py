@@ -0,0 +1,38 @@
+"""Assertion helpers shared by the SDK test suite"""
+
+
+class _Absent:
+    def __repr__(self):
+        return "ABSENT"
+
+
+# Expected value for a key the event must not contain
+ABSENT = _Absent()
+
+
+def _subset(actual: dict, expected: dict) -> dict:
+    """Project `actual` onto the keys of `expected`, recursing into nested dicts"""
+    return {
+        key: _subset(actual[key], value)
+        if isinstance(value, dict) and isinstance(actual.get(key), dict)
+        else actual.get(key, ABSENT)
+        for key, value in expected.items()
+    }
+
+
+def assert_event(mock_ingest, **expected):
+    """
+    Assert the last event sent to `mock_ingest` contains `expected`
+
+    Compares one projected dict so a mismatch is reported as a single
+    diff. Nested dicts (e.g. `metadata`) are matched as subsets too; pass
+    `ABSENT` for keys the event must not have.
+
+    Example:
+        ```python
+        assert_event(mock_ingest, model="gpt-4", provider="openai",
+                     metadata={"function": "test_function"}, project_id=ABSENT)
+        ```
+    """
+    event = mock_ingest.call_args.args[0]
+    assert _subset(event, expected) == expected
@@ -0,0 +1,280 @@
+"""Shared fixtures for the SDK test suite"""
+import copy
+import importlib.util
+import logging
+import pytest
+
+try:
+    import pytest_benchmark
+except ImportError:
+    pytest_benchmark = None
+from types import SimpleNamespace as NS
+from typing import Any, List, Tuple
+from unittest.mock import MagicMock, patch
+from llmscope.analytics import AnalyticsClient
+from llmscope.client import shared_session
+from llmscope.events import EventsClient, BufferedEventsClient
+from llmscope.models import EventRequest
+from llmscope.tracker import LLMScope, _SeenIds
+
+# Give assert_event & co. pytest's assertion diffs
+pytest.register_assert_rewrite("tests._helpers")
+
+
+# The live provider tests import the real SDKs; skip collecting them when
+# either package is missing
+collect_ignore_glob = [] if all(
+    importlib.util.find_spec(name) for name in ("openai", "anthropic")
+) else ["integration/*"]
+
+
+if pytest_benchmark is None:
+    @pytest.fixture
+    def benchmark():
+        """
+        Stand-in for pytest-benchmark's fixture: call the function once, untimed
+
+        Benchmark tests then still run as smoke tests. The real fixture times
+        the function in-process, leaving pytest's per-test overhead out of
+        the measurement (`pip install -e ".[dev]"`).
+
+        Example:
+            ```python
+            def test_track_overhead(tracker, benchmark):
+                span = benchmark(tracker.track, "bench")
+                assert span.name == "bench"
+            ```
+        """
+        return lambda func, *args, **kwargs: func(*args, **kwargs)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--llmscope-fast", action="store_true",
+        help="Run only unit tests; skip tests marked `integration`"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("--llmscope-fast"):
+        return
+    skip = pytest.mark.skip(reason="--llmscope-fast: skipping integration test")
+    for item in items:
+        if item.get_closest_marker("integration"):
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def _openai_response_template():
+    """Canonical ChatCompletion attribute tree, built once per session"""
+    return NS(
+        model="gpt-4",
+        usage=NS(prompt_tokens=100, completion_tokens=50, total_tokens=150),
+        choices=[NS(message=NS(content="Test response"), finish_reason="stop")],
+        system_fingerprint=None
+    )
+
+
+@pytest.fixture(scope="session")
+def _anthropic_response_template():
+    """Canonical Anthropic Message attribute tree, built once per session"""
+    return NS(
+        model="claude-3-opus-20240229",
+        usage=NS(input_tokens=100, output_tokens=50),
+        content=[NS(text="This is a test response")],
+        stop_reason="end_turn",
+        role="assistant"
+    )
+
+
+@pytest.fixture
+def openai_response(_openai_response_template):
+    """
+    Copy of the OpenAI template that a test may mutate
+
+    `copy.copy` shares nested objects with the template, so top-level
+    attributes and the choices (list and entries) are copied; assign nested
+    objects such as `usage` instead of mutating them.
+    """
+    response = copy.copy(_openai_response_template)
+    response.choices = [copy.copy(choice) for choice in _openai_response_template.choices]
+    return response
+
+
+@pytest.fixture
+def anthropic_response(_anthropic_response_template):
+    """Copy of the Anthropic template that a test may mutate (see `openai_response`)"""
+    response = copy.copy(_anthropic_response_template)
+    response.content = list(_anthropic_response_template.content)
+    return response
+
+
+@pytest.fixture(scope="session")
+def make_event():
+    """
+    Build `EventRequest`s without running validation
+
+    For tests that send events rather than test the model itself; use the
+    real constructor where validation is under test.
+
+    Example:
+        ```python
+        event = make_event(model="gpt-4", provider="openai", tokens_prompt=1,
+                           tokens_completion=1, latency_ms=10)
+        ```
+    """
+    return EventRequest.model_construct
+
+
+class RecordingTransport:
+    """
+    Plain stand-in for a client's `_get`/`_post`/`_post_raw`
+
+    Cheaper than `patch.object` per test: records each call as
+    `(args, kwargs)` and returns `next_return`.
+
+    Example:
+        ```python
+        client._get.next_return = {"total_requests": 500}
+        client.get_metrics()
+        assert client._get.calls[-1] == (("/api/v1/analytics/metrics",), {"params": {}})
+        ```
+    """
+
+    def __init__(self):
+        self.calls: List[Tuple[tuple, dict]] = []
+        self.next_return: Any = None
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.next_return
+
+
+def _install_transports(client):
+    client._get = RecordingTransport()
+    client._post = RecordingTransport()
+    client._post_raw = RecordingTransport()
+    return client
+
+
+@pytest.fixture(scope="session")
+def http_session():
+    """
+    The "test-key" session every fixture client (and `tracker`) already shares
+
+    Pass it as `session=` when a test builds its own client, so the test
+    doesn't configure a new pool. Tests of session setup itself should call
+    `create_session` instead.
+    """
+    return shared_session("test-key")
+
+
+@pytest.fixture(scope="session")
+def _analytics_client(http_session):
+    """One AnalyticsClient shared by the whole run"""
+    return AnalyticsClient(api_key="test-key", base_url="http://localhost:8000", session=http_session)
+
+
+@pytest.fixture(scope="session")
+def _events_client(http_session):
+    """One EventsClient shared by the whole run"""
+    return EventsClient(api_key="test-key", base_url="http://localhost:8000", session=http_session)
+
+
+@pytest.fixture
+def analytics_client(_analytics_client):
+    """Shared AnalyticsClient with fresh RecordingTransports for this test"""
+    return _install_transports(_analytics_client)
+
+
+@pytest.fixture
+def events_client(_events_client):
+    """Shared EventsClient with fresh RecordingTransports for this test"""
+    return _install_transports(_events_client)
+
+
+@pytest.fixture(scope="session")
+def _tracker_template():
+    """One LLMScope (client, session) built per run; tests get copies"""
+    return LLMScope(
+        api_key="test-key",
+        base_url="http://localhost:8000",
+        project="test-project",
+        debug=False,
+        buffered=False
+    )
+
+
+def _copy_tracker(template, events_spec=BufferedEventsClient, **overrides):
+    tracker = copy.copy(template)
+    tracker.client = copy.copy(template.client)
+    # Stands in for the default buffered client without its flush thread;
+    # spec keeps the tracker's isinstance(…, BufferedEventsClient) paths
+    tracker.client.events = MagicMock(spec=events_spec)
+    tracker._async_events = None
+    tracker._async_loop = None
+    tracker._pending = set()
+    tracker._seen_ids = _SeenIds()
+    # Cached on first use and bound to the tracker it was built for
+    tracker.__dict__.pop('default_trace', None)
+    for name, value in overrides.items():
+        setattr(tracker, name, value)
+    return tracker
+
+
+@pytest.fixture
+def tracker(_tracker_template):
+    """Tracker for project "test-project" whose `client.events` is a fresh MagicMock"""
+    return _copy_tracker(_tracker_template)
+
+
+# Tracker fixtures `mock_ingest` follows, in order of preference
+_TRACKER_FIXTURES = ("tracker", "tracker_no_project", "tracker_unbuffered", "tracker_debug")
+
+
+@pytest.fixture
+def mock_ingest(request):
+    """
+    The test's tracker's `client.events.ingest` mock, to assert on tracked events
+
+    Follows whichever tracker fixture the test requested (`tracker` unless
+    it asked only for a variant such as `tracker_no_project`).
+    `client.events` is already a fresh mock per test, so nothing is patched.
+    """
+    name = next((n for n in _TRACKER_FIXTURES if n in request.fixturenames), "tracker")
+    return request.getfixturevalue(name).client.events.ingest
+
+
+@pytest.fixture
+def llmscope_logger():
+    """
+    The "llmscope" logger, with its level and handlers restored afterwards
+
+    `LLMScope(debug=True)` configures the process-wide logger; without this
+    the DEBUG level and stderr handler leak into later tests on the worker.
+    """
+    logger = logging.getLogger("llmscope")
+    level, handlers = logger.level, logger.handlers[:]
+    yield logger
+    logger.setLevel(level)
+    logger.handlers[:] = handlers
+
+
+@pytest.fixture
+def tracker_debug(_tracker_template, llmscope_logger):
+    """Like `tracker`, constructed with debug=True (reuses the template's client)"""
+    with patch("llmscope.tracker.LLMScopeClient", return_value=_tracker_template.client):
+        tracker = LLMScope(api_key="test-key", project="test-project", debug=True)
+    return _copy_tracker(tracker)
+
+
+@pytest.fixture
+def tracker_no_project(_tracker_template):
+    """Like `tracker`, without a project ID"""
+    return _copy_tracker(_tracker_template, project=None)
+
+
+@pytest.fixture
+def tracker_unbuffered(_tracker_template):
+    """Like `tracker`, but `client.events` mocks a plain (unbuffered) EventsClient"""
+    return _copy_tracker(_tracker_template, events_spec=EventsClient)
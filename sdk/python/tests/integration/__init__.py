@@ -0,0 +1 @@
+"""Live provider integration tests (run with: pytest -m live)"""
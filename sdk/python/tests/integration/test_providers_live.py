@@ -0,0 +1,90 @@
+"""Provider integration tests against the real openai/anthropic SDKs
+
+Collected only when both packages are installed (see tests/conftest.py)
+and deselected by default. Requests are stubbed at the SDK's `_post`,
+below the patched `create`, so no network access is needed.
+
+Run with: pytest -m live
+"""
+import pytest
+from unittest.mock import AsyncMock, patch
+import anthropic
+import openai
+from llmscope.integrations import patch_openai, unpatch_openai, patch_anthropic, unpatch_anthropic
+from .._helpers import assert_event
+
+pytestmark = pytest.mark.live
+
+MESSAGES = [{"role": "user", "content": "test"}]
+
+
+class TestOpenAILive:
+    """Patching the installed openai package"""
+
+    def test_patch_openai_basic(self, tracker, openai_response, mock_ingest):
+        """Test sync chat completions are tracked"""
+        client = openai.OpenAI(api_key="test-key")
+
+        patch_openai(tracker)
+        try:
+            with patch.object(client.chat.completions, '_post', return_value=openai_response):
+                response = client.chat.completions.create(model="gpt-4", messages=MESSAGES)
+
+            assert response is openai_response
+            mock_ingest.assert_called_once()
+            assert_event(mock_ingest, provider="openai")
+        finally:
+            unpatch_openai()
+
+    @pytest.mark.asyncio
+    async def test_patch_openai_async(self, tracker, openai_response, mock_ingest):
+        """Test async chat completions are tracked"""
+        client = openai.AsyncOpenAI(api_key="test-key")
+
+        patch_openai(tracker)
+        try:
+            with patch.object(client.chat.completions, '_post', AsyncMock(return_value=openai_response)):
+                response = await client.chat.completions.create(model="gpt-4", messages=MESSAGES)
+
+            assert response is openai_response
+            mock_ingest.assert_called_once()
+        finally:
+            unpatch_openai()
+
+
+class TestAnthropicLive:
+    """Patching the installed anthropic package"""
+
+    def test_patch_anthropic_basic(self, tracker, anthropic_response, mock_ingest):
+        """Test sync messages are tracked"""
+        client = anthropic.Anthropic(api_key="test-key")
+
+        patch_anthropic(tracker)
+        try:
+            with patch.object(client.messages, '_post', return_value=anthropic_response):
+                response = client.messages.create(
+                    model="claude-3-opus-20240229", max_tokens=16, messages=MESSAGES
+                )
+
+            assert response is anthropic_response
+            mock_ingest.assert_called_once()
+            assert_event(mock_ingest, provider="anthropic")
+        finally:
+            unpatch_anthropic()
+
+    @pytest.mark.asyncio
+    async def test_patch_anthropic_async(self, tracker, anthropic_response, mock_ingest):
+        """Test async messages are tracked"""
+        client = anthropic.AsyncAnthropic(api_key="test-key")
+
+        patch_anthropic(tracker)
+        try:
+            with patch.object(client.messages, '_post', AsyncMock(return_value=anthropic_response)):
+                response = await client.messages.create(
+                    model="claude-3-opus-20240229", max_tokens=16, messages=MESSAGES
+                )
+
+            assert response is anthropic_response
+            mock_ingest.assert_called_once()
+        finally:
+            unpatch_anthropic()
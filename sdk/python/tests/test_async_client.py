@@ -0,0 +1,73 @@
+"""Unit tests for the async client"""
+import asyncio
+import json
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytestmark = pytest.mark.asyncio
+
+from llmscope.async_client import AsyncEventsClient
+from llmscope.models import EventRequest, EventResponse, BatchIngestResponse
+
+
+def make_client(handler):
+    """Create AsyncEventsClient backed by an in-process mock transport"""
+    transport = httpx.MockTransport(handler)
+    return AsyncEventsClient(
+        api_key="test-key",
+        base_url="http://localhost:8000",
+        client=httpx.AsyncClient(transport=transport, headers={"X-API-Key": "test-key"})
+    )
+
+
+class TestAsyncEventsClient:
+    """Test suite for AsyncEventsClient"""
+
+    async def test_ingest_with_model(self):
+        """Test ingesting an EventRequest"""
+        def handler(request):
+            assert request.url.path == "/api/v1/events/ingest"
+            assert request.headers["X-API-Key"] == "test-key"
+            body = json.loads(request.content)
+            assert body["model"] == "gpt-4"
+            assert "user_id" not in body
+            return httpx.Response(200, json={"status": "queued", "event_id": "evt_123"})
+
+        async with make_client(handler) as client:
+            response = await client.ingest(EventRequest(
+                model="gpt-4",
+                provider="openai",
+                tokens_prompt=100,
+                tokens_completion=50,
+                latency_ms=1200
+            ))
+
+        assert isinstance(response, EventResponse)
+        assert response.event_id == "evt_123"
+
+    async def test_concurrent_ingest_batch(self):
+        """Test many batches can be in flight on one client"""
+        def handler(request):
+            count = len(json.loads(request.content)["events"])
+            return httpx.Response(200, json={
+                "status": "queued",
+                "count": count,
+                "event_ids": [f"evt_{i}" for i in range(count)]
+            })
+
+        async with make_client(handler) as client:
+            batch = [{"model": "gpt-4", "provider": "openai", "tokens_prompt": 1,
+                      "tokens_completion": 1, "latency_ms": 10}] * 2
+            responses = await asyncio.gather(*(client.ingest_batch(batch) for _ in range(5)))
+
+        assert len(responses) == 5
+        assert all(isinstance(r, BatchIngestResponse) and r.count == 2 for r in responses)
+
+    async def test_http_error_raises(self):
+        """Test HTTP errors are raised"""
+        def handler(request):
+            return httpx.Response(500, json={"detail": "boom"})
+
+        async with make_client(handler) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get_recent(limit=5)
@@ -0,0 +1,289 @@
+"""Unit tests for the base HTTP client"""
+import pytest
+from unittest.mock import Mock, patch
+from llmscope import client as client_module
+from llmscope.client import BaseClient, create_session
+from llmscope.llmscope_client import LLMScopeClient
+
+
+class TestBaseClient:
+    """Test suite for BaseClient"""
+
+    def test_creates_session_when_not_shared(self):
+        """Test standalone clients get their own configured session"""
+        client = BaseClient(api_key="test-key", base_url="http://localhost:8000/")
+
+        assert client.base_url == "http://localhost:8000"
+        assert client.session.headers["X-API-Key"] == "test-key"
+
+    def test_uses_shared_session(self):
+        """Test an explicitly passed session is reused"""
+        session = create_session("test-key")
+        client = BaseClient(api_key="test-key", session=session)
+
+        assert client.session is session
+
+    def test_session_pool_and_retries(self):
+        """Test the session adapter is pooled and retries gateway errors"""
+        session = create_session("test-key")
+        adapter = session.get_adapter("https://api.llmscope.dev")
+
+        assert adapter._pool_connections == 20
+        assert adapter._pool_maxsize == 100
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+
+    def test_exhausted_retries_raise_http_error(self):
+        """Test a persistent 5xx surfaces as a transient HTTPError, not a RetryError"""
+        import threading
+        import requests
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+        from llmscope.events import _is_transient
+
+        hits = []
+
+        class Unavailable(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hits.append(self.path)
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Unavailable)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        session = create_session("test-key")
+        adapter = session.get_adapter("http://127.0.0.1")
+        adapter.max_retries = adapter.max_retries.new(backoff_factor=0)
+        client = BaseClient("test-key", f"http://127.0.0.1:{server.server_port}", session=session)
+        try:
+            with pytest.raises(requests.HTTPError) as exc_info:
+                client._get("/api/v1/analytics/metrics")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert len(hits) == 4  # first attempt plus three retries
+        assert exc_info.value.response.status_code == 503
+        assert _is_transient(exc_info.value)
+
+    def test_session_enables_tcp_keepalive(self):
+        """Test pooled connections are created with SO_KEEPALIVE"""
+        import socket
+        session = create_session("test-key")
+        adapter = session.get_adapter("http://localhost:8000")
+
+        options = adapter.poolmanager.connection_pool_kw["socket_options"]
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in options
+
+    def test_verify_false_reaches_the_handshake(self):
+        """Test verify=False works like a stock session (no shared, verifying TLS context)"""
+        import socket
+        import threading
+        import requests
+
+        # Accepts and immediately closes: the TLS handshake fails, but only
+        # after requests has configured the connection for verify=False
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+
+        def serve():
+            conn, _ = server.accept()
+            conn.close()
+
+        thread = threading.Thread(target=serve, daemon=True)
+        thread.start()
+        session = create_session("test-key")
+        session.mount("https://", client_module.KeepAliveAdapter(max_retries=0))
+        try:
+            with pytest.raises(requests.ConnectionError):
+                session.get(f"https://127.0.0.1:{server.getsockname()[1]}/", verify=False, timeout=5)
+        finally:
+            thread.join(timeout=5)
+            server.close()
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_request_serializes_body(self, use_orjson):
+        """Test JSON body is pre-serialized and response decoded"""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        client = BaseClient(api_key="test-key")
+        response = Mock(content=b'{"status": "queued"}')
+
+        with patch.object(client_module, "orjson", client_module.orjson if use_orjson else None), \
+                patch.object(client.session, "request", return_value=response) as mock_request:
+            result = client._post("/api/v1/events/ingest", json={"model": "gpt-4", "metadata": {1: "a"}})
+
+        assert result == {"status": "queued"}
+        sent = mock_request.call_args.kwargs["data"]
+        assert isinstance(sent, bytes)
+        assert client_module._json.loads(sent) == {"model": "gpt-4", "metadata": {"1": "a"}}
+
+    @pytest.mark.parametrize("compression", ["gzip", "zstd"])
+    def test_large_body_is_compressed(self, compression):
+        """Test bodies over the threshold are compressed and labelled"""
+        import gzip
+        if compression == "zstd":
+            zstandard = pytest.importorskip("zstandard")
+        client = BaseClient(api_key="test-key", compression=compression)
+        body = {"events": [{"response": "x" * 100}] * 100}
+
+        with patch.object(client.session, "request", return_value=Mock(content=b'{}')) as mock_request:
+            client._post("/api/v1/events/ingest/batch", json=body)
+
+        kwargs = mock_request.call_args.kwargs
+        assert kwargs["headers"] == {"Content-Encoding": compression}
+        if compression == "gzip":
+            raw = gzip.decompress(kwargs["data"])
+        else:
+            raw = zstandard.ZstdDecompressor().decompress(kwargs["data"])
+        assert client_module._json.loads(raw) == body
+
+    def test_small_body_is_not_compressed(self):
+        """Test bodies under the threshold are sent as-is"""
+        client = BaseClient(api_key="test-key", compression="gzip")
+
+        with patch.object(client.session, "request", return_value=Mock(content=b'{}')) as mock_request:
+            client._post("/api/v1/events/ingest", json={"model": "gpt-4"})
+
+        assert mock_request.call_args.kwargs["headers"] is None
+        assert client_module._json.loads(mock_request.call_args.kwargs["data"]) == {"model": "gpt-4"}
+
+    def test_unsupported_compression(self):
+        """Test unknown encodings are rejected at construction"""
+        with pytest.raises(ValueError, match="Unsupported compression"):
+            BaseClient(api_key="test-key", compression="br")
+
+    @pytest.mark.parametrize("endpoint", ["/api/v1/events/ingest", "/api/v1/custom"])
+    def test_request_url(self, endpoint):
+        """Test known and unknown endpoints resolve against base_url"""
+        client = BaseClient(api_key="test-key", base_url="http://example.com/")
+
+        with patch.object(client.session, "request", return_value=Mock(content=b'{}')) as mock_request:
+            client._get(endpoint)
+            client._request("DELETE", endpoint)
+
+        get_call, delete_call = mock_request.call_args_list
+        assert get_call.args == ("GET", f"http://example.com{endpoint}")
+        assert delete_call.kwargs["url"] == f"http://example.com{endpoint}"
+
+    def test_request_without_body(self):
+        """Test GET requests send no body"""
+        client = BaseClient(api_key="test-key")
+        response = Mock(content=b'[]')
+
+        with patch.object(client.session, "request", return_value=response) as mock_request:
+            assert client._get("/api/v1/events/recent", params={"limit": 5}) == []
+
+        assert mock_request.call_args.kwargs["params"] == {"limit": 5}
+        assert "data" not in mock_request.call_args.kwargs
+
+    def test_session_methods_are_prebound(self):
+        """Test _get/_post go straight to the session's get/post"""
+        client = BaseClient(api_key="test-key")
+        client._session_post = Mock(return_value=Mock(content=b'{"ok": true}'))
+
+        assert client._post("/api/v1/events/ingest", json={"model": "gpt-4"}) == {"ok": True}
+        args, kwargs = client._session_post.call_args
+        assert args == ("http://localhost:8000/api/v1/events/ingest",)
+        assert kwargs["timeout"] == 30
+
+
+class TestRawPosts:
+    """Test suite for pre-serialized model bodies"""
+
+    def test_create_rule_posts_model_json(self):
+        """Test AlertRule models are sent as their JSON bytes"""
+        from llmscope.alerts import AlertsClient
+        from llmscope.models import AlertRule
+
+        client = AlertsClient(api_key="test-key")
+        client._session_post = Mock(return_value=Mock(content=b'{"id": "rule_1"}'))
+
+        rule = AlertRule(name="High Latency", condition="avg_latency_ms", threshold=2000.0)
+        assert client.create_rule(rule) == {"id": "rule_1"}
+
+        kwargs = client._session_post.call_args.kwargs
+        assert kwargs["data"] == rule.model_dump_json(exclude_none=True).encode("utf-8")
+
+    def test_create_api_key_with_dict(self):
+        """Test dict bodies still go through the JSON serializer"""
+        from llmscope.auth import AuthClient
+
+        client = AuthClient(api_key="test-key")
+        client._session_post = Mock(return_value=Mock(content=b'{"key": "k"}'))
+
+        assert client.create_api_key({"name": "Dev"}) == {"key": "k"}
+        assert client_module._json.loads(client._session_post.call_args.kwargs["data"]) == {"name": "Dev"}
+
+
+class TestLLMScopeClient:
+    """Test suite for LLMScopeClient"""
+
+    def test_sub_clients_share_one_session(self):
+        """Test all API modules reuse one connection pool"""
+        client = LLMScopeClient(api_key="test-key")
+
+        assert client.events.session is client.session
+        assert client.analytics.session is client.session
+        assert client.alerts.session is client.session
+        assert client.auth.session is client.session
+
+    def test_sub_clients_are_built_on_first_access(self):
+        """Test analytics/alerts/auth are created lazily and cached"""
+        client = LLMScopeClient(api_key="test-key")
+
+        assert "analytics" not in vars(client)
+        assert client.analytics is client.analytics
+        assert "analytics" in vars(client)
+
+    def test_clients_share_session_per_api_key(self):
+        """Test separate clients (e.g. two trackers) reuse the same pool"""
+        first = LLMScopeClient(api_key="test-key")
+        second = LLMScopeClient(api_key="test-key", base_url="http://other:8000")
+        other_key = LLMScopeClient(api_key="other-key")
+
+        assert first.session is second.session
+        assert other_key.session is not first.session
+        assert other_key.session.headers["X-API-Key"] == "other-key"
+
+    def test_close_releases_shared_session(self):
+        """Test the shared session is dropped and closed once its last client closes"""
+        first = LLMScopeClient(api_key="close-key")
+        second = LLMScopeClient(api_key="close-key")
+        session = first.session
+
+        with patch.object(session, 'close') as mock_close:
+            first.close()
+            first.close()  # idempotent: must not release second's share
+            assert client_module._shared_sessions["close-key"][0] is session
+            mock_close.assert_not_called()
+
+            second.close()
+            mock_close.assert_called_once()
+        assert "close-key" not in client_module._shared_sessions
+
+        with LLMScopeClient(api_key="close-key") as third:
+            assert third.session is not session
+        assert "close-key" not in client_module._shared_sessions
+
+    def test_close_flushes_buffered_events(self):
+        """Test close() stops the buffered client's flush thread"""
+        client = LLMScopeClient(api_key="close-key", buffered=True)
+        thread = client.events._thread
+
+        client.close()
+
+        assert not thread.is_alive()
+
+    def test_buffered_events_share_session(self):
+        """Test buffered events client also uses the shared session"""
+        client = LLMScopeClient(api_key="test-key", buffered=True)
+
+        assert client.events.session is client.session
+        client.events.close()
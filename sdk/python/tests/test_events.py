@@ -1,114 +1,411 @@
 """Unit tests for Events API"""
+import json
 import pytest
 from unittest.mock import Mock, patch
-from llmscope.events import EventsClient
+from llmscope.events import EventsClient, BufferedEventsClient
 from llmscope.models import EventRequest, EventResponse, BatchIngestResponse
 
+# Canned API responses; the clients only read them
+_EVT_123 = {"status": "queued", "event_id": "evt_123"}
+_EVT_456 = {"status": "queued", "event_id": "evt_456"}
+_BATCH_RESP = {"status": "queued", "count": 2, "event_ids": ["evt_1", "evt_2"]}
+
 
 class TestEventsClient:
     """Test suite for EventsClient"""
 
     @pytest.fixture
-    def client(self):
-        """Create EventsClient instance"""
-        return EventsClient(api_key="test-key", base_url="http://localhost:8000")
+    def client(self, _events_client):
+        """Shared EventsClient; tests patch its session and restore it on exit"""
+        return _events_client
 
-    def test_ingest_with_dict(self, client):
+    def test_ingest_with_dict(self, events_client):
         """Test ingesting event with dict"""
-        with patch.object(client, '_post') as mock_post:
-            mock_post.return_value = {"status": "queued", "event_id": "evt_123"}
+        events_client._post.next_return = _EVT_123
 
-            event_data = {
-                "model": "gpt-4",
-                "provider": "openai",
-                "tokens_prompt": 100,
-                "tokens_completion": 50,
-                "latency_ms": 1200
-            }
+        event_data = {
+            "model": "gpt-4",
+            "provider": "openai",
+            "tokens_prompt": 100,
+            "tokens_completion": 50,
+            "latency_ms": 1200
+        }
 
-            response = client.ingest(event_data)
+        response = events_client.ingest(event_data)
 
-            assert isinstance(response, EventResponse)
-            assert response.event_id == "evt_123"
-            assert response.status == "queued"
-            mock_post.assert_called_once()
+        assert isinstance(response, EventResponse)
+        assert response.event_id == "evt_123"
+        assert response.status == "queued"
+        assert len(events_client._post.calls) == 1
 
-    def test_ingest_with_model(self, client):
+    def test_ingest_with_model(self, events_client, make_event):
         """Test ingesting event with EventRequest model"""
-        with patch.object(client, '_post') as mock_post:
-            mock_post.return_value = {"status": "queued", "event_id": "evt_456"}
+        events_client._post_raw.next_return = _EVT_456
 
-            event = EventRequest(
-                model="gpt-4",
-                provider="openai",
-                tokens_prompt=100,
-                tokens_completion=50,
-                latency_ms=1200
-            )
+        event = make_event(
+            model="gpt-4",
+            provider="openai",
+            tokens_prompt=100,
+            tokens_completion=50,
+            latency_ms=1200
+        )
 
-            response = client.ingest(event)
+        response = events_client.ingest(event)
 
-            assert isinstance(response, EventResponse)
-            assert response.event_id == "evt_456"
-            mock_post.assert_called_once()
+        assert isinstance(response, EventResponse)
+        assert response.event_id == "evt_456"
+        assert events_client._post_raw.calls == [(
+            ("/api/v1/events/ingest", event.model_dump_json(exclude_none=True).encode("utf-8")),
+            {}
+        )]
 
-    def test_ingest_batch(self, client):
+    def test_ingest_batch(self, events_client):
         """Test batch ingestion"""
-        with patch.object(client, '_post') as mock_post:
-            mock_post.return_value = {
-                "status": "queued",
-                "count": 2,
-                "event_ids": ["evt_1", "evt_2"]
-            }
-
-            events = [
-                {"model": "gpt-4", "provider": "openai", "tokens_prompt": 100,
-                 "tokens_completion": 50, "latency_ms": 1200},
-                {"model": "claude-3", "provider": "anthropic", "tokens_prompt": 150,
-                 "tokens_completion": 75, "latency_ms": 1500}
-            ]
-
-            response = client.ingest_batch(events)
-
-            assert isinstance(response, BatchIngestResponse)
-            assert response.count == 2
-            assert len(response.event_ids) == 2
-            mock_post.assert_called_once()
-
-    def test_get_recent(self, client):
+        events_client._post.next_return = _BATCH_RESP
+
+        events = [
+            {"model": "gpt-4", "provider": "openai", "tokens_prompt": 100,
+             "tokens_completion": 50, "latency_ms": 1200},
+            {"model": "claude-3", "provider": "anthropic", "tokens_prompt": 150,
+             "tokens_completion": 75, "latency_ms": 1500}
+        ]
+
+        response = events_client.ingest_batch(events)
+
+        assert isinstance(response, BatchIngestResponse)
+        assert response.count == 2
+        assert len(response.event_ids) == 2
+        assert len(events_client._post.calls) == 1
+
+    def test_ingest_batch_with_models(self, events_client):
+        """Test batch ingestion of EventRequest models posts model JSON bytes"""
+        events_client._post_raw.next_return = _BATCH_RESP
+
+        events = [
+            EventRequest(model="gpt-4", provider="openai", tokens_prompt=100,
+                         tokens_completion=50, latency_ms=1200),
+            EventRequest(model="claude-3", provider="anthropic", tokens_prompt=150,
+                         tokens_completion=75, latency_ms=1500, metadata={"k": "v"})
+        ]
+
+        response = events_client.ingest_batch(events)
+
+        endpoint, body = events_client._post_raw.calls[-1][0]
+        assert endpoint == "/api/v1/events/ingest/batch"
+        assert json.loads(body)["events"] == [
+            e.model_dump(mode="json", exclude_none=True) for e in events
+        ]
+        assert response.event_ids == ["evt_1", "evt_2"]
+
+    def test_ingest_batch_mixed(self, events_client):
+        """Test batch ingestion of mixed models and dicts"""
+        events_client._post.next_return = {"status": "queued", "count": 2, "event_ids": ["a", "b"]}
+
+        event = EventRequest(model="gpt-4", provider="openai", tokens_prompt=100,
+                             tokens_completion=50, latency_ms=1200)
+        raw = {"model": "claude-3", "provider": "anthropic", "tokens_prompt": 1,
+               "tokens_completion": 1, "latency_ms": 1}
+
+        events_client.ingest_batch([event, raw])
+
+        sent = events_client._post.calls[-1][1]["json"]["events"]
+        assert sent == [event.model_dump(exclude_none=True), raw]
+
+    def test_ingest_batch_protobuf(self, http_session):
+        """Test protobuf batches round-trip and fall back to JSON on 415"""
+        pytest.importorskip("google.protobuf")
+        from llmscope.proto import events_pb2
+
+        client = EventsClient(api_key="test-key", base_url="http://localhost:8000",
+                              session=http_session, protobuf=True)
+        events = [{"model": "gpt-4", "provider": "openai", "tokens_prompt": 0,
+                   "tokens_completion": 5, "latency_ms": 10, "metadata": {"k": "v"}}]
+        ok = Mock(status_code=200, content=b'{"status": "queued", "count": 1, "event_ids": ["e"]}')
+
+        with patch.object(client.session, 'post', return_value=ok) as mock_post:
+            assert client.ingest_batch(events).count == 1
+
+        kwargs = mock_post.call_args.kwargs
+        assert kwargs["headers"]["Content-Type"] == "application/x-protobuf"
+        batch = events_pb2.BatchIngestRequest.FromString(kwargs["data"])
+        assert batch.events[0].model == "gpt-4"
+        assert batch.events[0].HasField("tokens_prompt")
+        assert batch.events[0].metadata["k"] == "v"
+
+        json_response = {"status": "queued", "count": 1, "event_ids": ["e"]}
+        with patch.object(client.session, 'post', return_value=Mock(status_code=415)), \
+                patch.object(client, '_post', return_value=json_response) as mock_json:
+            assert client.ingest_batch(events).count == 1
+            mock_json.assert_called_once()
+
+        assert client._protobuf is False
+
+    def test_backend_protobuf_bindings_coexist(self):
+        """Test the backend's protobuf bindings load next to the SDK's and decode its batches"""
+        pytest.importorskip("google.protobuf")
+        import importlib.util
+        from pathlib import Path
+        from llmscope.proto import encode_batch, events_pb2
+
+        path = Path(__file__).parents[3] / "backend" / "app" / "proto" / "events_pb2.py"
+        if not path.exists():
+            pytest.skip("backend sources not available")
+        spec = importlib.util.spec_from_file_location("backend_events_pb2", path)
+        backend_pb2 = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(backend_pb2)  # raises on a descriptor pool conflict
+
+        def fields(message):
+            return {(f.name, f.number, f.type) for f in message.DESCRIPTOR.fields}
+
+        assert fields(backend_pb2.Event) == fields(events_pb2.Event)
+        batch = backend_pb2.BatchIngestRequest.FromString(
+            encode_batch([{"model": "gpt-4", "latency_ms": 0}])
+        )
+        assert batch.events[0].model == "gpt-4"
+        assert batch.events[0].HasField("latency_ms")
+
+    def test_ingest_stream(self, client):
+        """Test streamed ingestion sends NDJSON lazily from an iterable"""
+        import json
+
+        def events():
+            for i in range(3):
+                yield {"model": "gpt-4", "provider": "openai", "tokens_prompt": i,
+                       "tokens_completion": 0, "latency_ms": 10}
+            yield EventRequest(model="claude-3", provider="anthropic", tokens_prompt=1,
+                               tokens_completion=1, latency_ms=1)
+
+        response_body = b'{"status": "accepted", "count": 4, "event_ids": ["a", "b", "c", "d"]}'
+        with patch.object(client.session, 'post', return_value=Mock(content=response_body)) as mock_post:
+            response = client.ingest_stream(events())
+
+            assert response.count == 4
+            args, kwargs = mock_post.call_args
+            assert args[0] == "http://localhost:8000/api/v1/events/ingest/stream"
+            assert kwargs["headers"]["Content-Type"] == "application/x-ndjson"
+            body = b"".join(kwargs["data"])
+
+        lines = [json.loads(line) for line in body.splitlines()]
+        assert [e["tokens_prompt"] for e in lines] == [0, 1, 2, 1]
+        assert lines[-1]["provider"] == "anthropic"
+
+    def test_get_recent(self, events_client):
         """Test getting recent events"""
-        with patch.object(client, '_get') as mock_get:
-            mock_get.return_value = [
-                {"event_id": "evt_1", "model": "gpt-4"},
-                {"event_id": "evt_2", "model": "claude-3"}
-            ]
+        events_client._get.next_return = [
+            {"event_id": "evt_1", "model": "gpt-4"},
+            {"event_id": "evt_2", "model": "claude-3"}
+        ]
 
-            events = client.get_recent(limit=50)
+        events = events_client.get_recent(limit=50)
 
-            assert len(events) == 2
-            mock_get.assert_called_once_with("/api/v1/events/recent", params={"limit": 50})
+        assert len(events) == 2
+        assert events_client._get.calls == [
+            (("/api/v1/events/recent",), {"params": {"limit": 50}})
+        ]
 
-    def test_get_stats(self, client):
+    def test_get_stats(self, events_client):
         """Test getting processing stats"""
-        with patch.object(client, '_get') as mock_get:
-            mock_get.return_value = {
-                "total_events": 1000,
-                "queue_length": 5,
-                "dlq_length": 0
-            }
+        events_client._get.next_return = {
+            "total_events": 1000,
+            "queue_length": 5,
+            "dlq_length": 0
+        }
 
-            stats = client.get_stats()
+        stats = events_client.get_stats()
 
-            assert stats["total_events"] == 1000
-            assert stats["queue_length"] == 5
-            mock_get.assert_called_once()
+        assert stats["total_events"] == 1000
+        assert stats["queue_length"] == 5
+        assert len(events_client._get.calls) == 1
 
-    def test_get_queue_stats(self, client):
+    def test_get_queue_stats(self, events_client):
         """Test getting queue stats"""
-        with patch.object(client, '_get') as mock_get:
-            mock_get.return_value = {"pending": 5, "processing": 2}
+        events_client._get.next_return = {"pending": 5, "processing": 2}
+
+        queue_stats = events_client.get_queue_stats()
+
+        assert queue_stats["pending"] == 5
+        assert len(events_client._get.calls) == 1
+
+
+class TestBufferedEventsClient:
+    """Test suite for BufferedEventsClient"""
+
+    @pytest.fixture
+    def client(self, http_session):
+        """Create BufferedEventsClient instance"""
+        client = BufferedEventsClient(
+            api_key="test-key",
+            base_url="http://localhost:8000",
+            session=http_session,
+            max_batch=2,
+            flush_interval=0.01
+        )
+        yield client
+        client.close()
+
+    def test_max_batch_capped_at_server_limit(self, http_session):
+        """Test batches never exceed the server's per-request event limit"""
+        from llmscope.events import MAX_BATCH_SIZE
+
+        client = BufferedEventsClient(api_key="test-key", session=http_session,
+                                      max_batch=500, flush_interval=0.01)
+        try:
+            assert client.max_batch == MAX_BATCH_SIZE
+
+            with patch.object(client, 'ingest_batch') as mock_batch:
+                for i in range(250):
+                    client.ingest({"model": "gpt-4", "i": i})
+                client.flush()
+
+            sizes = [len(call[0][0]) for call in mock_batch.call_args_list]
+            assert sum(sizes) == 250
+            assert max(sizes) <= MAX_BATCH_SIZE
+        finally:
+            client.close()
+
+    def test_ingest_is_queued_and_batched(self, client):
+        """Test single-event ingestion is coalesced into batch requests"""
+        with patch.object(client, '_post') as mock_post:
+            mock_post.return_value = {"status": "queued", "count": 1, "event_ids": ["evt_1"]}
+
+            for i in range(3):
+                assert client.ingest({"model": "gpt-4", "provider": "openai",
+                                      "tokens_prompt": i, "tokens_completion": 0,
+                                      "latency_ms": 10}) is None
+            client.flush()
+
+            sent = [e for call in mock_post.call_args_list for e in call.kwargs['json']['events']]
+            assert [e['tokens_prompt'] for e in sent] == [0, 1, 2]
+            assert all(call.args[0] == "/api/v1/events/ingest/batch"
+                       for call in mock_post.call_args_list)
+
+    def test_send_failure_is_recorded(self, client):
+        """Test background failures don't raise and are recorded"""
+        with patch.object(client, '_post', side_effect=Exception("API Error")):
+            client.ingest({"model": "gpt-4"})
+            client.flush()
+
+        assert str(client.last_error) == "API Error"
+
+    def test_full_buffer_drops_oldest(self, http_session):
+        """Test ingest never blocks and keeps the newest events when full"""
+        client = BufferedEventsClient(
+            api_key="test-key",
+            base_url="http://localhost:8000",
+            session=http_session,
+            max_batch=100,
+            flush_interval=10,
+            max_queue=3
+        )
+        try:
+            with patch.object(client, '_post') as mock_post:
+                mock_post.return_value = {"status": "queued", "count": 3, "event_ids": []}
+                for i in range(5):
+                    client.ingest({"seq": i})
+                client.flush()
+
+            sent = [e["seq"] for call in mock_post.call_args_list for e in call.kwargs['json']['events']]
+            assert sent == [2, 3, 4]
+
+            stats = client.stats()
+            assert stats["dropped"] == 2
+            assert stats["buffered"] == 0
+            assert stats["inflight"] == 0
+            assert stats["last_flush_ms"] is not None
+        finally:
+            client.close()
+
+    def test_dropped_events_reported_after_successful_flush(self, caplog, http_session):
+        """Test evictions are logged once the backend accepts a batch again"""
+        import logging
+
+        client = BufferedEventsClient(
+            api_key="test-key",
+            session=http_session,
+            max_batch=100,
+            flush_interval=10,
+            max_queue=3
+        )
+        try:
+            with patch.object(client, 'ingest_batch'), \
+                    caplog.at_level(logging.WARNING, logger="llmscope"):
+                for i in range(5):
+                    client.ingest({"seq": i})
+                client.flush()
+                client.ingest({"seq": 5})
+                client.flush()
+
+            warnings = [r.getMessage() for r in caplog.records if r.name == "llmscope"]
+            assert warnings == ["dropped 2 events because the buffer was full (max_queue=3)"]
+        finally:
+            client.close()
+
+    def test_network_failure_is_spooled_and_replayed(self, tmp_path, http_session):
+        """Test batches that fail with a network error are replayed later"""
+        import requests
+
+        client = BufferedEventsClient(
+            api_key="test-key",
+            base_url="http://localhost:8000",
+            session=http_session,
+            flush_interval=0.01,
+            spool_dir=tmp_path
+        )
+        try:
+            with patch.object(client, '_post', side_effect=requests.ConnectionError("down")):
+                client.ingest({"model": "gpt-4"})
+                client.flush()
+
+            assert len(client.spool.pending()) == 1
+
+            with patch.object(client, '_post') as mock_post:
+                mock_post.return_value = {"status": "queued", "count": 1, "event_ids": ["evt_1"]}
+                client.ingest({"model": "claude-3"})
+                client.flush()
+
+            sent = [e["model"] for call in mock_post.call_args_list for e in call.kwargs['json']['events']]
+            assert sent == ["claude-3", "gpt-4"]
+            assert client.spool.pending() == []
+        finally:
+            client.close()
+
+    def test_spool_is_only_scanned_when_dirty(self, tmp_path, http_session):
+        """Test successful sends don't glob the spool directory once it is empty"""
+        client = BufferedEventsClient(
+            api_key="test-key",
+            base_url="http://localhost:8000",
+            session=http_session,
+            flush_interval=0.01,
+            spool_dir=tmp_path
+        )
+        ok = {"status": "queued", "count": 1, "event_ids": ["evt_1"]}
+        try:
+            with patch.object(client, '_post', return_value=ok), \
+                    patch.object(client.spool, 'drain', wraps=client.spool.drain) as mock_drain:
+                client.ingest({"seq": 1})
+                client.flush()
+                drains = mock_drain.call_count
+
+                client.ingest({"seq": 2})
+                client.flush()
+                assert mock_drain.call_count == drains
+
+                client._spool_write([{"seq": 0}])
+                client.ingest({"seq": 3})
+                client.flush()
+                assert mock_drain.call_count == drains + 1
+            assert client.spool.pending() == []
+        finally:
+            client.close()
+
+    def test_buffered_ingestion_context_manager(self, http_session):
+        """Test buffered_ingestion() flushes on exit"""
+        client = EventsClient(api_key="test-key", base_url="http://localhost:8000", session=http_session)
 
-            queue_stats = client.get_queue_stats()
+        with patch.object(BufferedEventsClient, 'ingest_batch') as mock_batch:
+            with client.buffered_ingestion(flush_interval=10) as buf:
+                buf.ingest({"model": "gpt-4"})
+                buf.ingest({"model": "claude-3"})
 
-            assert queue_stats["pending"] == 5
-            mock_get.assert_called_once()
\ No newline at end of file
+            mock_batch.assert_called_once()
+            assert len(mock_batch.call_args[0][0]) == 2
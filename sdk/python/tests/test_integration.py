@@ -12,24 +12,48 @@ Set environment variables to override:
 """
 import pytest
 import os
-from llmscope import LLMScopeClient, EventRequest, AlertRule, APIKeyCreate
+import socket
+from urllib.parse import urlparse
+from llmscope import LLMScopeClient, AlertRule, APIKeyCreate
 from datetime import datetime, timedelta
 
+BASE_URL = os.getenv("LLMSCOPE_BASE_URL", "http://localhost:8000")
 
-@pytest.fixture
+
+def _server_alive(url: str) -> bool:
+    """Probe the API port once so a missing server skips the module quickly"""
+    parsed = urlparse(url)
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    try:
+        socket.create_connection((parsed.hostname, port), timeout=0.1).close()
+        return True
+    except OSError:
+        return False
+
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(not _server_alive(BASE_URL), reason=f"LLMScope API not reachable at {BASE_URL}"),
+]
+
+_SKIP_UNIMPLEMENTED = pytest.mark.skip(
+    reason="Analytics/Alerts/Auth API not fully implemented - returns placeholder data"
+)
+
+
+@pytest.fixture(scope="module")
 def client():
-    """Create LLMScope client - uses single-tenant default if not set"""
+    """Create one LLMScope client per module - uses single-tenant default if not set"""
     api_key = os.getenv("LLMSCOPE_API_KEY", "llmscope-local-key")
-    base_url = os.getenv("LLMSCOPE_BASE_URL", "http://localhost:8000")
-    return LLMScopeClient(api_key=api_key, base_url=base_url)
+    return LLMScopeClient(api_key=api_key, base_url=BASE_URL)
 
 
 class TestEventsIntegration:
     """Integration tests for Events API"""
 
-    def test_ingest_single_event(self, client):
+    def test_ingest_single_event(self, client, make_event):
         """Test ingesting a single event"""
-        event = EventRequest(
+        event = make_event(
             model="gpt-4",
             provider="openai",
             tokens_prompt=100,
@@ -43,7 +67,6 @@ class TestEventsIntegration:
 
         assert response.status == "queued"
         assert response.event_id is not None
-        print(f"✅ Event ingested: {response.event_id}")
 
     def test_ingest_batch(self, client):
         """Test batch ingestion"""
@@ -69,27 +92,24 @@ class TestEventsIntegration:
         assert response.status == "queued"
         assert response.count == 2
         assert len(response.event_ids) == 2
-        print(f"✅ Batch ingested: {response.count} events")
 
     def test_get_recent_events(self, client):
         """Test getting recent events"""
         events = client.events.get_recent(limit=10)
 
         assert isinstance(events, list)
-        print(f"✅ Retrieved {len(events)} recent events")
 
     def test_get_stats(self, client):
         """Test getting processing stats"""
         stats = client.events.get_stats()
 
         assert "total_events" in stats or "queue_length" in stats
-        print(f"✅ Stats: {stats}")
 
 
 # NOTE: Analytics, Alerts, and Auth APIs are not fully implemented yet
 # They return placeholder/TODO responses, so integration tests are skipped
 
-@pytest.mark.skip(reason="Analytics API not fully implemented - returns placeholder data")
+@_SKIP_UNIMPLEMENTED
 class TestAnalyticsIntegration:
     """Integration tests for Analytics API (SKIPPED - not implemented)"""
 
@@ -104,7 +124,6 @@ class TestAnalyticsIntegration:
         )
 
         assert isinstance(metrics, dict)
-        print(f"✅ Metrics: {metrics}")
 
     def test_get_costs(self, client):
         """Test getting cost breakdown"""
@@ -117,10 +136,9 @@ class TestAnalyticsIntegration:
         )
 
         assert isinstance(costs, dict)
-        print(f"✅ Costs: {costs}")
 
 
-@pytest.mark.skip(reason="Alerts API not fully implemented - returns placeholder data")
+@_SKIP_UNIMPLEMENTED
 class TestAlertsIntegration:
     """Integration tests for Alerts API (SKIPPED - not implemented)"""
 
@@ -129,7 +147,6 @@ class TestAlertsIntegration:
         rules = client.alerts.list_rules()
 
         assert isinstance(rules, list)
-        print(f"✅ Retrieved {len(rules)} alert rules")
 
     def test_create_alert_rule(self, client):
         """Test creating an alert rule"""
@@ -143,10 +160,9 @@ class TestAlertsIntegration:
         created_rule = client.alerts.create_rule(rule)
 
         assert isinstance(created_rule, dict)
-        print(f"✅ Created alert rule: {created_rule}")
 
 
-@pytest.mark.skip(reason="Auth API not fully implemented - returns placeholder data")
+@_SKIP_UNIMPLEMENTED
 class TestAuthIntegration:
     """Integration tests for Auth API (SKIPPED - not implemented)"""
 
@@ -155,7 +171,6 @@ class TestAuthIntegration:
         keys = client.auth.list_api_keys()
 
         assert isinstance(keys, list)
-        print(f"✅ Retrieved {len(keys)} API keys")
 
     def test_create_api_key(self, client):
         """Test creating an API key"""
@@ -167,5 +182,3 @@ class TestAuthIntegration:
         created_key = client.auth.create_api_key(key)
 
         assert "key" in created_key
-        print(f"✅ Created API key: {created_key['name']}")
-        print(f"   Key: {created_key['key']}")
\ No newline at end of file
@@ -0,0 +1,167 @@
+"""Unit tests for the Anthropic integration (monkey-patching)"""
+import copy
+import inspect
+import sys
+import types
+import pytest
+from unittest.mock import patch, AsyncMock
+from llmscope.integrations import patch_anthropic, unpatch_anthropic, anthropic_patch
+from ._helpers import assert_event
+
+# Patching mutates process-wide provider classes: keep this module on one
+# xdist worker under --dist=loadgroup too (loadfile already does)
+pytestmark = pytest.mark.xdist_group("anthropic_patch")
+
+
+class TestAnthropicIntegration:
+    """Test suite for Anthropic integration"""
+
+    @pytest.fixture
+    def fake_anthropic(self, anthropic_response):
+        """Install a minimal stand-in for anthropic.resources.messages"""
+        def make_response(**kwargs):
+            response = copy.copy(anthropic_response)
+            response.model = kwargs.get("model", response.model)
+            return response
+
+        class Messages:
+            def create(self, **kwargs):
+                """Create a message"""
+                return make_response(**kwargs)
+
+        class AsyncMessages:
+            async def create(self, **kwargs):
+                return make_response(**kwargs)
+
+        messages = types.ModuleType("anthropic.resources.messages")
+        messages.Messages = Messages
+        messages.AsyncMessages = AsyncMessages
+        resources = types.ModuleType("anthropic.resources")
+        resources.messages = messages
+        anthropic = types.ModuleType("anthropic")
+        anthropic.resources = resources
+
+        with patch.dict(sys.modules, {
+            "anthropic": anthropic,
+            "anthropic.resources": resources,
+            "anthropic.resources.messages": messages,
+        }):
+            yield messages
+
+    def test_patch_anthropic_class_level(self, tracker, fake_anthropic, mock_ingest):
+        """Test patching wraps Messages.create at class level and restores it"""
+        original = fake_anthropic.Messages.create
+        patch_anthropic(tracker)
+        try:
+            patched = fake_anthropic.Messages.create
+            assert patched is not original
+            assert patched._llmscope_original is original
+            assert patched.__doc__ == original.__doc__
+
+            # Patching twice does not double-wrap
+            patch_anthropic(tracker)
+            assert fake_anthropic.Messages.create._llmscope_original is original
+
+            fake_anthropic.Messages().create(model="claude-3-opus-20240229", messages=[])
+
+            mock_ingest.assert_called_once()
+            assert_event(mock_ingest, provider="anthropic", metadata={"auto_tracked": True})
+        finally:
+            unpatch_anthropic()
+
+        assert fake_anthropic.Messages.create is original
+
+    def test_patch_anthropic_tracking_failure_does_not_raise(self, tracker, fake_anthropic):
+        """Test ingest failures never surface to the caller"""
+        patch_anthropic(tracker)
+        try:
+            with patch.object(tracker.client.events, 'ingest', side_effect=Exception("down")), \
+                    patch.object(tracker, '_track_error') as mock_track_error:
+                response = fake_anthropic.Messages().create(model="claude-3-opus-20240229")
+
+            assert response.stop_reason == "end_turn"
+            mock_track_error.assert_not_called()
+        finally:
+            unpatch_anthropic()
+
+    def test_patch_anthropic_specializes_on_first_call(self, tracker, fake_anthropic, mock_ingest):
+        """Test the fast path is built lazily once per patch"""
+        patch_anthropic(tracker)
+        try:
+            assert anthropic_patch._state.track is None
+
+            fake_anthropic.Messages().create(model="claude-3-opus-20240229")
+            fast_track = anthropic_patch._state.track
+            fake_anthropic.Messages().create(model="claude-3-opus-20240229")
+
+            assert fast_track is not None
+            assert anthropic_patch._state.track is fast_track
+            assert mock_ingest.call_count == 2
+            assert_event(mock_ingest, project_id="test-project")
+
+            patch_anthropic(tracker)
+            assert anthropic_patch._state.track is None
+        finally:
+            unpatch_anthropic()
+
+    def test_patching_ingest_after_first_call(self, tracker, fake_anthropic):
+        """Test the cached fast path still resolves the ingest path per call"""
+        patch_anthropic(tracker)
+        try:
+            fake_anthropic.Messages().create(model="claude-3-opus-20240229")
+            assert anthropic_patch._state.track is not None
+
+            with patch.object(tracker.client.events, 'ingest') as patched:
+                fake_anthropic.Messages().create(model="claude-3-opus-20240229")
+
+            patched.assert_called_once()
+            assert_event(patched, model="claude-3-opus-20240229")
+        finally:
+            unpatch_anthropic()
+
+    @pytest.mark.asyncio
+    async def test_patch_anthropic_async(self, tracker, fake_anthropic, mock_ingest):
+        """Test the async wrapper stays a coroutine function and tracks the call"""
+        patch_anthropic(tracker)
+        try:
+            assert inspect.iscoroutinefunction(fake_anthropic.AsyncMessages.create)
+
+            response = await fake_anthropic.AsyncMessages().create(model="claude-3-opus-20240229")
+
+            assert response.stop_reason == "end_turn"
+            mock_ingest.assert_called_once()
+        finally:
+            unpatch_anthropic()
+
+    @pytest.mark.asyncio
+    async def test_patch_anthropic_async_error(self, tracker_unbuffered, fake_anthropic):
+        """Test async provider errors are tracked without the blocking sync send"""
+        tracker = tracker_unbuffered
+
+        async def failing_create(self, **kwargs):
+            raise RuntimeError("overloaded")
+
+        fake_anthropic.AsyncMessages.create = failing_create
+        patch_anthropic(tracker)
+        try:
+            with patch.object(tracker, 'aingest', new_callable=AsyncMock) as mock_aingest:
+                with pytest.raises(RuntimeError):
+                    await fake_anthropic.AsyncMessages().create(model="claude-3-opus-20240229")
+                await tracker.aflush()
+
+            tracker.client.events.ingest.assert_not_called()
+            assert_event(mock_aingest, error_message="overloaded")
+        finally:
+            unpatch_anthropic()
+
+    def test_patch_anthropic_without_package(self, tracker):
+        """Test that patching raises ImportError if anthropic not installed"""
+        # Fail only the provider import, not every import in the block
+        with patch.object(anthropic_patch, '_import_messages', side_effect=ImportError("No module named 'anthropic'")):
+            with pytest.raises(ImportError, match="Anthropic package not found"):
+                patch_anthropic(tracker)
+
+    def test_unpatch_is_idempotent(self):
+        """Test unpatching repeatedly (and when nothing is patched) never raises"""
+        for _ in range(3):
+            unpatch_anthropic()
@@ -0,0 +1,26 @@
+"""Unit tests for the llmscope.integrations package surface"""
+import subprocess
+import sys
+import pytest
+from llmscope import integrations
+
+
+class TestIntegrationModule:
+    """Test suite for integrations module"""
+
+    @pytest.mark.parametrize("name", [
+        "patch_openai", "unpatch_openai", "patch_anthropic", "unpatch_anthropic"
+    ])
+    def test_public_api_is_callable(self, name):
+        """Test each provider's patch/unpatch function is exported and callable"""
+        assert name in integrations.__all__
+        assert callable(getattr(integrations, name))
+
+    def test_import_does_not_load_provider_sdks(self):
+        """Test importing the integrations leaves openai/anthropic unimported"""
+        code = (
+            "import sys, llmscope.integrations; "
+            "print('openai' in sys.modules or 'anthropic' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.stdout.strip() == "False"
@@ -0,0 +1,24 @@
+"""Unit tests for the OpenAI integration (monkey-patching)"""
+import pytest
+from unittest.mock import patch
+from llmscope.integrations import patch_openai, unpatch_openai, openai_patch
+
+# Patching mutates process-wide provider classes: keep this module on one
+# xdist worker under --dist=loadgroup too (loadfile already does)
+pytestmark = pytest.mark.xdist_group("openai_patch")
+
+
+class TestOpenAIIntegration:
+    """Test suite for OpenAI integration"""
+
+    def test_patch_openai_without_package(self, tracker):
+        """Test that patching raises ImportError if openai not installed"""
+        # Fail only the provider import, not every import in the block
+        with patch.object(openai_patch, '_import_completions', side_effect=ImportError("No module named 'openai'")):
+            with pytest.raises(ImportError, match="OpenAI package not found"):
+                patch_openai(tracker)
+
+    def test_unpatch_is_idempotent(self):
+        """Test unpatching repeatedly (and when nothing is patched) never raises"""
+        for _ in range(3):
+            unpatch_openai()
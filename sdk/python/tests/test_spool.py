@@ -0,0 +1,132 @@
+"""Unit tests for the on-disk event spool"""
+import pytest
+from unittest.mock import Mock, patch
+from llmscope.models import EventRequest
+from llmscope.spool import EventSpool
+
+
+class TestEventSpool:
+    """Test suite for EventSpool"""
+
+    @pytest.fixture
+    def spool(self, tmp_path):
+        """Create spool in a temporary directory"""
+        return EventSpool(tmp_path / "spool")
+
+    def test_write_creates_segment(self, spool):
+        """Test each write produces one segment file"""
+        spool.write([{"model": "gpt-4"}, EventRequest(
+            model="claude-3", provider="anthropic", tokens_prompt=1,
+            tokens_completion=1, latency_ms=1
+        )])
+
+        assert len(spool.pending()) == 1
+        assert not list(spool.directory.glob("*.tmp"))
+
+    def test_drain_replays_in_order(self, spool):
+        """Test drain sends segments oldest-first and removes them"""
+        spool.write([{"seq": 1}, {"seq": 2}])
+        spool.write([{"seq": 3}])
+        send = Mock()
+
+        assert spool.drain(send) == 3
+        assert [call.args[0] for call in send.call_args_list] == [
+            [{"seq": 1}, {"seq": 2}],
+            [{"seq": 3}]
+        ]
+        assert spool.pending() == []
+
+    def test_drain_respects_max_batch(self, spool):
+        """Test large segments are replayed in chunks"""
+        spool.write([{"seq": i} for i in range(5)])
+        send = Mock()
+
+        spool.drain(send, max_batch=2)
+
+        assert [len(call.args[0]) for call in send.call_args_list] == [2, 2, 1]
+
+    def test_drain_keeps_unsent_events(self, spool):
+        """Test a transient failure leaves unsent events spooled"""
+        spool.write([{"seq": i} for i in range(3)])
+        send = Mock(side_effect=[None, ConnectionError("down")])
+
+        assert spool.drain(send, max_batch=2) == 2
+        assert len(spool.pending()) == 1
+
+        send = Mock()
+        assert spool.drain(send) == 1
+        send.assert_called_once_with([{"seq": 2}])
+
+    def test_drain_discards_rejected_segment(self, spool):
+        """Test a non-retryable failure drops the segment"""
+        spool.write([{"bad": True}])
+        spool.write([{"seq": 1}])
+        send = Mock(side_effect=[ValueError("422"), None])
+
+        assert spool.drain(send, should_retry=lambda e: False) == 1
+        assert spool.pending() == []
+
+    def test_claims_of_dead_drainers_are_recovered(self, spool):
+        """Test a segment claimed by a process that died mid-drain is replayed"""
+        segment = spool.write([{"seq": 1}])
+        segment.rename(segment.with_suffix(".999999999.claim"))
+        assert spool.pending() == []
+
+        with patch("llmscope.spool._pid_alive", return_value=False):
+            reopened = EventSpool(spool.directory)
+
+        assert reopened.pending() == [segment]
+        send = Mock()
+        assert reopened.drain(send) == 1
+
+    def test_claims_of_live_drainers_are_left_alone(self, spool):
+        """Test reopening the spool doesn't steal a segment being replayed"""
+        segment = spool.write([{"seq": 1}])
+        claimed = segment.with_suffix(".999999999.claim")
+        segment.rename(claimed)
+
+        with patch("llmscope.spool._pid_alive", return_value=True):
+            reopened = EventSpool(spool.directory)
+
+        assert reopened.pending() == []
+        assert claimed.exists()
+
+    @pytest.mark.parametrize("alive", [False, True])
+    def test_temp_files_of_dead_writers_are_removed(self, spool, alive):
+        """Test a .tmp left by a writer that died mid-write is cleaned up"""
+        tmp = spool.directory / "00000000000000000001-999999999-1.999999999.tmp"
+        tmp.write_text('{"seq": 1')
+
+        with patch("llmscope.spool._pid_alive", return_value=alive):
+            EventSpool(spool.directory)
+
+        assert tmp.exists() is alive
+
+    def test_corrupt_segment_is_quarantined(self, spool):
+        """Test an undecodable segment is set aside and later ones still replay"""
+        corrupt = spool.write([{"seq": 1}])
+        corrupt.write_bytes(b'{"seq": \xff\n')
+        spool.write([{"seq": 2}])
+        send = Mock()
+
+        assert spool.drain(send) == 1
+
+        send.assert_called_once_with([{"seq": 2}])
+        assert spool.pending() == []
+        assert list(spool.directory.glob("*.claim")) == []
+        assert corrupt.with_suffix(".corrupt").exists()
+
+    def test_short_writes_are_completed(self, spool):
+        """Test segments are fully written even when os.write writes partially"""
+        import os
+        real_write = os.write
+
+        def short_write(fd, data):
+            return real_write(fd, bytes(data[:3]))
+
+        with patch("llmscope.spool.os.write", side_effect=short_write):
+            spool.write([{"seq": i} for i in range(5)])
+
+        send = Mock()
+        spool.drain(send)
+        send.assert_called_once_with([{"seq": i} for i in range(5)])
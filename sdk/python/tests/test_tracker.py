@@ -1,120 +1,208 @@
 """Unit tests for LLMScope auto-tracking"""
 import pytest
 import asyncio
-from unittest.mock import Mock, patch, MagicMock
+import logging
+from unittest.mock import patch, AsyncMock, MagicMock
 from llmscope.tracker import LLMScope, TrackingSpan
 from llmscope.llmscope_client import LLMScopeClient
+from ._helpers import ABSENT, assert_event
+
+
+def _raise_in_trace(tracker, error):
+    @tracker.default_trace
+    def failing_function():
+        raise error
+
+    failing_function()
+
+
+def _raise_in_span(tracker, error):
+    with tracker.track("test_span"):
+        raise error
 
 
 class TestLLMScope:
     """Test suite for LLMScope tracker"""
 
-    @pytest.fixture
-    def tracker(self):
-        """Create LLMScope tracker instance"""
-        return LLMScope(
-            api_key="llmscope-local-key",
-            base_url="http://localhost:8000",
-            project="test-project",
-            debug=False
-        )
-
     def test_initialization(self, tracker):
         """Test LLMScope initialization"""
         assert tracker.project == "test-project"
         assert tracker.debug is False
         assert isinstance(tracker.client, LLMScopeClient)
 
-    def test_trace_decorator_sync(self, tracker):
+    def test_trace_decorator_sync(self, tracker, openai_response, mock_ingest):
         """Test @trace decorator with sync function"""
-        mock_response = Mock()
-        mock_response.model = "gpt-4"
-        mock_response.usage = Mock(prompt_tokens=100, completion_tokens=50, total_tokens=150)
-        mock_response.choices = [Mock(message=Mock(content="Test response"), finish_reason="stop")]
 
-        with patch.object(tracker.client.events, 'ingest') as mock_ingest:
-            @tracker.trace()
-            def test_function():
-                return mock_response
+        @tracker.trace()
+        def test_function():
+            return openai_response
 
-            result = test_function()
+        result = test_function()
 
-            assert result == mock_response
-            mock_ingest.assert_called_once()
+        assert result == openai_response
+        mock_ingest.assert_called_once()
 
-            # Verify event data
-            call_args = mock_ingest.call_args[0][0]
-            assert call_args['model'] == "gpt-4"
-            assert call_args['provider'] == "openai"
-            assert call_args['tokens_prompt'] == 100
-            assert call_args['tokens_completion'] == 50
-            assert call_args['project_id'] == "test-project"
-            assert call_args['metadata']['function'] == "test_function"
+        assert_event(
+            mock_ingest, model="gpt-4", provider="openai", tokens_prompt=100,
+            tokens_completion=50, project_id="test-project",
+            metadata={"function": "test_function"}
+        )
 
-    def test_trace_decorator_async(self, tracker):
+    @pytest.mark.asyncio
+    async def test_trace_decorator_async(self, tracker, openai_response, mock_ingest):
         """Test @trace decorator with async function"""
-        mock_response = Mock()
-        mock_response.model = "gpt-4"
-        mock_response.usage = Mock(prompt_tokens=100, completion_tokens=50, total_tokens=150)
-        mock_response.choices = [Mock(message=Mock(content="Test"), finish_reason="stop")]
-
-        with patch.object(tracker.client.events, 'ingest') as mock_ingest:
-            @tracker.trace()
-            async def async_test_function():
-                return mock_response
 
-            result = asyncio.run(async_test_function())
+        @tracker.trace()
+        async def async_test_function():
+            return openai_response
 
-            assert result == mock_response
-            mock_ingest.assert_called_once()
+        result = await async_test_function()
 
-    def test_trace_decorator_custom_name(self, tracker):
-        """Test @trace decorator with custom name"""
-        mock_response = Mock()
-        mock_response.model = "gpt-3.5-turbo"
-        mock_response.usage = Mock(prompt_tokens=50, completion_tokens=25, total_tokens=75)
-        mock_response.choices = [Mock(message=Mock(content="Test"), finish_reason="stop")]
+        assert result == openai_response
+        mock_ingest.assert_called_once()
 
-        with patch.object(tracker.client.events, 'ingest') as mock_ingest:
-            @tracker.trace(name="custom_operation")
-            def test_function():
-                return mock_response
+    def test_patching_ingest_after_decorating(self, tracker, openai_response):
+        """Test the ingest path is resolved per call, not when decorating"""
+        @tracker.default_trace
+        def test_function():
+            return openai_response
 
+        with patch.object(tracker.client.events, 'ingest') as patched:
             test_function()
 
-            call_args = mock_ingest.call_args[0][0]
-            assert call_args['metadata']['function'] == "custom_operation"
+        patched.assert_called_once()
+
+    def test_default_trace_is_cached(self, tracker, openai_response, mock_ingest):
+        """Test default_trace is built once and names events after the function"""
+        assert tracker.default_trace is tracker.default_trace
+
+        @tracker.default_trace
+        def test_function():
+            return openai_response
+
+        test_function()
+
+        assert_event(mock_ingest, metadata={"function": "test_function"})
+
+    @pytest.mark.asyncio
+    async def test_aingest_unbuffered_uses_async_client(self, tracker_unbuffered):
+        """Test unbuffered async tracking goes through the async client, not the sync session"""
+        tracker = tracker_unbuffered
+
+        with patch.object(tracker.client.events, 'ingest') as mock_sync, \
+                patch("llmscope.tracker.AsyncEventsClient") as mock_cls:
+            mock_cls.return_value.ingest = AsyncMock()
+            await tracker.aingest({"model": "gpt-4"})
+            await tracker.aingest({"model": "gpt-4"})
+
+        mock_sync.assert_not_called()
+        mock_cls.assert_called_once_with("test-key", "http://localhost:8000")
+        assert mock_cls.return_value.ingest.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_trace_does_not_await_ingest(self, tracker_unbuffered, openai_response):
+        """Test unbuffered async tracking sends in a background task"""
+        tracker = tracker_unbuffered
+        sent = []
+
+        async def slow_ingest(event):
+            await asyncio.sleep(0.05)
+            sent.append(event)
 
-    def test_trace_decorator_error_tracking(self, tracker):
-        """Test that errors are tracked"""
-        with patch.object(tracker.client.events, 'ingest') as mock_ingest:
-            @tracker.trace()
-            def failing_function():
-                raise ValueError("Test error")
+        @tracker.default_trace
+        async def async_test_function():
+            return openai_response
 
+        with patch.object(tracker, 'aingest', side_effect=slow_ingest):
+            await async_test_function()
+            assert sent == [] and len(tracker._pending) == 1
+            await tracker.aflush()
+        assert len(sent) == 1 and not tracker._pending
+
+    @pytest.mark.asyncio
+    async def test_async_trace_error_does_not_block(self, tracker_unbuffered):
+        """Test async errors are sent in the background, not via the sync session"""
+        tracker = tracker_unbuffered
+
+        @tracker.default_trace
+        async def failing_function():
+            raise ValueError("boom")
+
+        with patch.object(tracker.client.events, 'ingest') as mock_sync, \
+                patch.object(tracker, 'aingest', new_callable=AsyncMock) as mock_aingest:
             with pytest.raises(ValueError):
-                failing_function()
+                await failing_function()
+            await tracker.aflush()
+
+        mock_sync.assert_not_called()
+        assert_event(mock_aingest, status="error", error_message="boom")
+
+    @pytest.mark.asyncio
+    async def test_async_client_is_closed(self, tracker_unbuffered):
+        """Test the async client is closed on loop change and by aflush()"""
+        tracker = tracker_unbuffered
+
+        with patch("llmscope.tracker.AsyncEventsClient") as mock_cls:
+            stale = MagicMock(aclose=AsyncMock())
+            tracker._async_events, tracker._async_loop = stale, object()
+            mock_cls.return_value.ingest = AsyncMock()
+            mock_cls.return_value.aclose = AsyncMock()
 
-            # Should track the error
-            mock_ingest.assert_called_once()
-            call_args = mock_ingest.call_args[0][0]
-            assert call_args['status'] == "error"
-            assert call_args['has_error'] is True
-            assert "Test error" in call_args['error_message']
+            await tracker.aingest({"model": "gpt-4"})
+            stale.aclose.assert_awaited_once()
 
-    def test_trace_decorator_no_tracking_on_unknown_response(self, tracker):
+            await tracker.aflush()
+            mock_cls.return_value.aclose.assert_awaited_once()
+        assert tracker._async_events is None
+
+    def test_trace_decorator_overhead(self, tracker, openai_response, benchmark):
+        """Benchmark a traced call end to end, up to ingest"""
+        # A plain no-op: a MagicMock would record every call and skew the timing
+        tracker.client.events.ingest = lambda event: None
+
+        @tracker.default_trace
+        def test_function():
+            return openai_response
+
+        assert benchmark(test_function) is openai_response
+
+    def test_trace_decorator_custom_name(self, tracker, openai_response, mock_ingest):
+        """Test @trace decorator with custom name"""
+
+        @tracker.trace(name="custom_operation")
+        def test_function():
+            return openai_response
+
+        test_function()
+
+        assert_event(mock_ingest, metadata={"function": "custom_operation"})
+
+    @pytest.mark.parametrize("raise_in", [_raise_in_trace, _raise_in_span],
+                             ids=["decorator", "context_manager"])
+    @pytest.mark.parametrize("error_type", [ValueError, RuntimeError])
+    def test_error_tracking(self, tracker, mock_ingest, raise_in, error_type):
+        """Test errors are tracked once and re-raised unchanged"""
+        with pytest.raises(error_type, match="Test error"):
+            raise_in(tracker, error_type("Test error"))
+
+        mock_ingest.assert_called_once()
+        assert_event(
+            mock_ingest, status="error", has_error=True,
+            error_message="Test error", project_id="test-project"
+        )
+
+    def test_trace_decorator_no_tracking_on_unknown_response(self, tracker, mock_ingest):
         """Test that non-LLM responses don't cause errors"""
-        with patch.object(tracker.client.events, 'ingest') as mock_ingest:
-            @tracker.trace()
-            def test_function():
-                return {"some": "dict"}  # Not an LLM response
+        @tracker.default_trace
+        def test_function():
+            return {"some": "dict"}  # Not an LLM response
 
-            result = test_function()
+        result = test_function()
 
-            # Should not track if extraction fails
-            assert result == {"some": "dict"}
-            # ingest should not be called for non-LLM responses
-            assert mock_ingest.call_count == 0
+        # Should not track if extraction fails
+        assert result == {"some": "dict"}
+        # ingest should not be called for non-LLM responses
+        assert mock_ingest.call_count == 0
 
     def test_context_manager_basic(self, tracker):
         """Test track() context manager"""
@@ -123,150 +211,240 @@ class TestLLMScope:
         assert span.tracker == tracker
         assert span.name == "test_span"
 
-    def test_context_manager_with_metadata(self, tracker):
+    def test_context_manager_with_metadata(self, tracker, openai_response, mock_ingest):
         """Test context manager with metadata"""
-        mock_response = Mock()
-        mock_response.model = "gpt-4"
-        mock_response.usage = Mock(prompt_tokens=100, completion_tokens=50, total_tokens=150)
-        mock_response.choices = [Mock(message=Mock(content="Test"), finish_reason="stop")]
-
-        with patch.object(tracker.client.events, 'ingest') as mock_ingest:
-            with tracker.track("test_operation") as span:
-                span.set_metadata("user_id", "user123")
-                span.set_metadata("session_id", "sess456")
-                span.track_response(mock_response)
-
-            mock_ingest.assert_called_once()
-            call_args = mock_ingest.call_args[0][0]
-            assert call_args['metadata']['user_id'] == "user123"
-            assert call_args['metadata']['session_id'] == "sess456"
-
-    def test_context_manager_error_tracking(self, tracker):
-        """Test context manager tracks errors"""
-        with patch.object(tracker.client.events, 'ingest') as mock_ingest:
-            with pytest.raises(ValueError):
-                with tracker.track("test_span") as span:
-                    raise ValueError("Context error")
 
-            mock_ingest.assert_called_once()
-            call_args = mock_ingest.call_args[0][0]
-            assert call_args['status'] == "error"
-            assert call_args['has_error'] is True
+        with tracker.track("test_operation") as span:
+            span.set_metadata("user_id", "user123")
+            span.set_metadata("session_id", "sess456")
+            span.track_response(openai_response)
+
+        mock_ingest.assert_called_once()
+        assert_event(mock_ingest, metadata={"user_id": "user123", "session_id": "sess456"})
 
-    def test_tracking_span_anthropic_response(self, tracker):
+    def test_tracking_span_anthropic_response(self, tracker, anthropic_response, mock_ingest):
         """Test TrackingSpan with Anthropic response"""
-        mock_response = Mock()
-        mock_response.model = "claude-3-opus-20240229"
-        mock_response.usage = Mock(input_tokens=100, output_tokens=50)
-        mock_response.content = [Mock(text="Test response")]
-        mock_response.stop_reason = "end_turn"
-        mock_response.role = "assistant"
-
-        with patch.object(tracker.client.events, 'ingest') as mock_ingest:
-            with tracker.track("anthropic_call") as span:
-                span.track_response(mock_response)
-
-            mock_ingest.assert_called_once()
-            call_args = mock_ingest.call_args[0][0]
-            assert call_args['model'] == "claude-3-opus-20240229"
-            assert call_args['provider'] == "anthropic"
-            assert call_args['tokens_prompt'] == 100
-            assert call_args['tokens_completion'] == 50
-
-    def test_debug_mode(self):
-        """Test debug mode prints errors"""
-        tracker = LLMScope(api_key="test-key", debug=True)
-
-        with patch.object(tracker.client.events, 'ingest', side_effect=Exception("Tracking failed")):
-            with patch('builtins.print') as mock_print:
-                @tracker.trace()
-                def test_function():
-                    mock_response = Mock()
-                    mock_response.model = "gpt-4"
-                    mock_response.usage = Mock(prompt_tokens=10, completion_tokens=5, total_tokens=15)
-                    mock_response.choices = [Mock(message=Mock(content="Test"), finish_reason="stop")]
-                    return mock_response
-
-                test_function()
-
-                # Should print error in debug mode
-                mock_print.assert_called()
-
-    def test_no_project_id(self):
-        """Test tracker without project ID"""
-        tracker = LLMScope(api_key="test-key", project=None)
 
-        mock_response = Mock()
-        mock_response.model = "gpt-4"
-        mock_response.usage = Mock(prompt_tokens=100, completion_tokens=50, total_tokens=150)
-        mock_response.choices = [Mock(message=Mock(content="Test"), finish_reason="stop")]
+        with tracker.track("anthropic_call") as span:
+            span.track_response(anthropic_response)
 
-        with patch.object(tracker.client.events, 'ingest') as mock_ingest:
-            @tracker.trace()
-            def test_function():
-                return mock_response
+        mock_ingest.assert_called_once()
+        assert_event(
+            mock_ingest, model="claude-3-opus-20240229", provider="anthropic",
+            tokens_prompt=100, tokens_completion=50
+        )
 
+    def test_debug_mode(self, caplog, openai_response, tracker_debug, llmscope_logger):
+        """Test tracking failures are logged to the llmscope logger in debug mode"""
+        tracker = tracker_debug
+        tracker.client.events.ingest.side_effect = Exception("Tracking failed")
+
+        @tracker.default_trace
+        def test_function():
+            return openai_response
+
+        with caplog.at_level(logging.DEBUG, logger="llmscope"):
             test_function()
 
-            call_args = mock_ingest.call_args[0][0]
-            assert 'project_id' not in call_args
+        assert "tracking error: Tracking failed" in caplog.text
+        assert llmscope_logger.level == logging.DEBUG
 
+    def test_no_project_id(self, tracker_no_project, openai_response, mock_ingest):
+        """Test tracker without project ID"""
+        @tracker_no_project.default_trace
+        def test_function():
+            return openai_response
 
-class TestTrackingSpan:
-    """Test suite for TrackingSpan"""
+        test_function()
 
-    @pytest.fixture
-    def tracker(self):
-        """Create tracker for span tests"""
-        return LLMScope(api_key="test-key", project="test")
+        assert_event(mock_ingest, project_id=ABSENT)
+
+
+class TestPayloadTracking:
+    """Test suite for opt-in completion text tracking"""
+
+    @pytest.mark.parametrize("track_payloads", [False, True])
+    def test_response_text_is_opt_in(self, tracker, mock_ingest, openai_response, track_payloads):
+        """Test events carry only metrics unless track_payloads is set"""
+        tracker.track_payloads = track_payloads
+
+        @tracker.default_trace
+        def test_function():
+            return openai_response
+
+        test_function()
+
+        assert_event(
+            mock_ingest, tokens_total=150, metadata={"finish_reason": "stop"},
+            response="Test response" if track_payloads else ABSENT
+        )
+
+    def test_event_request_combines_metrics_and_payload(self):
+        """Test EventRequest is the union of EventMetrics and EventPayload"""
+        from llmscope.models import EventMetrics, EventPayload, EventRequest
+
+        assert set(EventRequest.model_fields) == (
+            set(EventMetrics.model_fields) | set(EventPayload.model_fields)
+        )
+        assert not set(EventMetrics.model_fields) & {"messages", "response"}
+
+
+class TestDuplicateSuppression:
+    """Test suite for response id de-duplication"""
 
-    def test_span_timing(self, tracker):
-        """Test span measures time correctly"""
-        import time
+    def test_same_response_id_tracked_once(self, tracker, mock_ingest, openai_response):
+        """Test a replayed response is only ingested the first time"""
+        openai_response.id = "chatcmpl-123"
 
-        with tracker.track("test") as span:
-            assert span.start_time is not None
-            time.sleep(0.1)
+        @tracker.default_trace
+        def test_function():
+            return openai_response
 
-        # Span should have measured time
+        test_function()
+        test_function()
 
-    def test_span_metadata_accumulation(self, tracker):
+        mock_ingest.assert_called_once()
+
+    def test_seen_ids_evicts_oldest(self):
+        """Test the id cache is bounded and least-recently-seen ids are evicted"""
+        from llmscope.tracker import _SeenIds
+
+        seen = _SeenIds(maxsize=2)
+        assert seen.add("a") and seen.add("b")
+        assert not seen.add("a")      # "a" is now most recent
+        assert seen.add("c")          # Evicts "b"
+        assert seen.add("b")
+        assert not seen.add("c")
+
+
+class TestTrackingSpan:
+    """Test suite for TrackingSpan"""
+
+    def test_span_timing(self, tracker, openai_response, mock_ingest):
+        """Test span latency is measured from enter to track_response"""
+        with patch("llmscope.tracker.time") as mock_time:
+            # enter, track_response, exit
+            mock_time.perf_counter_ns.side_effect = [1_000_000_000, 1_500_000_000, 1_600_000_000]
+            with tracker.track("test") as span:
+                assert span.start_ns == 1_000_000_000
+                span.track_response(openai_response)
+
+        assert_event(mock_ingest, latency_ms=500)
+
+    def test_span_overhead(self, tracker, benchmark):
+        """Benchmark entering and exiting a span (run with -n 0 --benchmark-only)"""
+        def enter_exit():
+            with tracker.track("bench"):
+                pass
+
+        benchmark(enter_exit)
+
+    def test_span_has_no_instance_dict(self, tracker):
+        """Test spans use slots instead of a per-instance __dict__"""
+        span = tracker.track("slots")
+        assert not hasattr(span, '__dict__')
+        with pytest.raises(AttributeError):
+            span.unexpected = True
+
+    def test_span_metadata_accumulation(self, tracker, openai_response, mock_ingest):
         """Test multiple metadata calls accumulate"""
-        mock_response = Mock()
-        mock_response.model = "gpt-4"
-        mock_response.usage = Mock(prompt_tokens=10, completion_tokens=5, total_tokens=15)
-        mock_response.choices = [Mock(message=Mock(content="Test"), finish_reason="stop")]
 
-        with patch.object(tracker.client.events, 'ingest') as mock_ingest:
-            with tracker.track() as span:
-                span.set_metadata("key1", "value1")
-                span.set_metadata("key2", "value2")
-                span.set_metadata("key3", "value3")
-                span.track_response(mock_response)
+        with tracker.track() as span:
+            span.set_metadata("key1", "value1")
+            span.set_metadata("key2", "value2")
+            span.set_metadata("key3", "value3")
+            span.track_response(openai_response)
 
-            call_args = mock_ingest.call_args[0][0]
-            assert call_args['metadata']['key1'] == "value1"
-            assert call_args['metadata']['key2'] == "value2"
-            assert call_args['metadata']['key3'] == "value3"
+        assert_event(mock_ingest, metadata={"key1": "value1", "key2": "value2", "key3": "value3"})
 
-    def test_span_without_tracking_response(self, tracker):
+    def test_span_without_tracking_response(self, tracker, mock_ingest):
         """Test span that doesn't explicitly track response"""
-        with patch.object(tracker.client.events, 'ingest') as mock_ingest:
-            with tracker.track() as span:
-                span.set_metadata("test", "value")
-                # Don't call track_response
+        with tracker.track() as span:
+            span.set_metadata("test", "value")
+            # Don't call track_response
 
-            # Should not ingest if no response tracked and no error
-            assert mock_ingest.call_count == 0
+        # Should not ingest if no response tracked and no error
+        assert mock_ingest.call_count == 0
 
-    def test_span_track_response_failure(self, tracker):
+    def test_span_track_response_failure(self, tracker, openai_response):
         """Test span handles tracking failure gracefully"""
-        mock_response = Mock()
-        mock_response.model = "gpt-4"
-        mock_response.usage = Mock(prompt_tokens=10, completion_tokens=5, total_tokens=15)
-        mock_response.choices = [Mock(message=Mock(content="Test"), finish_reason="stop")]
 
         with patch.object(tracker.client.events, 'ingest', side_effect=Exception("API Error")):
             # Should not raise exception
             with tracker.track() as span:
-                span.track_response(mock_response)
+                span.track_response(openai_response)
+
+
+@pytest.fixture(scope="module")
+def _buffered_tracker():
+    """One buffered tracker (and flush thread) for the module, closed at the end"""
+    tracker = LLMScope(
+        api_key="test-key",
+        project="test",
+        buffered=True,
+        batch_size=10,
+        flush_interval_s=0.01
+    )
+    yield tracker
+    tracker.client.close()
+
+
+class TestBufferedTracking:
+    """Test suite for background batching"""
+
+    @pytest.fixture
+    def tracker(self, _buffered_tracker):
+        """Shared buffered tracker; tests only patch its sends"""
+        return _buffered_tracker
+
+    def test_events_are_batched(self, tracker, openai_response):
+        """Test tracked calls are queued and sent as one batch"""
+
+        with patch.object(tracker.client.events, 'ingest_batch') as mock_batch:
+            @tracker.default_trace
+            def test_function():
+                return openai_response
+
+            test_function()
+            test_function()
+            tracker.flush()
+
+            sent = [event for call in mock_batch.call_args_list for event in call[0][0]]
+            assert len(sent) == 2
+            assert sent[0]['model'] == "gpt-4"
+
+    def test_flush_survives_ingest_failure(self, tracker):
+        """Test a failed batch doesn't block flush()"""
+        with patch.object(tracker.client.events, 'ingest_batch', side_effect=Exception("API Error")):
+            tracker._track_error(ValueError("Test"), 10, "test_func")
+            tracker.flush()
+
+    def test_flush_noop_when_unbuffered(self, tracker_unbuffered):
+        """Test flush() is safe on an unbuffered tracker"""
+        # The EventsClient spec has no flush(), so a call would raise
+        tracker_unbuffered.flush()
+
+    def test_buffered_by_default(self):
+        """Test trackers batch in the background unless told otherwise"""
+        from llmscope.events import BufferedEventsClient, _open_buffers
+
+        # Exercises the constructor defaults, so it can't use a template copy
+        tracker = LLMScope(api_key="test-key")
+        assert isinstance(tracker.client.events, BufferedEventsClient)
+        assert tracker.client.events in _open_buffers
+
+        tracker.client.close()
+        assert tracker.client.events not in _open_buffers
+
+    def test_get_tracker_stats(self, tracker, tracker_unbuffered):
+        """Test buffer statistics are exposed on the tracker"""
+        with patch.object(tracker.client.events, 'ingest_batch'):
+            tracker._track_error(ValueError("Test"), 10, "test_func")
+            tracker.flush()
+
+        stats = tracker.get_tracker_stats()
+        assert stats["buffered"] == 0
+        assert stats["dropped"] == 0
+        assert stats["last_flush_ms"] >= 0
+
+        assert tracker_unbuffered.get_tracker_stats()["buffered"] == 0